@@ -0,0 +1,42 @@
+"""HTTP caching helpers for idempotent GET routes."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
+
+def cached_response(
+    request: Request,
+    content: Any,
+    max_age: int = 60,
+    s_maxage: int = 300,
+) -> Response:
+    """Build a JSON response with Cache-Control and an ETag.
+
+    The ETag is a hash of the rendered body, so it changes whenever the
+    results do. A matching If-None-Match gets an empty 304 instead.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        content: JSON-serializable response content
+        max_age: Browser cache lifetime in seconds
+        s_maxage: Shared (CDN) cache lifetime in seconds
+
+    Returns:
+        A 200 JSON response, or a 304 if the client copy is current
+    """
+    body = orjson.dumps(jsonable_encoder(content))
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, s-maxage={s_maxage}",
+        "ETag": etag,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
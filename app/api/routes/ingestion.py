@@ -1,86 +1,143 @@
 """Ingestion API routes."""
 
-from typing import Any
-
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import Annotated, Any
 
+import orjson
 import structlog
-
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from app.api.caching import cached_response
+from app.core.config import settings
+from app.db.connection import db
+from app.db.mongodb import mongodb
+from app.db.repositories.job import JobRepository
+from app.db.repositories.transcript import TranscriptRepository
 from app.models.channel import ChannelSyncRequest
 from app.models.ingestion import IngestionStats, RetryRequest
 from app.services.ingestion.orchestrator import IngestionOrchestrator
-from app.services.transcription import whisper_service
+from app.services.ingestion.worker import RETRY_FAILED, SYNC_CHANNEL, IngestionWorker
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/api", tags=["ingestion"])
 
 
+@lru_cache(maxsize=1)
 def get_orchestrator() -> IngestionOrchestrator:
-    """Get an orchestrator instance."""
+    """Get the shared orchestrator instance.
+
+    Built on first use (after the database is connected) and reused across
+    requests.
+    """
     return IngestionOrchestrator()
 
 
+def get_job_repo() -> JobRepository:
+    """Get the ingestion job queue repository."""
+    return JobRepository(db.connection, reader=db)
+
+
+OrchestratorDep = Annotated[IngestionOrchestrator, Depends(get_orchestrator)]
+JobRepoDep = Annotated[JobRepository, Depends(get_job_repo)]
+
+
+@lru_cache(maxsize=1)
+def get_worker() -> IngestionWorker:
+    """Get the in-process worker used when no external worker is deployed."""
+    return IngestionWorker()
+
+
+def _run_queued_job(background_tasks: BackgroundTasks) -> None:
+    """Drain the job queue in this process unless a worker handles the queue."""
+    if not settings.ingestion_external_worker:
+        background_tasks.add_task(get_worker().drain)
+
+
 @router.post("/channels/sync", status_code=status.HTTP_202_ACCEPTED)
 async def sync_channel(
     request: ChannelSyncRequest,
     background_tasks: BackgroundTasks,
+    job_repo: JobRepoDep,
 ) -> dict[str, Any]:
-    """Start syncing a YouTube channel.
+    """Queue a YouTube channel sync.
 
-    Fetches video metadata, downloads audio, and transcribes.
-    Runs in the background and returns immediately.
+    Fetches video metadata, downloads audio, and transcribes. Runs in the
+    background (or on scripts/ingestion_worker.py when
+    ingestion_external_worker is set) and returns immediately.
     """
-    orchestrator = get_orchestrator()
-
-    async def run_sync():
-        try:
-            await orchestrator.sync_channel(
-                channel_url=request.channel_url,
-                max_videos=request.max_videos,
-                download=request.download,
-                transcribe=request.transcribe,
-            )
-        except Exception as e:
-            logger.error("background_sync_failed", error=str(e))
-
-    background_tasks.add_task(run_sync)
+    job_id = await job_repo.enqueue(SYNC_CHANNEL, request.model_dump())
+    _run_queued_job(background_tasks)
 
     return {
-        "message": "Sync started",
+        "message": "Sync queued",
+        "job_id": job_id,
         "channel_url": request.channel_url,
         "max_videos": request.max_videos,
     }
 
 
 @router.post("/channels/sync/blocking")
-async def sync_channel_blocking(request: ChannelSyncRequest) -> dict[str, Any]:
+async def sync_channel_blocking(
+    request: ChannelSyncRequest,
+    orchestrator: OrchestratorDep,
+) -> dict[str, Any]:
     """Sync a YouTube channel and wait for completion.
 
     Use this for smaller syncs or when you need the result immediately.
     """
-    orchestrator = get_orchestrator()
-
     result = await orchestrator.sync_channel(
         channel_url=request.channel_url,
         max_videos=request.max_videos,
         download=request.download,
         transcribe=request.transcribe,
+        batched=request.batched,
     )
 
     return result
 
 
 @router.get("/ingestion/status", response_model=IngestionStats)
-async def get_ingestion_status() -> IngestionStats:
+async def get_ingestion_status(
+    orchestrator: OrchestratorDep,
+) -> IngestionStats:
     """Get overall ingestion statistics."""
-    orchestrator = get_orchestrator()
     return await orchestrator.get_stats()
 
 
+@router.get("/ingestion/jobs/{job_id}")
+async def get_job(
+    job_id: int,
+    job_repo: JobRepoDep,
+) -> dict[str, Any]:
+    """Get the status and result of a queued ingestion job."""
+    job = await job_repo.get(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}",
+        )
+
+    return job
+
+
 @router.get("/videos/{video_id}/status")
-async def get_video_status(video_id: str) -> dict[str, Any]:
+async def get_video_status(
+    video_id: str,
+    request: Request,
+    orchestrator: OrchestratorDep,
+) -> Response:
     """Get status for a specific video."""
-    orchestrator = get_orchestrator()
     result = await orchestrator.get_video_status(video_id)
 
     if not result:
@@ -89,60 +146,66 @@ async def get_video_status(video_id: str) -> dict[str, Any]:
             detail=f"Video not found: {video_id}",
         )
 
-    return result
+    return cached_response(request, result)
 
 
 @router.get("/videos/{video_id}/transcript")
-async def get_video_transcript(video_id: str) -> dict[str, Any]:
-    """Get the transcript for a video."""
-    transcript = whisper_service.get_transcript(video_id)
+async def get_video_transcript(video_id: str) -> StreamingResponse:
+    """Stream the transcript for a video as NDJSON.
 
-    if not transcript:
+    The first line holds the transcript metadata; each following line is
+    one timed segment.
+    """
+    metadata = None
+    if mongodb.is_connected:
+        repo = TranscriptRepository(mongodb.db)
+        metadata = await repo.get_metadata_by_video_id(video_id)
+
+    if not metadata:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Transcript not found: {video_id}",
         )
 
-    return transcript
+    async def iter_lines() -> AsyncIterator[bytes]:
+        yield orjson.dumps(metadata) + b"\n"
+        async for segment in repo.iter_segments(video_id):
+            yield orjson.dumps(segment) + b"\n"
+
+    return StreamingResponse(iter_lines(), media_type="application/x-ndjson")
 
 
 @router.post("/ingestion/retry")
 async def retry_failed(
     request: RetryRequest,
     background_tasks: BackgroundTasks,
+    job_repo: JobRepoDep,
 ) -> dict[str, Any]:
-    """Retry failed ingestions.
+    """Queue a retry of failed ingestions.
 
-    Runs in the background and returns immediately.
+    Runs like a queued sync and returns immediately.
     """
-    orchestrator = get_orchestrator()
-
-    async def run_retry():
-        try:
-            await orchestrator.retry_failed(
-                max_error_count=request.max_error_count,
-                limit=request.limit,
-            )
-        except Exception as e:
-            logger.error("background_retry_failed", error=str(e))
-
-    background_tasks.add_task(run_retry)
+    job_id = await job_repo.enqueue(RETRY_FAILED, request.model_dump())
+    _run_queued_job(background_tasks)
 
     return {
-        "message": "Retry started",
+        "message": "Retry queued",
+        "job_id": job_id,
         "max_error_count": request.max_error_count,
         "limit": request.limit,
     }
 
 
 @router.post("/ingestion/retry/blocking")
-async def retry_failed_blocking(request: RetryRequest) -> dict[str, Any]:
+async def retry_failed_blocking(
+    request: RetryRequest,
+    orchestrator: OrchestratorDep,
+) -> dict[str, Any]:
     """Retry failed ingestions and wait for completion."""
-    orchestrator = get_orchestrator()
-
     result = await orchestrator.retry_failed(
         max_error_count=request.max_error_count,
         limit=request.limit,
+        batched=request.batched,
     )
 
     return result
@@ -2,11 +2,12 @@
 
 from typing import Any, Literal
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 from pydantic import BaseModel, Field
 
 import structlog
 
+from app.api.caching import cached_response
 from app.services.search import sermon_search
 
 logger = structlog.get_logger(__name__)
@@ -69,6 +70,7 @@ async def search_sermons(request: SearchRequest) -> dict[str, Any]:
 
 @router.get("/search")
 async def search_sermons_get(
+    request: Request,
     feeling: str = Query(
         ...,
         description="How you're feeling",
@@ -76,13 +78,13 @@ async def search_sermons_get(
         examples=["I'm feeling anxious"],
     ),
     limit: int = Query(default=5, ge=1, le=20),
-) -> dict[str, Any]:
+) -> Response:
     """Search for sermons based on how you're feeling (GET version)."""
     result = await sermon_search.search(
         user_feeling=feeling,
         limit=limit,
     )
-    return result
+    return cached_response(request, result)
 
 
 @router.post("/search/mood")
@@ -102,6 +104,7 @@ async def search_by_mood(request: MoodSearchRequest) -> dict[str, Any]:
 
 @router.get("/search/mood/{mood}")
 async def search_by_mood_get(
+    request: Request,
     mood: Literal[
         "anxious",
         "sad",
@@ -115,10 +118,10 @@ async def search_by_mood_get(
         "overwhelmed",
     ],
     limit: int = Query(default=5, ge=1, le=20),
-) -> dict[str, Any]:
+) -> Response:
     """Search for sermons by mood category (GET version)."""
     result = await sermon_search.search_by_mood(
         mood=mood,
         limit=limit,
     )
-    return result
+    return cached_response(request, result)
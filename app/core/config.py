@@ -29,6 +29,12 @@ class Settings(BaseSettings):
     # MongoDB (transcripts)
     mongodb_uri: str | None = Field(default=None)
     mongodb_database: str = Field(default="sermon_recommender")
+    mongodb_max_pool_size: int = Field(default=50, ge=1)
+    mongodb_min_pool_size: int = Field(default=5, ge=0)
+    mongodb_compressors: str = Field(
+        default="zlib",
+        description="Comma-separated wire compressors (zstd/snappy need extra packages)",
+    )
 
     # Audio settings
     audio_output_dir: str = Field(default="data/audio")
@@ -38,10 +44,74 @@ class Settings(BaseSettings):
     # Transcription settings
     transcripts_output_dir: str = Field(default="data/transcripts")
     whisper_model: str = Field(default="large-v3")
+    whisper_device: Literal["auto", "cuda", "cpu"] = Field(default="auto")
+    whisper_compute_type: str | None = Field(
+        default=None,
+        description="CTranslate2 compute type (default: int8_float16 on GPU, int8 on CPU)",
+    )
+    whisper_cpu_threads: int = Field(
+        default=0,
+        ge=0,
+        description="CTranslate2 threads on CPU (0: one per core)",
+    )
+    whisper_flash_attention: bool = Field(
+        default=False,
+        description="Use CTranslate2's FlashAttention kernels on GPU (Ampere or newer)",
+    )
+    whisper_beam_size: int = Field(
+        default=1,
+        ge=1,
+        description="Decoding beam width (1: greedy, fastest)",
+    )
+    whisper_vad_min_silence_ms: int = Field(
+        default=500,
+        ge=0,
+        description="Silence this long splits speech regions for the VAD filter",
+    )
+    whisper_vad_speech_pad_ms: int = Field(
+        default=200,
+        ge=0,
+        description="Padding kept around each speech region by the VAD filter",
+    )
+    whisper_inference_batch_size: int = Field(
+        default=16,
+        ge=1,
+        description="Audio segments decoded together by the batched inference pipeline",
+    )
+    whisper_batch_size: int = Field(
+        default=16,
+        ge=1,
+        description="Max audio files grouped into one transcription batch",
+    )
+    whisper_batch_window_ms: float = Field(
+        default=50.0,
+        ge=0,
+        description="How long a transcription request waits for others to batch with",
+    )
 
     # Download settings
     max_concurrent_downloads: int = Field(default=2, ge=1, le=10)
-    download_delay_seconds: float = Field(default=3.0)
+    ingest_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Videos processed at once during a channel sync",
+    )
+    transcription_backlog: int = Field(
+        default=4,
+        ge=1,
+        description="Downloaded files allowed to wait for Whisper during a channel sync",
+    )
+    metadata_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Parallel yt-dlp lookups when fetching video details in bulk",
+    )
+    download_delay_seconds: float = Field(
+        default=3.0,
+        ge=0,
+        description="Minimum gap between YouTube requests, shared by all concurrent workers",
+    )
     download_timeout_seconds: int = Field(default=600)
 
     # Ingestion settings
@@ -51,21 +121,102 @@ class Settings(BaseSettings):
     # Retry settings
     max_retry_attempts: int = Field(default=3)
 
+    # Ingestion worker settings
+    ingestion_external_worker: bool = Field(
+        default=False,
+        description=(
+            "Leave jobs queued through the API to scripts/ingestion_worker.py "
+            "instead of running them in the API process"
+        ),
+    )
+    worker_poll_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="How often the ingestion worker checks for queued jobs",
+    )
+    job_claim_timeout_seconds: int = Field(
+        default=6 * 3600,
+        gt=0,
+        description=(
+            "Requeue a running job after this long, so jobs left running by a "
+            "crashed worker are picked up again"
+        ),
+    )
+
     # Qdrant settings
     qdrant_url: str = Field(default="http://localhost:6333")
     qdrant_api_key: str | None = Field(default=None)
     qdrant_collection_name: str = Field(default="sermon_chunks")
+    qdrant_prefer_grpc: bool = Field(default=True, description="Use gRPC instead of REST")
+    qdrant_grpc_port: int = Field(default=6334)
+    qdrant_hnsw_ef: int = Field(default=64, ge=1, description="HNSW ef used at query time")
+    qdrant_quantization: Literal["none", "scalar", "binary"] = Field(
+        default="scalar",
+        description="Vector quantization for a newly created sermon chunks collection",
+    )
+    qdrant_oversampling: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Candidates fetched per result from quantized vectors before rescoring",
+    )
 
     # Embedding settings (Cohere)
     cohere_api_key: str | None = Field(default=None)
     embedding_model: str = Field(default="embed-english-v3.0")
     embedding_dimensions: int = Field(default=1024)
+    pipeline_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Transcripts embedded concurrently by process_all_transcripts",
+    )
+    cohere_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Max Cohere embed requests in flight per embed() call",
+    )
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse document embeddings stored in MongoDB for unchanged chunks",
+    )
+    cohere_tokens_per_minute: int = Field(
+        default=90_000,
+        ge=0,
+        description="Estimated embed tokens sent to Cohere per minute (0: unlimited)",
+    )
+    cohere_max_retries: int = Field(
+        default=5,
+        ge=0,
+        description="Retries with exponential backoff when Cohere rate-limits a request",
+    )
     chunk_size: int = Field(default=500, description="Target words per chunk")
     chunk_overlap: int = Field(default=50, description="Overlap words between chunks")
+    query_batch_window_ms: float = Field(
+        default=15.0,
+        ge=0,
+        description="How long concurrent query embeddings wait to share one API call",
+    )
+    query_batch_max_size: int = Field(default=32, ge=1)
+    query_embedding_cache_size: int = Field(
+        default=2048,
+        ge=0,
+        description="Recent query embeddings kept in memory (0 disables)",
+    )
+    document_batch_window_ms: float = Field(
+        default=50.0,
+        ge=0,
+        description="How long transcript chunks wait to share an embed call with other transcripts",
+    )
 
     # LLM settings
     groq_api_key: str | None = Field(default=None)
     groq_model: str = Field(default="llama-3.1-8b-instant")
+    groq_max_connections: int = Field(default=32, ge=1)
+    groq_max_keepalive_connections: int = Field(default=16, ge=0)
+    query_expansion_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Expanded queries kept in memory, keyed by normalized feeling",
+    )
 
     # Search settings
     min_relevance_score: float = Field(
@@ -74,6 +225,20 @@ class Settings(BaseSettings):
         le=1.0,
         description="Minimum cosine similarity score to include in results"
     )
+    search_cache_ttl_seconds: int = Field(default=300, ge=0, description="How long cached search results stay valid")
+    search_cache_max_entries: int = Field(default=1024, ge=1)
+    semantic_cache_enabled: bool = Field(
+        default=True,
+        description=(
+            "Serve near-duplicate queries from a Qdrant cache of past query embeddings "
+            "(with query expansion, each cache miss costs one extra query embedding)"
+        ),
+    )
+    semantic_cache_threshold: float = Field(default=0.95, ge=0.0, le=1.0)
+    mood_queries_cache_path: str | None = Field(
+        default="data/mood_queries.json",
+        description="File keeping warmed mood queries across restarts (None disables)",
+    )
 
     @property
     def database_path(self) -> Path:
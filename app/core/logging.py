@@ -2,14 +2,26 @@
 
 import logging
 import sys
+import time
+from typing import Any
 
+import orjson
 import structlog
+from structlog.typing import Processor
 
 from app.core.config import settings
 
+# Set once setup_logging has configured logging for this process
+_configured = False
+
 
 def setup_logging() -> None:
-    """Configure structured logging for the application."""
+    """Configure structured logging for the application (once per process)."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     # Set up standard library logging
     logging.basicConfig(
         format="%(message)s",
@@ -18,20 +30,36 @@ def setup_logging() -> None:
     )
 
     # Configure structlog
-    structlog.configure(
-        processors=[
+    processors: list[Processor]
+    logger_factory: structlog.PrintLoggerFactory | structlog.BytesLoggerFactory
+    if settings.debug:
+        processors = [
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer(),
-        ],
+            structlog.dev.ConsoleRenderer(),
+        ]
+        logger_factory = structlog.PrintLoggerFactory()
+    else:
+        # orjson renders straight to bytes, written without a str round-trip
+        processors = [
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.format_exc_info,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ]
+        logger_factory = structlog.BytesLoggerFactory()
+
+    structlog.configure(
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.DEBUG if settings.debug else logging.INFO
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -39,3 +67,59 @@ def setup_logging() -> None:
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a logger instance with the given name."""
     return structlog.get_logger(name)
+
+
+class ProgressLog:
+    """Periodic progress log with rate and ETA for long batch loops.
+
+    Counting an item is an increment; a log line is written at most once per
+    interval (and for the last item) instead of a print per item.
+    """
+
+    def __init__(
+        self,
+        logger: Any,
+        event: str,
+        total: int,
+        interval_seconds: float = 60.0,
+    ):
+        """Initialize the progress log.
+
+        Args:
+            logger: structlog logger to emit with
+            event: Event name for progress lines
+            total: Expected number of items (0 if unknown)
+            interval_seconds: Minimum time between progress lines
+        """
+        self._logger = logger
+        self._event = event
+        self.total = total
+        self.done = 0
+        self._interval = interval_seconds
+        self._started = time.monotonic()
+        self._last_logged = self._started
+
+    def advance(self, n: int = 1, **fields: Any) -> None:
+        """Count finished items, logging progress if the interval has passed.
+
+        Args:
+            n: Number of items finished
+            **fields: Extra fields for the progress line (e.g. running totals)
+        """
+        self.done += n
+        now = time.monotonic()
+        finished = bool(self.total) and self.done >= self.total
+        if now - self._last_logged < self._interval and not finished:
+            return
+
+        self._last_logged = now
+        rate = self.done / max(now - self._started, 1e-9)
+        remaining = max(self.total - self.done, 0)
+        self._logger.info(
+            self._event,
+            done=self.done,
+            total=self.total,
+            rate_per_min=round(rate * 60, 1),
+            eta_seconds=round(remaining / rate) if self.total else None,
+            **fields,
+        )
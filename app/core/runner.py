@@ -0,0 +1,19 @@
+"""Entry point for running the CLI scripts' event loops."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on uvloop, or asyncio's loop without it.
+
+    uvloop ships with uvicorn[standard] on Linux and macOS; Windows falls back
+    to the standard loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -1,5 +1,6 @@
 """Async database connection manager supporting Turso (libSQL) and local SQLite."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator, Any
@@ -8,42 +9,76 @@ import libsql_experimental as libsql
 import structlog
 
 from app.core.config import settings
+from app.db.pool import ConnectionPool, PoolConfig
+from app.db.rows import row_to_dict, rows_to_dicts
 
 logger = structlog.get_logger(__name__)
 
+# Tuning for local SQLite files (Turso manages journaling server-side)
+LOCAL_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA busy_timeout = 10000",
+)
+
 
 class Database:
     """Async database connection manager supporting Turso and local SQLite."""
 
-    def __init__(self):
-        """Initialize database manager."""
+    def __init__(self, pool_config: PoolConfig | None = None):
+        """Initialize database manager.
+
+        Args:
+            pool_config: Sizing for the pool behind execute/fetch helpers
+        """
         self._connection: libsql.Connection | None = None
+        self._pool_config = pool_config
+        self._pool: ConnectionPool | None = None
 
-    async def connect(self) -> None:
-        """Initialize the database connection."""
+    def _open_connection(self) -> libsql.Connection:
+        """Open a new connection (blocking)."""
         if settings.use_turso:
             # Connect to Turso cloud database
-            self._connection = libsql.connect(
+            connection = libsql.connect(
                 database=settings.turso_database_url,
                 auth_token=settings.turso_auth_token,
             )
-            logger.info(
-                "database_connected",
-                type="turso",
-                url=settings.turso_database_url[:50] + "..." if len(settings.turso_database_url) > 50 else settings.turso_database_url,
-            )
         else:
             # Connect to local SQLite file
             db_path = settings.database_path
             db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = libsql.connect(database=str(db_path))
-            logger.info("database_connected", type="sqlite", path=str(db_path))
+            connection = libsql.connect(database=str(db_path))
+            for pragma in LOCAL_PRAGMAS:
+                connection.execute(pragma)
 
         # Enable foreign keys
-        self._connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    async def connect(self) -> None:
+        """Initialize the primary connection and the connection pool."""
+        self._connection = await asyncio.to_thread(self._open_connection)
+
+        self._pool = ConnectionPool(self._open_connection, self._pool_config)
+        await self._pool.open()
+
+        if settings.use_turso:
+            logger.info(
+                "database_connected",
+                type="turso",
+                url=settings.turso_database_url[:50] + "..." if len(settings.turso_database_url) > 50 else settings.turso_database_url,
+            )
+        else:
+            logger.info("database_connected", type="sqlite", path=str(settings.database_path))
 
     async def disconnect(self) -> None:
-        """Close the database connection."""
+        """Close the primary connection and the pool."""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -64,41 +99,59 @@ class Database:
 
     @property
     def connection(self) -> libsql.Connection:
-        """Get the current database connection."""
+        """Get the primary database connection."""
         if not self._connection:
             raise RuntimeError("Database not connected")
         return self._connection
 
-    async def execute(self, sql: str, parameters: tuple = ()) -> Any:
-        """Execute a SQL statement."""
-        if not self._connection:
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[libsql.Connection]:
+        """Borrow a pooled connection."""
+        if not self._pool:
             raise RuntimeError("Database not connected")
-        return self._connection.execute(sql, parameters)
+        async with self._pool.acquire() as connection:
+            yield connection
+
+    async def execute(self, sql: str, parameters: tuple = ()) -> Any:
+        """Execute a SQL statement on a pooled connection and commit."""
+        async with self.acquire() as conn:
+            def run() -> Any:
+                cursor = conn.execute(sql, parameters)
+                conn.commit()
+                return cursor
+
+            return await asyncio.to_thread(run)
 
     async def executemany(self, sql: str, parameters: list[tuple]) -> Any:
-        """Execute a SQL statement with multiple parameter sets."""
-        if not self._connection:
-            raise RuntimeError("Database not connected")
-        return self._connection.executemany(sql, parameters)
+        """Execute a SQL statement with multiple parameter sets and commit."""
+        async with self.acquire() as conn:
+            def run() -> Any:
+                cursor = conn.executemany(sql, parameters)
+                conn.commit()
+                return cursor
+
+            return await asyncio.to_thread(run)
 
     async def fetchone(self, sql: str, parameters: tuple = ()) -> dict | None:
         """Execute query and fetch one row as dict."""
-        if not self._connection:
-            raise RuntimeError("Database not connected")
-        cursor = self._connection.execute(sql, parameters)
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
+        async with self.acquire() as conn:
+            def run() -> dict | None:
+                cursor = conn.execute(sql, parameters)
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return row_to_dict(cursor, row)
+
+            return await asyncio.to_thread(run)
 
     async def fetchall(self, sql: str, parameters: tuple = ()) -> list[dict]:
         """Execute query and fetch all rows as dicts."""
-        if not self._connection:
-            raise RuntimeError("Database not connected")
-        cursor = self._connection.execute(sql, parameters)
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        async with self.acquire() as conn:
+            def run() -> list[dict]:
+                cursor = conn.execute(sql, parameters)
+                return rows_to_dicts(cursor, cursor.fetchall())
+
+            return await asyncio.to_thread(run)
 
     async def init_schema(self, schema_path: str | Path | None = None) -> None:
         """Initialize database schema from SQL file."""
@@ -111,11 +164,8 @@ class Database:
         if not self._connection:
             raise RuntimeError("Database not connected")
 
-        # Execute each statement separately (libsql doesn't have executescript)
-        for statement in schema.split(";"):
-            statement = statement.strip()
-            if statement:
-                self._connection.execute(statement)
+        # Run as one script; trigger bodies contain their own semicolons
+        self._connection.executescript(schema)
         self._connection.commit()
 
         logger.info("database_schema_initialized")
@@ -1,12 +1,21 @@
 """Async MongoDB connection manager using Motor."""
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import IndexModel
 import structlog
 
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Indexes on the transcripts collection
+TRANSCRIPT_INDEXES = [
+    IndexModel([("video_id", 1)], unique=True),
+    # Also serves channel_id-only filters; covers video_id lookups by channel
+    IndexModel([("channel_id", 1), ("video_id", 1)]),
+    IndexModel([("created_at", -1)]),
+]
+
 
 class MongoDB:
     """Async MongoDB connection manager."""
@@ -15,6 +24,7 @@ class MongoDB:
         """Initialize MongoDB manager."""
         self._client: AsyncIOMotorClient | None = None
         self._db: AsyncIOMotorDatabase | None = None
+        self._indexes_ensured = False
 
     async def connect(self) -> None:
         """Initialize MongoDB connection."""
@@ -24,8 +34,13 @@ class MongoDB:
 
         self._client = AsyncIOMotorClient(
             settings.mongodb_uri,
-            maxPoolSize=10,
-            minPoolSize=1,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=300_000,
+            waitQueueTimeoutMS=10_000,
+            serverSelectionTimeoutMS=5_000,
+            compressors=settings.mongodb_compressors,
+            zlibCompressionLevel=3,
         )
         self._db = self._client[settings.mongodb_database]
 
@@ -42,6 +57,7 @@ class MongoDB:
             self._client.close()
             self._client = None
             self._db = None
+            self._indexes_ensured = False
             logger.info("mongodb_disconnected")
 
     @property
@@ -57,15 +73,26 @@ class MongoDB:
         return self._db is not None
 
     async def ensure_indexes(self) -> None:
-        """Create required indexes."""
-        if self._db is None:
+        """Create required indexes in a single round-trip.
+
+        Existing indexes are skipped, and the check only runs once per
+        connection.
+        """
+        if self._db is None or self._indexes_ensured:
             return
 
         transcripts = self._db["transcripts"]
-        await transcripts.create_index("video_id", unique=True)
-        await transcripts.create_index("channel_id")
-        await transcripts.create_index([("created_at", -1)])
-        logger.info("mongodb_indexes_created")
+        existing = {index["name"] async for index in transcripts.list_indexes()}
+        missing = [
+            index for index in TRANSCRIPT_INDEXES
+            if index.document["name"] not in existing
+        ]
+
+        if missing:
+            await transcripts.create_indexes(missing)
+            logger.info("mongodb_indexes_created", count=len(missing))
+
+        self._indexes_ensured = True
 
 
 # Global instance
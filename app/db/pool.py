@@ -0,0 +1,167 @@
+"""Async connection pool for libSQL connections."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import libsql_experimental as libsql
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool sizing and recycling limits."""
+
+    min_size: int = 5
+    max_size: int = 15
+    max_queries: int = 50000  # Recycle a connection after this many uses
+    max_inactive_lifetime: float = 300.0  # Close idle extras after this many seconds
+
+
+@dataclass(eq=False)
+class _PoolEntry:
+    """A pooled connection with usage bookkeeping."""
+
+    connection: libsql.Connection
+    queries: int = 0
+    last_used: float = 0.0
+
+
+class ConnectionPool:
+    """Queue-backed pool of libSQL connections.
+
+    libSQL connections are synchronous, so connections are opened and closed
+    in worker threads. Each connection is handed to one caller at a time, and
+    one whose borrower failed or was cancelled is replaced rather than reused,
+    since a worker thread may still be running on it.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], libsql.Connection],
+        config: PoolConfig | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            connect: Synchronous factory returning a new connection
+            config: Pool sizing (defaults to PoolConfig())
+        """
+        self._connect = connect
+        self.config = config or PoolConfig()
+        # None marks a slot freed by a failed reconnect; the taker reopens it
+        self._idle: asyncio.LifoQueue[_PoolEntry | None] = asyncio.LifoQueue()
+        # Every open connection, idle or checked out
+        self._entries: set[_PoolEntry] = set()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or in use."""
+        return self._size
+
+    async def open(self) -> None:
+        """Open the minimum number of connections."""
+        entries = await asyncio.gather(
+            *(self._new_entry() for _ in range(self.config.min_size))
+        )
+        for entry in entries:
+            self._idle.put_nowait(entry)
+        logger.info("database_pool_opened", size=self._size)
+
+    async def close(self) -> None:
+        """Close all connections, including ones still checked out."""
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for entry in list(self._entries):
+            await self._discard(entry)
+        logger.info("database_pool_closed")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[libsql.Connection]:
+        """Borrow a connection for the duration of the context."""
+        entry = await self._get()
+        try:
+            yield entry.connection
+        except BaseException:
+            # Don't requeue: a cancelled to_thread call may still be using it
+            await self._replace(entry)
+            raise
+
+        if entry not in self._entries:
+            return  # Closed by close() while checked out
+
+        entry.queries += 1
+        entry.last_used = time.monotonic()
+        if entry.queries >= self.config.max_queries:
+            await self._replace(entry)
+        else:
+            self._idle.put_nowait(entry)
+
+    async def _replace(self, entry: _PoolEntry) -> None:
+        """Close a checked-out connection and queue a fresh one in its place."""
+        if entry not in self._entries:
+            return
+        await self._discard(entry)
+        try:
+            self._idle.put_nowait(await self._new_entry())
+        except Exception as e:
+            logger.warning("database_pool_reconnect_failed", error=str(e))
+            # Wake a waiter so it retries the connect instead of hanging
+            self._idle.put_nowait(None)
+
+    async def _get(self) -> _PoolEntry:
+        """Take an idle connection, growing the pool if none is free."""
+        while not self._idle.empty():
+            entry = self._idle.get_nowait()
+            if entry is None:
+                return await self._reopen()
+            idle_for = time.monotonic() - entry.last_used
+            if (
+                self._size > self.config.min_size
+                and idle_for > self.config.max_inactive_lifetime
+            ):
+                await self._discard(entry)
+                continue
+            return entry
+
+        if self._size < self.config.max_size:
+            return await self._new_entry()
+
+        entry = await self._idle.get()
+        if entry is None:
+            return await self._reopen()
+        return entry
+
+    async def _reopen(self) -> _PoolEntry:
+        """Open a connection in a slot freed by a failed reconnect."""
+        try:
+            return await self._new_entry()
+        except Exception:
+            # Pass the slot on so the next waiter gets its own attempt
+            self._idle.put_nowait(None)
+            raise
+
+    async def _new_entry(self) -> _PoolEntry:
+        """Open a new connection in a worker thread."""
+        self._size += 1
+        try:
+            connection = await asyncio.to_thread(self._connect)
+        except Exception:
+            self._size -= 1
+            raise
+        entry = _PoolEntry(connection=connection, last_used=time.monotonic())
+        self._entries.add(entry)
+        return entry
+
+    async def _discard(self, entry: _PoolEntry) -> None:
+        """Close a connection and release its slot."""
+        if entry not in self._entries:
+            return
+        self._entries.remove(entry)
+        self._size -= 1
+        await asyncio.to_thread(entry.connection.close)
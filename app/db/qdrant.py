@@ -1,13 +1,57 @@
 """Qdrant vector database connection manager."""
 
-from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams, HnswConfigDiff
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Distance,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    QuantizationConfig,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
 import structlog
 
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
+# Payload fields of the sermon chunks collection that filters match on
+CHUNK_KEYWORD_FIELDS = ("video_id",)
+
+# HNSW graph settings for the sermon chunks collection
+HNSW_M = 16
+HNSW_EF_CONSTRUCT = 100
+
+# Segment size (KB of vectors) above which Qdrant builds the HNSW index
+INDEXING_THRESHOLD_KB = 10_000
+
+
+def _quantization_config(quantization: str) -> QuantizationConfig | None:
+    """Build the collection quantization config for a quantization mode."""
+    if quantization == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+    if quantization == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+    return None
+
+
+def quantization_search_params() -> QuantizationSearchParams | None:
+    """Search over quantized vectors, rescoring the top candidates exactly.
+
+    Collections without quantization ignore these parameters.
+    """
+    if settings.qdrant_quantization == "none":
+        return None
+    return QuantizationSearchParams(rescore=True, oversampling=settings.qdrant_oversampling)
+
 
 class QdrantConnection:
     """Manages Qdrant client connection and collection setup."""
@@ -15,6 +59,8 @@ class QdrantConnection:
     def __init__(self):
         """Initialize the Qdrant connection manager."""
         self._client: QdrantClient | None = None
+        self._aclient: AsyncQdrantClient | None = None
+        self._collection_ensured: set[str] = set()
 
     @property
     def client(self) -> QdrantClient:
@@ -23,6 +69,8 @@ class QdrantConnection:
             self._client = QdrantClient(
                 url=settings.qdrant_url,
                 api_key=settings.qdrant_api_key,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
                 timeout=120,
             )
             logger.info(
@@ -31,9 +79,41 @@ class QdrantConnection:
             )
         return self._client
 
-    def ensure_collection(self) -> None:
-        """Ensure the sermon chunks collection exists."""
-        collection_name = settings.qdrant_collection_name
+    @property
+    def aclient(self) -> AsyncQdrantClient:
+        """Get the async Qdrant client, creating if needed."""
+        if self._aclient is None:
+            self._aclient = AsyncQdrantClient(
+                url=settings.qdrant_url,
+                api_key=settings.qdrant_api_key,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
+                timeout=120,
+            )
+        return self._aclient
+
+    def ensure_collection(
+        self,
+        collection_name: str | None = None,
+        quantization: str | None = None,
+    ) -> None:
+        """Ensure a collection exists (defaults to the sermon chunks collection).
+
+        Args:
+            collection_name: Collection to ensure
+            quantization: Quantization for a newly created sermon chunks
+                collection (defaults to settings.qdrant_quantization)
+        """
+        keyword_fields: tuple[str, ...] = ()
+        quantization_config = None
+        if collection_name is None:
+            collection_name = settings.qdrant_collection_name
+            keyword_fields = CHUNK_KEYWORD_FIELDS
+            quantization_config = _quantization_config(
+                quantization or settings.qdrant_quantization
+            )
+        if collection_name in self._collection_ensured:
+            return
 
         # Check if collection exists
         collections = self.client.get_collections()
@@ -46,15 +126,27 @@ class QdrantConnection:
                     size=settings.embedding_dimensions,
                     distance=Distance.COSINE,
                     hnsw_config=HnswConfigDiff(
-                        m=16,
-                        ef_construct=100,
+                        m=HNSW_M,
+                        ef_construct=HNSW_EF_CONSTRUCT,
                     ),
                 ),
+                quantization_config=quantization_config,
             )
             logger.info("qdrant_collection_created", collection_name=collection_name)
         else:
             logger.info("qdrant_collection_exists", collection_name=collection_name)
 
+        # Index filtered fields so per-video filters and deletes don't scan
+        # every point (a no-op when the index already exists)
+        for field_name in keyword_fields:
+            self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+
+        self._collection_ensured.add(collection_name)
+
     def get_collection_info(self) -> dict:
         """Get information about the collection."""
         collection_name = settings.qdrant_collection_name
@@ -69,9 +161,15 @@ class QdrantConnection:
             logger.warning("qdrant_collection_info_failed", error=str(e))
             return {"name": collection_name, "error": str(e)}
 
-    def recreate_collection(self) -> None:
-        """Delete and recreate the collection (for re-indexing)."""
+    def recreate_collection(self, quantization: str | None = None) -> None:
+        """Delete and recreate the collection (for re-indexing).
+
+        Args:
+            quantization: Quantization for the new collection (defaults to
+                settings.qdrant_quantization)
+        """
         collection_name = settings.qdrant_collection_name
+        self._collection_ensured.discard(collection_name)
 
         # Delete if exists
         try:
@@ -81,13 +179,40 @@ class QdrantConnection:
             pass  # Collection didn't exist
 
         # Create fresh
-        self.ensure_collection()
+        self.ensure_collection(quantization=quantization)
+
+    def pause_indexing(self) -> None:
+        """Stop building the HNSW index while a bulk load runs.
+
+        Points written in the meantime are stored but not indexed; call
+        resume_indexing afterwards to build the graph once over all of them.
+        """
+        self.client.update_collection(
+            collection_name=settings.qdrant_collection_name,
+            hnsw_config=HnswConfigDiff(m=0),
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+        logger.info("qdrant_indexing_paused")
+
+    def resume_indexing(self) -> None:
+        """Restore HNSW indexing after pause_indexing."""
+        self.client.update_collection(
+            collection_name=settings.qdrant_collection_name,
+            hnsw_config=HnswConfigDiff(m=HNSW_M),
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=INDEXING_THRESHOLD_KB),
+        )
+        logger.info("qdrant_indexing_resumed")
+
+    async def close(self) -> None:
+        """Close the Qdrant client connections."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
 
-    def close(self) -> None:
-        """Close the Qdrant client connection."""
         if self._client is not None:
             self._client.close()
             self._client = None
+            self._collection_ensured.clear()
             logger.info("qdrant_disconnected")
 
 
@@ -0,0 +1,75 @@
+"""Shared read helpers for libSQL repositories."""
+
+import asyncio
+from itertools import starmap
+from typing import Any, Callable, TypeVar
+
+import libsql_experimental as libsql
+
+from app.db.connection import Database
+from app.db.rows import row_to_dict, rows_to_dicts
+
+T = TypeVar("T")
+
+
+class Repository:
+    """Base repository with a writer connection and an optional read pool.
+
+    Writes always go through the single writer connection. Reads go through
+    the database's connection pool (off the event loop) when a reader is
+    given, so concurrent requests don't queue on one connection.
+    """
+
+    def __init__(self, connection: libsql.Connection, reader: Database | None = None):
+        """Initialize with database connection.
+
+        Args:
+            connection: Writer connection
+            reader: Database whose pool serves reads (defaults to the writer)
+        """
+        self.conn = connection
+        self.reader = reader
+
+    async def _fetchone(self, sql: str, parameters: tuple = ()) -> dict[str, Any] | None:
+        """Run a query and fetch one row as a dict."""
+        if self.reader is not None:
+            return await self.reader.fetchone(sql, parameters)
+
+        cursor = self.conn.execute(sql, parameters)
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return row_to_dict(cursor, row)
+
+    async def _fetchall(self, sql: str, parameters: tuple = ()) -> list[dict[str, Any]]:
+        """Run a query and fetch all rows as dicts."""
+        if self.reader is not None:
+            return await self.reader.fetchall(sql, parameters)
+
+        cursor = self.conn.execute(sql, parameters)
+        return rows_to_dicts(cursor, cursor.fetchall())
+
+    async def _fetchall_as(
+        self,
+        factory: Callable[..., T],
+        sql: str,
+        parameters: tuple = (),
+    ) -> list[T]:
+        """Run a query and build one object per row from its positional values.
+
+        Args:
+            factory: Callable taking the row's columns in SELECT order
+            sql: Query to run
+            parameters: Query parameters
+
+        Returns:
+            List of factory results
+        """
+        def run(conn: libsql.Connection) -> list[T]:
+            return list(starmap(factory, conn.execute(sql, parameters).fetchall()))
+
+        if self.reader is None:
+            return run(self.conn)
+
+        async with self.reader.acquire() as conn:
+            return await asyncio.to_thread(run, conn)
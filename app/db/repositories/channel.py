@@ -1,21 +1,17 @@
 """Channel repository for database operations."""
 
-from datetime import datetime, UTC
 from typing import Any
 
-import libsql_experimental as libsql
 import structlog
 
+from app.db.repositories.base import Repository
+
 logger = structlog.get_logger(__name__)
 
 
-class ChannelRepository:
+class ChannelRepository(Repository):
     """Repository for channel CRUD operations."""
 
-    def __init__(self, connection: libsql.Connection):
-        """Initialize with database connection."""
-        self.conn = connection
-
     async def create(self, data: dict[str, Any]) -> int:
         """Create a new channel."""
         cursor = self.conn.execute(
@@ -29,62 +25,65 @@ class ChannelRepository:
         logger.info("channel_created", channel_id=data["channel_id"])
         return cursor.lastrowid or 0
 
+    async def create_many(self, rows: list[dict[str, Any]]) -> None:
+        """Create several channels in one statement batch."""
+        self.conn.executemany(
+            """
+            INSERT INTO channels (channel_id, channel_name, channel_url)
+            VALUES (?, ?, ?)
+            """,
+            [(row["channel_id"], row["channel_name"], row["channel_url"]) for row in rows],
+        )
+        self.conn.commit()
+        logger.info("channels_created", count=len(rows))
+
     async def get_by_channel_id(self, channel_id: str) -> dict[str, Any] | None:
         """Get a channel by its YouTube channel ID."""
-        cursor = self.conn.execute(
+        return await self._fetchone(
             "SELECT * FROM channels WHERE channel_id = ?",
             (channel_id,),
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
 
     async def get_by_id(self, id: int) -> dict[str, Any] | None:
         """Get a channel by its database ID."""
-        cursor = self.conn.execute(
+        return await self._fetchone(
             "SELECT * FROM channels WHERE id = ?",
             (id,),
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
+
+    async def get_names(self) -> dict[str, str]:
+        """Get every channel's name, keyed by YouTube channel ID."""
+        rows = await self._fetchall("SELECT channel_id, channel_name FROM channels")
+        return {row["channel_id"]: row["channel_name"] for row in rows}
 
     async def list_active(self) -> list[dict[str, Any]]:
         """List all active channels."""
-        cursor = self.conn.execute(
+        return await self._fetchall(
             "SELECT * FROM channels WHERE is_active = TRUE ORDER BY channel_name"
         )
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
 
     async def update_last_sync(self, channel_id: str) -> None:
         """Update the last sync timestamp for a channel."""
-        now = datetime.now(UTC).isoformat()
         self.conn.execute(
             """
             UPDATE channels
-            SET last_sync_at = ?, updated_at = ?
+            SET last_sync_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now'),
+                updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
             WHERE channel_id = ?
             """,
-            (now, now, channel_id),
+            (channel_id,),
         )
         self.conn.commit()
         logger.info("channel_sync_updated", channel_id=channel_id)
 
     async def set_active(self, channel_id: str, is_active: bool) -> None:
         """Set the active status of a channel."""
-        now = datetime.now(UTC).isoformat()
         self.conn.execute(
             """
             UPDATE channels
-            SET is_active = ?, updated_at = ?
+            SET is_active = ?, updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
             WHERE channel_id = ?
             """,
-            (is_active, now, channel_id),
+            (is_active, channel_id),
         )
         self.conn.commit()
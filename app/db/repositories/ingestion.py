@@ -1,20 +1,23 @@
 """Ingestion status repository for database operations."""
 
-from datetime import datetime, UTC
-from typing import Any
+from typing import Any, ClassVar
 
-import libsql_experimental as libsql
 import structlog
 
+from app.db.repositories.base import Repository
+from app.db.rows import row_to_dict
+
 logger = structlog.get_logger(__name__)
 
+# UTC ISO-8601 timestamp computed by SQLite ('now' is fixed within a statement)
+NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
 
-class IngestionRepository:
+class IngestionRepository(Repository):
     """Repository for ingestion status CRUD operations."""
 
-    def __init__(self, connection: libsql.Connection):
-        """Initialize with database connection."""
-        self.conn = connection
+    # UPDATE statements keyed by (stamp column, other columns)
+    _update_sql_cache: ClassVar[dict[tuple[str | None, tuple[str, ...]], str]] = {}
 
     async def create(self, video_id: str, status: str = "pending") -> int:
         """Create a new ingestion status record."""
@@ -29,54 +32,107 @@ class IngestionRepository:
         self.conn.commit()
         return cursor.lastrowid or 0
 
+    async def create_many(self, video_ids: list[str], status: str = "pending") -> None:
+        """Create ingestion status records for many videos with one commit."""
+        if not video_ids:
+            return
+
+        try:
+            self.conn.executemany(
+                """
+                INSERT INTO ingestion_status (video_id, status)
+                VALUES (?, ?)
+                ON CONFLICT(video_id) DO NOTHING
+                """,
+                [(video_id, status) for video_id in video_ids],
+            )
+        except Exception:
+            # Don't leave the rows before the failing one for a later commit
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
     async def get_by_video_id(self, video_id: str) -> dict[str, Any] | None:
         """Get ingestion status for a video."""
-        cursor = self.conn.execute(
+        return await self._fetchone(
             "SELECT * FROM ingestion_status WHERE video_id = ?",
             (video_id,),
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
+
+    async def get_statuses_in(self, video_ids: list[str]) -> dict[str, str]:
+        """Get the ingestion status of several videos, keyed by video ID."""
+        if not video_ids:
+            return {}
+
+        placeholders = ", ".join("?" * len(video_ids))
+        rows = await self._fetchall(
+            f"SELECT video_id, status FROM ingestion_status WHERE video_id IN ({placeholders})",
+            tuple(video_ids),
+        )
+        return {row["video_id"]: row["status"] for row in rows}
 
     async def update_status(
         self,
         video_id: str,
         status: str,
+        stamp: str | None = None,
         **kwargs: Any,
-    ) -> None:
-        """Update ingestion status and optional fields."""
-        now = datetime.now(UTC).isoformat()
+    ) -> dict[str, Any] | None:
+        """Update ingestion status and optional fields.
+
+        Args:
+            video_id: YouTube video ID
+            status: New status
+            stamp: Timestamp column to set to the current time, if any
+            **kwargs: Other columns to set
 
-        # Build dynamic update query
-        fields = ["status = ?", "updated_at = ?"]
-        values: list[Any] = [status, now]
+        Returns:
+            The updated record, or None if the video has no record
+        """
+        values: list[Any] = [status]
+        values.extend(
+            value for key, value in kwargs.items() if key != "increment_error_count"
+        )
+        values.append(video_id)
 
-        for key, value in kwargs.items():
-            if key == "increment_error_count":
+        query = self._update_sql(stamp, tuple(kwargs))
+        cursor = self.conn.execute(query, tuple(values))
+        # Drain the cursor: the commit fails while RETURNING is mid-statement
+        rows = cursor.fetchall()
+        self.conn.commit()
+
+        logger.info("ingestion_status_updated", video_id=video_id, status=status)
+        return row_to_dict(cursor, rows[0]) if rows else None
+
+    @classmethod
+    def _update_sql(cls, stamp: str | None, columns: tuple[str, ...]) -> str:
+        """Build (once per column combination) the UPDATE for update_status."""
+        key = (stamp, columns)
+        query = cls._update_sql_cache.get(key)
+        if query is not None:
+            return query
+
+        fields = ["status = ?", f"updated_at = {NOW_SQL}"]
+        if stamp:
+            fields.append(f"{stamp} = {NOW_SQL}")
+        for column in columns:
+            if column == "increment_error_count":
                 fields.append("error_count = error_count + 1")
             else:
-                fields.append(f"{key} = ?")
-                values.append(value)
-
-        values.append(video_id)
+                fields.append(f"{column} = ?")
 
         query = f"""
             UPDATE ingestion_status
             SET {", ".join(fields)}
             WHERE video_id = ?
+            RETURNING *
         """
-        self.conn.execute(query, tuple(values))
-        self.conn.commit()
-
-        logger.info("ingestion_status_updated", video_id=video_id, status=status)
+        cls._update_sql_cache[key] = query
+        return query
 
-    async def set_downloading(self, video_id: str) -> None:
+    async def set_downloading(self, video_id: str) -> dict[str, Any] | None:
         """Mark video as downloading."""
-        now = datetime.now(UTC).isoformat()
-        await self.update_status(video_id, "downloading", download_started_at=now)
+        return await self.update_status(video_id, "downloading", stamp="download_started_at")
 
     async def set_downloaded(
         self,
@@ -84,42 +140,38 @@ class IngestionRepository:
         audio_path: str,
         audio_format: str,
         audio_size_bytes: int,
-    ) -> None:
+    ) -> dict[str, Any] | None:
         """Mark video as downloaded with audio info."""
-        now = datetime.now(UTC).isoformat()
-        await self.update_status(
+        return await self.update_status(
             video_id,
             "downloaded",
+            stamp="download_completed_at",
             audio_path=audio_path,
             audio_format=audio_format,
             audio_size_bytes=audio_size_bytes,
-            download_completed_at=now,
         )
 
-    async def set_transcribing(self, video_id: str) -> None:
+    async def set_transcribing(self, video_id: str) -> dict[str, Any] | None:
         """Mark video as transcribing."""
-        now = datetime.now(UTC).isoformat()
-        await self.update_status(video_id, "transcribing", transcription_started_at=now)
+        return await self.update_status(video_id, "transcribing", stamp="transcription_started_at")
 
     async def set_completed(
         self,
         video_id: str,
         transcript_text: str,
         transcript_path: str | None = None,
-    ) -> None:
+    ) -> dict[str, Any] | None:
         """Mark video as completed with transcript info."""
-        now = datetime.now(UTC).isoformat()
-        kwargs: dict[str, Any] = {
-            "transcript_text": transcript_text,
-            "transcription_completed_at": now,
-        }
+        kwargs: dict[str, Any] = {"transcript_text": transcript_text}
         if transcript_path:
             kwargs["transcript_path"] = transcript_path
-        await self.update_status(video_id, "completed", **kwargs)
+        return await self.update_status(
+            video_id, "completed", stamp="transcription_completed_at", **kwargs
+        )
 
-    async def set_failed(self, video_id: str, error_message: str) -> None:
+    async def set_failed(self, video_id: str, error_message: str) -> dict[str, Any] | None:
         """Mark video as failed with error message."""
-        await self.update_status(
+        return await self.update_status(
             video_id,
             "failed",
             error_message=error_message,
@@ -132,7 +184,7 @@ class IngestionRepository:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """List ingestion records by status."""
-        cursor = self.conn.execute(
+        return await self._fetchall(
             """
             SELECT * FROM ingestion_status
             WHERE status = ?
@@ -141,9 +193,6 @@ class IngestionRepository:
             """,
             (status, limit),
         )
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
 
     async def list_failed(
         self,
@@ -151,37 +200,28 @@ class IngestionRepository:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """List failed ingestions that can be retried."""
-        cursor = self.conn.execute(
+        return await self._fetchall(
             """
-            SELECT * FROM ingestion_status
+            SELECT * FROM ingestion_status INDEXED BY idx_ingestion_failed_retry
             WHERE status = 'failed' AND error_count < ?
             ORDER BY updated_at
             LIMIT ?
             """,
             (max_error_count, limit),
         )
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
 
     async def count_by_status(self, status: str) -> int:
-        """Count ingestion records by status."""
-        cursor = self.conn.execute(
-            "SELECT COUNT(*) FROM ingestion_status WHERE status = ?",
+        """Count ingestion records by status (trigger-maintained)."""
+        row = await self._fetchone(
+            "SELECT n FROM ingestion_status_counts WHERE status = ?",
             (status,),
         )
-        row = cursor.fetchone()
-        return row[0] if row else 0
+        return row["n"] if row else 0
 
     async def get_stats(self) -> dict[str, int]:
-        """Get ingestion statistics by status."""
-        cursor = self.conn.execute(
-            """
-            SELECT status, COUNT(*) as count
-            FROM ingestion_status
-            GROUP BY status
-            """
-        )
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return {dict(zip(columns, row))["status"]: dict(zip(columns, row))["count"] for row in rows}
+        """Get ingestion statistics by status (trigger-maintained).
+
+        Statuses no record currently has are left out.
+        """
+        rows = await self._fetchall("SELECT status, n FROM ingestion_status_counts WHERE n > 0")
+        return {row["status"]: row["n"] for row in rows}
@@ -0,0 +1,97 @@
+"""Ingestion job queue repository for database operations."""
+
+from typing import Any
+
+import orjson
+import structlog
+
+from app.core.config import settings
+from app.db.repositories.base import Repository
+from app.db.repositories.ingestion import NOW_SQL
+from app.db.rows import row_to_dict
+
+logger = structlog.get_logger(__name__)
+
+
+class JobRepository(Repository):
+    """Repository for the ingestion job queue."""
+
+    async def enqueue(self, job_type: str, payload: dict[str, Any]) -> int:
+        """Queue a job and return its ID."""
+        cursor = self.conn.execute(
+            "INSERT INTO ingestion_jobs (job_type, payload) VALUES (?, ?)",
+            (job_type, orjson.dumps(payload).decode()),
+        )
+        self.conn.commit()
+        job_id = cursor.lastrowid or 0
+        logger.info("job_enqueued", job_id=job_id, job_type=job_type)
+        return job_id
+
+    async def claim_next(self) -> dict[str, Any] | None:
+        """Mark the oldest claimable job as running and return it.
+
+        Queued jobs are claimable, as are jobs still running after
+        job_claim_timeout_seconds (their worker crashed). The status check in
+        the UPDATE keeps two workers from claiming the same job.
+        """
+        cursor = self.conn.execute(
+            f"""
+            UPDATE ingestion_jobs
+            SET status = 'running', started_at = {NOW_SQL}
+            WHERE id = (
+                SELECT id FROM ingestion_jobs
+                WHERE status = 'queued'
+                   OR (status = 'running' AND started_at < strftime('%Y-%m-%dT%H:%M:%fZ', 'now', ?))
+                ORDER BY id
+                LIMIT 1
+            ) AND status IN ('queued', 'running')
+            RETURNING *
+            """,
+            (f"-{settings.job_claim_timeout_seconds} seconds",),
+        )
+        rows = cursor.fetchall()
+        self.conn.commit()
+        if not rows:
+            return None
+
+        job = row_to_dict(cursor, rows[0])
+        job["payload"] = orjson.loads(job["payload"])
+        return job
+
+    async def complete(self, job_id: int, result: dict[str, Any]) -> None:
+        """Mark a job as completed with its result."""
+        self.conn.execute(
+            f"""
+            UPDATE ingestion_jobs
+            SET status = 'completed', result = ?, completed_at = {NOW_SQL}
+            WHERE id = ?
+            """,
+            (orjson.dumps(result, default=str).decode(), job_id),
+        )
+        self.conn.commit()
+
+    async def fail(self, job_id: int, error_message: str) -> None:
+        """Mark a job as failed."""
+        self.conn.execute(
+            f"""
+            UPDATE ingestion_jobs
+            SET status = 'failed', error_message = ?, completed_at = {NOW_SQL}
+            WHERE id = ?
+            """,
+            (error_message, job_id),
+        )
+        self.conn.commit()
+
+    async def get(self, job_id: int) -> dict[str, Any] | None:
+        """Get a job by ID."""
+        job = await self._fetchone(
+            "SELECT * FROM ingestion_jobs WHERE id = ?",
+            (job_id,),
+        )
+        if job is None:
+            return None
+
+        job["payload"] = orjson.loads(job["payload"])
+        if job["result"] is not None:
+            job["result"] = orjson.loads(job["result"])
+        return job
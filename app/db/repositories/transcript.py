@@ -1,15 +1,41 @@
 """Transcript repository for MongoDB operations."""
 
 from datetime import datetime, UTC
-from typing import Any
+from typing import Any, AsyncIterator
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
 import structlog
 
 from app.models.transcript import TranscriptCreate
 
 logger = structlog.get_logger(__name__)
 
+# Documents per cursor batch when streaming video IDs
+ID_BATCH_SIZE = 500
+
+# Projection of the fields the per-channel counters depend on
+_COUNTED_FIELDS = {"channel_id": 1, "channel_name": 1, "word_count": 1, "_id": 0}
+
+# Bump to force every deployment to rebuild the counters on its next startup
+COUNTERS_VERSION = 1
+
+
+def _to_document(data: TranscriptCreate) -> dict[str, Any]:
+    """Build the MongoDB document for a transcript.
+
+    Fields were validated when the model was built, so they are read directly
+    rather than through model_dump(), which re-walks every segment.
+    """
+    doc = {name: getattr(data, name) for name in TranscriptCreate.model_fields}
+    doc["segments"] = [segment.__dict__ for segment in data.segments]
+    return doc
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-separated words in transcript text."""
+    return len(text.split())
+
 
 class TranscriptRepository:
     """Repository for transcript CRUD operations in MongoDB."""
@@ -17,45 +43,143 @@ class TranscriptRepository:
     def __init__(self, db: AsyncIOMotorDatabase):
         """Initialize with MongoDB database."""
         self.collection = db["transcripts"]
+        # Per-channel {count, total_words}, kept in step by every write here
+        self.counters = db["transcript_counters"]
+        # One document per applied data migration, keyed by name
+        self.migrations = db["migrations"]
+
+    async def _adjust_counters(
+        self,
+        channel_id: str,
+        channel_name: str,
+        count: int,
+        words: int,
+    ) -> None:
+        """Add to a channel's transcript and word counters."""
+        await self.counters.update_one(
+            {"_id": channel_id},
+            {
+                "$inc": {"count": count, "total_words": words},
+                "$set": {"channel_name": channel_name},
+            },
+            upsert=True,
+        )
 
     async def create(self, data: TranscriptCreate) -> str:
         """Create a new transcript."""
-        doc = data.model_dump()
-        doc["word_count"] = len(data.text.split())
+        doc = _to_document(data)
+        doc["word_count"] = _word_count(data.text)
         doc["created_at"] = datetime.now(UTC)
         doc["updated_at"] = datetime.now(UTC)
 
         result = await self.collection.insert_one(doc)
+        await self._adjust_counters(
+            data.channel_id, data.channel_name, 1, doc["word_count"]
+        )
         logger.info("transcript_created", video_id=data.video_id)
         return str(result.inserted_id)
 
     async def upsert(self, data: TranscriptCreate) -> str:
         """Insert or update a transcript."""
-        doc = data.model_dump()
-        doc["word_count"] = len(data.text.split())
+        doc = _to_document(data)
+        doc["word_count"] = _word_count(data.text)
         doc["updated_at"] = datetime.now(UTC)
 
-        result = await self.collection.update_one(
+        previous = await self.collection.find_one_and_update(
             {"video_id": data.video_id},
             {
                 "$set": doc,
                 "$setOnInsert": {"created_at": datetime.now(UTC)},
             },
+            projection=_COUNTED_FIELDS,
             upsert=True,
+            return_document=ReturnDocument.BEFORE,
         )
 
-        if result.upserted_id:
+        if previous is None:
+            await self._adjust_counters(
+                data.channel_id, data.channel_name, 1, doc["word_count"]
+            )
             logger.info("transcript_created", video_id=data.video_id)
         else:
+            if previous["channel_id"] == data.channel_id:
+                await self._adjust_counters(
+                    data.channel_id,
+                    data.channel_name,
+                    0,
+                    doc["word_count"] - previous.get("word_count", 0),
+                )
+            else:
+                await self._adjust_counters(
+                    previous["channel_id"],
+                    previous["channel_name"],
+                    -1,
+                    -previous.get("word_count", 0),
+                )
+                await self._adjust_counters(
+                    data.channel_id, data.channel_name, 1, doc["word_count"]
+                )
             logger.info("transcript_updated", video_id=data.video_id)
 
         return data.video_id
 
+    async def bulk_upsert(self, items: list[TranscriptCreate]) -> None:
+        """Insert or update many transcripts with one unordered bulk write.
+
+        Per-channel counters are not adjusted; call rebuild_counters once the
+        bulk load is done.
+        """
+        if not items:
+            return
+
+        now = datetime.now(UTC)
+        operations = []
+        for data in items:
+            doc = _to_document(data)
+            doc["word_count"] = _word_count(data.text)
+            doc["updated_at"] = now
+            operations.append(
+                UpdateOne(
+                    {"video_id": data.video_id},
+                    {"$set": doc, "$setOnInsert": {"created_at": now}},
+                    upsert=True,
+                )
+            )
+
+        await self.collection.bulk_write(operations, ordered=False)
+        logger.info("transcripts_upserted", count=len(items))
+
     async def get_by_video_id(self, video_id: str) -> dict[str, Any] | None:
         """Get a transcript by video ID."""
         doc = await self.collection.find_one({"video_id": video_id})
         return doc
 
+    async def get_many_by_video_ids(self, video_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get several transcripts in one query, keyed by video ID."""
+        cursor = self.collection.find({"video_id": {"$in": video_ids}})
+        return {doc["video_id"]: doc async for doc in cursor}
+
+    async def get_metadata_by_video_id(self, video_id: str) -> dict[str, Any] | None:
+        """Get a transcript without its text and segments."""
+        return await self.collection.find_one(
+            {"video_id": video_id}, {"text": 0, "segments": 0, "_id": 0}
+        )
+
+    async def iter_segments(self, video_id: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield a transcript's segments one at a time.
+
+        The segments array is unwound server-side so the driver fetches it in
+        cursor batches instead of as one document.
+        """
+        pipeline: list[dict[str, Any]] = [
+            {"$match": {"video_id": video_id}},
+            {"$project": {"segments": 1, "_id": 0}},
+            {"$unwind": "$segments"},
+            {"$replaceRoot": {"newRoot": "$segments"}},
+        ]
+        async for segment in self.collection.aggregate(pipeline):
+            yield segment
+
     async def get_text_by_video_id(self, video_id: str) -> str | None:
         """Get only transcript text (efficient for embedding)."""
         doc = await self.collection.find_one(
@@ -65,8 +189,8 @@ class TranscriptRepository:
 
     async def exists(self, video_id: str) -> bool:
         """Check if transcript exists."""
-        count = await self.collection.count_documents({"video_id": video_id}, limit=1)
-        return count > 0
+        doc = await self.collection.find_one({"video_id": video_id}, {"_id": 1})
+        return doc is not None
 
     async def list_by_channel(
         self,
@@ -87,51 +211,101 @@ class TranscriptRepository:
 
         return await cursor.to_list(length=limit)
 
+    async def iter_all_video_ids(self) -> AsyncIterator[str]:
+        """Yield all video IDs with transcripts (index-only scan)."""
+        cursor = (
+            self.collection.find({}, {"video_id": 1, "_id": 0})
+            .hint([("video_id", 1)])
+            .batch_size(ID_BATCH_SIZE)
+        )
+        async for doc in cursor:
+            yield doc["video_id"]
+
+    async def iter_video_ids_by_channel(self, channel_id: str) -> AsyncIterator[str]:
+        """Yield video IDs for a specific channel (covered by the compound index)."""
+        cursor = (
+            self.collection.find({"channel_id": channel_id}, {"video_id": 1, "_id": 0})
+            .hint([("channel_id", 1), ("video_id", 1)])
+            .batch_size(ID_BATCH_SIZE)
+        )
+        async for doc in cursor:
+            yield doc["video_id"]
+
     async def list_all_video_ids(self) -> list[str]:
         """Get all video IDs with transcripts."""
-        cursor = self.collection.find({}, {"video_id": 1, "_id": 0})
-        docs = await cursor.to_list(length=None)
-        return [doc["video_id"] for doc in docs]
+        return [video_id async for video_id in self.iter_all_video_ids()]
 
     async def list_video_ids_by_channel(self, channel_id: str) -> list[str]:
         """Get video IDs for a specific channel."""
-        cursor = self.collection.find(
-            {"channel_id": channel_id}, {"video_id": 1, "_id": 0}
-        )
-        docs = await cursor.to_list(length=None)
-        return [doc["video_id"] for doc in docs]
+        return [
+            video_id async for video_id in self.iter_video_ids_by_channel(channel_id)
+        ]
 
     async def count(self) -> int:
-        """Count total transcripts."""
-        return await self.collection.count_documents({})
+        """Count total transcripts (from collection metadata)."""
+        return await self.collection.estimated_document_count()
 
     async def count_by_channel(self, channel_id: str) -> int:
-        """Count transcripts for a channel."""
-        return await self.collection.count_documents({"channel_id": channel_id})
+        """Count transcripts for a channel (from the counters collection)."""
+        doc = await self.counters.find_one({"_id": channel_id}, {"count": 1})
+        return doc["count"] if doc else 0
 
     async def get_stats(self) -> dict[str, Any]:
-        """Get transcript statistics by channel."""
-        pipeline = [
+        """Get transcript statistics by channel (from the counters collection)."""
+        cursor = self.counters.find(
+            {"count": {"$gt": 0}},
+            {"_id": "$channel_name", "count": 1, "total_words": 1},
+        ).sort("count", -1)
+        results = await cursor.to_list(length=None)
+        return {
+            "by_channel": results,
+            "total": sum(r["count"] for r in results),
+        }
+
+    async def rebuild_counters(self) -> None:
+        """Recompute the per-channel counters from the transcripts."""
+        pipeline: list[dict[str, Any]] = [
             {
                 "$group": {
-                    "_id": "$channel_name",
+                    "_id": "$channel_id",
+                    "channel_name": {"$last": "$channel_name"},
                     "count": {"$sum": 1},
                     "total_words": {"$sum": "$word_count"},
                 }
             },
-            {"$sort": {"count": -1}},
+            {"$out": self.counters.name},
         ]
-        cursor = self.collection.aggregate(pipeline)
-        results = await cursor.to_list(length=None)
-        return {
-            "by_channel": results,
-            "total": sum(r["count"] for r in results),
-        }
+        await self.collection.aggregate(pipeline).to_list(length=None)
+        await self.migrations.update_one(
+            {"_id": self.counters.name},
+            {"$set": {"version": COUNTERS_VERSION, "applied_at": datetime.now(UTC)}},
+            upsert=True,
+        )
+        logger.info("transcript_counters_rebuilt")
+
+    async def ensure_counters(self) -> None:
+        """Rebuild the counters once if this deployment hasn't yet.
+
+        Run at startup: counters only track writes made after they were
+        introduced, so existing transcripts have to be counted up front.
+        """
+        applied = await self.migrations.find_one({"_id": self.counters.name})
+        if applied is None or applied.get("version", 0) < COUNTERS_VERSION:
+            await self.rebuild_counters()
 
     async def delete(self, video_id: str) -> bool:
         """Delete a transcript."""
-        result = await self.collection.delete_one({"video_id": video_id})
-        if result.deleted_count > 0:
-            logger.info("transcript_deleted", video_id=video_id)
-            return True
-        return False
+        deleted = await self.collection.find_one_and_delete(
+            {"video_id": video_id}, projection=_COUNTED_FIELDS
+        )
+        if deleted is None:
+            return False
+
+        await self._adjust_counters(
+            deleted["channel_id"],
+            deleted["channel_name"],
+            -1,
+            -deleted.get("word_count", 0),
+        )
+        logger.info("transcript_deleted", video_id=video_id)
+        return True
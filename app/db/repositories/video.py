@@ -1,19 +1,68 @@
 """Video repository for database operations."""
 
+from dataclasses import asdict, dataclass, fields
 from typing import Any
 
-import libsql_experimental as libsql
 import structlog
 
+from app.db.repositories.base import Repository
+
 logger = structlog.get_logger(__name__)
 
 
-class VideoRepository:
-    """Repository for video CRUD operations."""
+@dataclass(slots=True)
+class VideoRow:
+    """A videos row, built positionally from SELECT_SQL's column order."""
+
+    id: int
+    video_id: str
+    channel_id: str
+    title: str
+    description: str | None
+    duration_seconds: int | None
+    published_at: str | None
+    thumbnail_url: str | None
+    view_count: int | None
+    created_at: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict."""
+        return asdict(self)
+
 
-    def __init__(self, connection: libsql.Connection):
-        """Initialize with database connection."""
-        self.conn = connection
+SELECT_SQL = f"SELECT {', '.join(f.name for f in fields(VideoRow))} FROM videos"
+
+UPSERT_SQL = """
+    INSERT INTO videos (
+        video_id, channel_id, title, description,
+        duration_seconds, published_at, thumbnail_url, view_count
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(video_id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        duration_seconds = excluded.duration_seconds,
+        thumbnail_url = excluded.thumbnail_url,
+        view_count = excluded.view_count
+"""
+
+
+def _video_params(data: dict[str, Any]) -> tuple:
+    """Build the positional parameters for a videos row."""
+    return (
+        data["video_id"],
+        data["channel_id"],
+        data["title"],
+        data.get("description"),
+        data.get("duration_seconds"),
+        data.get("published_at"),
+        data.get("thumbnail_url"),
+        data.get("view_count"),
+    )
+
+
+class VideoRepository(Repository):
+    """Repository for video CRUD operations."""
 
     async def create(self, data: dict[str, Any]) -> int:
         """Create a new video."""
@@ -25,16 +74,7 @@ class VideoRepository:
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                data["video_id"],
-                data["channel_id"],
-                data["title"],
-                data.get("description"),
-                data.get("duration_seconds"),
-                data.get("published_at"),
-                data.get("thumbnail_url"),
-                data.get("view_count"),
-            ),
+            _video_params(data),
         )
         self.conn.commit()
         logger.info("video_created", video_id=data["video_id"])
@@ -42,92 +82,91 @@ class VideoRepository:
 
     async def upsert(self, data: dict[str, Any]) -> int:
         """Insert or update a video."""
-        cursor = self.conn.execute(
-            """
-            INSERT INTO videos (
-                video_id, channel_id, title, description,
-                duration_seconds, published_at, thumbnail_url, view_count
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(video_id) DO UPDATE SET
-                title = excluded.title,
-                description = excluded.description,
-                duration_seconds = excluded.duration_seconds,
-                thumbnail_url = excluded.thumbnail_url,
-                view_count = excluded.view_count
-            """,
-            (
-                data["video_id"],
-                data["channel_id"],
-                data["title"],
-                data.get("description"),
-                data.get("duration_seconds"),
-                data.get("published_at"),
-                data.get("thumbnail_url"),
-                data.get("view_count"),
-            ),
-        )
+        cursor = self.conn.execute(UPSERT_SQL, _video_params(data))
         self.conn.commit()
         return cursor.lastrowid or 0
 
-    async def get_by_video_id(self, video_id: str) -> dict[str, Any] | None:
+    async def bulk_upsert(self, rows: list[dict[str, Any]]) -> None:
+        """Insert or update many videos with one commit."""
+        if not rows:
+            return
+
+        try:
+            self.conn.executemany(UPSERT_SQL, [_video_params(data) for data in rows])
+        except Exception:
+            # Don't leave the rows before the failing one for a later commit
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        logger.info("videos_upserted", count=len(rows))
+
+    async def get_by_video_id(self, video_id: str) -> VideoRow | None:
         """Get a video by its YouTube video ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM videos WHERE video_id = ?",
-            (video_id,),
+        rows = await self._fetchall_as(
+            VideoRow, f"{SELECT_SQL} WHERE video_id = ?", (video_id,)
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
+        return rows[0] if rows else None
 
-    async def get_by_id(self, id: int) -> dict[str, Any] | None:
-        """Get a video by its database ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM videos WHERE id = ?",
-            (id,),
+    async def get_many_by_video_ids(self, video_ids: list[str]) -> dict[str, VideoRow]:
+        """Get several videos in one query, keyed by YouTube video ID."""
+        if not video_ids:
+            return {}
+
+        placeholders = ", ".join("?" * len(video_ids))
+        rows = await self._fetchall_as(
+            VideoRow,
+            f"{SELECT_SQL} WHERE video_id IN ({placeholders})",
+            tuple(video_ids),
         )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        columns = [desc[0] for desc in cursor.description]
-        return dict(zip(columns, row))
+        return {row.video_id: row for row in rows}
+
+    async def get_ids_in(self, video_ids: list[str]) -> set[str]:
+        """Return which of the given YouTube video IDs are already stored."""
+        if not video_ids:
+            return set()
+
+        placeholders = ", ".join("?" * len(video_ids))
+        rows = await self._fetchall(
+            f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})",
+            tuple(video_ids),
+        )
+        return {row["video_id"] for row in rows}
+
+    async def get_by_id(self, id: int) -> VideoRow | None:
+        """Get a video by its database ID."""
+        rows = await self._fetchall_as(VideoRow, f"{SELECT_SQL} WHERE id = ?", (id,))
+        return rows[0] if rows else None
 
     async def list_by_channel(
         self,
         channel_id: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[dict[str, Any]]:
+    ) -> list[VideoRow]:
         """List videos for a channel, ordered by publish date."""
-        cursor = self.conn.execute(
-            """
-            SELECT * FROM videos
+        return await self._fetchall_as(
+            VideoRow,
+            f"""
+            {SELECT_SQL}
             WHERE channel_id = ?
             ORDER BY published_at DESC
             LIMIT ? OFFSET ?
             """,
             (channel_id, limit, offset),
         )
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in rows]
 
     async def count_by_channel(self, channel_id: str) -> int:
         """Count videos for a channel."""
-        cursor = self.conn.execute(
-            "SELECT COUNT(*) FROM videos WHERE channel_id = ?",
+        row = await self._fetchone(
+            "SELECT COUNT(*) AS n FROM videos WHERE channel_id = ?",
             (channel_id,),
         )
-        row = cursor.fetchone()
-        return row[0] if row else 0
+        return row["n"] if row else 0
 
     async def exists(self, video_id: str) -> bool:
         """Check if a video exists."""
-        cursor = self.conn.execute(
+        row = await self._fetchone(
             "SELECT 1 FROM videos WHERE video_id = ? LIMIT 1",
             (video_id,),
         )
-        row = cursor.fetchone()
         return row is not None
@@ -0,0 +1,24 @@
+"""Helpers for turning libSQL cursor rows into dicts."""
+
+from functools import partial
+from typing import Any, Sequence
+
+import libsql_experimental as libsql
+
+
+def column_names(cursor: libsql.Cursor) -> tuple[str, ...]:
+    """Get the result column names of a cursor."""
+    return tuple(desc[0] for desc in cursor.description)
+
+
+def row_to_dict(cursor: libsql.Cursor, row: Sequence[Any]) -> dict[str, Any]:
+    """Convert a single row to a dict keyed by column name."""
+    return dict(zip(column_names(cursor), row))
+
+
+def rows_to_dicts(cursor: libsql.Cursor, rows: list[Sequence[Any]]) -> list[dict[str, Any]]:
+    """Convert rows to dicts, resolving the column names once.
+
+    map() keeps the per-row loop in C rather than a comprehension frame.
+    """
+    return list(map(dict, map(partial(zip, column_names(cursor)), rows)))
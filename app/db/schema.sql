@@ -55,6 +55,60 @@ CREATE TABLE IF NOT EXISTS ingestion_status (
     FOREIGN KEY (video_id) REFERENCES videos(video_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_ingestion_status ON ingestion_status(status);
+-- (status, created_at) also serves status-only lookups
+DROP INDEX IF EXISTS idx_ingestion_status;
+CREATE INDEX IF NOT EXISTS idx_ingestion_status_created ON ingestion_status(status, created_at);
 CREATE INDEX IF NOT EXISTS idx_ingestion_video_id ON ingestion_status(video_id);
 CREATE INDEX IF NOT EXISTS idx_ingestion_error_count ON ingestion_status(error_count);
+-- Retry queue: walked in updated_at order, error_count checked in the index
+CREATE INDEX IF NOT EXISTS idx_ingestion_failed_retry
+    ON ingestion_status(updated_at, error_count) WHERE status = 'failed';
+
+-- Queued ingestion jobs, run by scripts/ingestion_worker.py
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    result TEXT,
+    error_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_status ON ingestion_jobs(status, id);
+
+-- Per-status row counts for ingestion_status, kept current by triggers
+CREATE TABLE IF NOT EXISTS ingestion_status_counts (
+    status TEXT PRIMARY KEY,
+    n INTEGER NOT NULL DEFAULT 0
+);
+
+-- Backfill once for databases created before the counts table existed
+INSERT INTO ingestion_status_counts (status, n)
+SELECT status, COUNT(*) FROM ingestion_status
+WHERE NOT EXISTS (SELECT 1 FROM ingestion_status_counts)
+GROUP BY status;
+
+CREATE TRIGGER IF NOT EXISTS trg_ingestion_status_insert
+AFTER INSERT ON ingestion_status
+BEGIN
+    INSERT INTO ingestion_status_counts (status, n) VALUES (NEW.status, 1)
+    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ingestion_status_update
+AFTER UPDATE OF status ON ingestion_status
+WHEN OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE ingestion_status_counts SET n = n - 1 WHERE status = OLD.status;
+    INSERT INTO ingestion_status_counts (status, n) VALUES (NEW.status, 1)
+    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_ingestion_status_delete
+AFTER DELETE ON ingestion_status
+BEGIN
+    UPDATE ingestion_status_counts SET n = n - 1 WHERE status = OLD.status;
+END;
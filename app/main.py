@@ -1,57 +1,94 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import ingestion, search
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
 from app.db.connection import db
 from app.db.mongodb import mongodb
+from app.db.qdrant import qdrant
+from app.db.repositories.transcript import TranscriptRepository
 from app.services.embeddings import embedding_service
+from app.services.search import query_expander, sermon_search
 
 # Set up logging
 setup_logging()
 logger = get_logger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Application lifespan manager for startup/shutdown."""
-    # Startup
-    logger.info("application_starting", app_name=settings.app_name)
-
-    # Connect to database
+async def _connect_database() -> None:
+    """Connect to the database and initialize the schema if it is new."""
     await db.connect()
 
-    # Initialize schema if database is new
     try:
         await db.init_schema()
     except Exception as e:
         logger.warning("schema_init_skipped", reason=str(e))
 
-    # Connect to MongoDB (transcripts) - optional, app works without it
-    if settings.use_mongodb:
-        try:
-            await mongodb.connect()
-            await mongodb.ensure_indexes()
-        except Exception as e:
-            logger.warning("mongodb_connection_failed", error=str(e))
+
+async def _connect_mongodb() -> None:
+    """Connect to MongoDB (transcripts) - optional, app works without it."""
+    if not settings.use_mongodb:
+        return
+
+    try:
+        await mongodb.connect()
+        await mongodb.ensure_indexes()
+        await TranscriptRepository(mongodb.db).ensure_counters()
+    except Exception as e:
+        logger.warning("mongodb_connection_failed", error=str(e))
+
+
+async def _connect_qdrant() -> None:
+    """Open the Qdrant client so the first search doesn't pay the handshake."""
+    try:
+        await asyncio.to_thread(qdrant.ensure_collection)
+    except Exception as e:
+        logger.warning("qdrant_connection_failed", error=str(e))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan manager for startup/shutdown."""
+    # Startup
+    logger.info("application_starting", app_name=settings.app_name)
+
+    # Connect to all stores concurrently
+    await asyncio.gather(_connect_database(), _connect_mongodb(), _connect_qdrant())
 
     # Log embedding service info (Cohere API - no local model to preload)
     logger.info("embedding_service_ready", **embedding_service.get_model_info())
 
+    # Pin mood-search embeddings so mood requests skip expansion and embedding
+    try:
+        await sermon_search.warm_mood_queries()
+    except Exception as e:
+        logger.warning("mood_queries_warm_failed", error=str(e))
+
+    # Pick up jobs queued (or left running) before a restart
+    drain_task = None
+    if not settings.ingestion_external_worker:
+        drain_task = asyncio.create_task(ingestion.get_worker().drain())
+
     logger.info("application_started")
 
     yield
 
     # Shutdown
     logger.info("application_stopping")
+    if drain_task is not None:
+        drain_task.cancel()
     if mongodb.is_connected:
         await mongodb.disconnect()
+    await qdrant.close()
+    await query_expander.close()
     await db.disconnect()
     logger.info("application_stopped")
 
@@ -62,6 +99,7 @@ app = FastAPI(
     description="API for sermon recommendation based on emotional needs",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -48,3 +48,7 @@ class ChannelSyncRequest(BaseModel):
         default=True,
         description="Whether to transcribe audio after downloading",
     )
+    batched: bool = Field(
+        default=False,
+        description="Download all audio first, then transcribe in duration-sorted batches",
+    )
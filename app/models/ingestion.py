@@ -89,3 +89,7 @@ class RetryRequest(BaseModel):
         le=500,
         description="Maximum number of videos to retry",
     )
+    batched: bool = Field(
+        default=False,
+        description="Transcribe retried videos in duration-sorted batches",
+    )
@@ -1,7 +1,8 @@
 """Embedding services for sermon text."""
 
+from app.services.embeddings.batching import batching_embedder
 from app.services.embeddings.chunker import Chunk, chunk_text, estimate_chunk_count
 from app.services.embeddings.cleaner import clean_transcript
 from app.services.embeddings.embedding_service import embedding_service
 
-__all__ = ["embedding_service", "Chunk", "chunk_text", "estimate_chunk_count", "clean_transcript"]
+__all__ = ["embedding_service", "batching_embedder", "Chunk", "chunk_text", "estimate_chunk_count", "clean_transcript"]
@@ -0,0 +1,157 @@
+"""Coalesce concurrent embeddings into batched API calls."""
+
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+import structlog
+
+from app.core.config import settings
+from app.services.embeddings.cache import embedding_cache
+from app.services.embeddings.embedding_service import MAX_BATCH_SIZE, embedding_service
+
+logger = structlog.get_logger(__name__)
+
+EmbedFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+async def _embed_queries(texts: list[str]) -> list[list[float]]:
+    """Embed texts as search queries."""
+    return await embedding_service.embed(texts, input_type="search_query")
+
+
+async def _embed_documents(texts: list[str]) -> list[list[float]]:
+    """Embed texts as documents for indexing, reusing cached vectors."""
+    if not embedding_cache.enabled:
+        return await embedding_service.embed(texts, input_type="search_document")
+
+    keys = [embedding_cache.key(text) for text in texts]
+    vectors = await embedding_cache.get_many(keys)
+    missing = [i for i, key in enumerate(keys) if key not in vectors]
+    logger.debug("embedding_cache_lookup", texts=len(texts), hits=len(texts) - len(missing))
+
+    if missing:
+        embeddings = await embedding_service.embed(
+            [texts[i] for i in missing], input_type="search_document"
+        )
+        fresh = {keys[i]: embedding for i, embedding in zip(missing, embeddings)}
+        await embedding_cache.put_many(fresh)
+        vectors.update(fresh)
+
+    return [vectors[key] for key in keys]
+
+
+class BatchingEmbedder:
+    """Buffers query embeddings that arrive together and embeds them at once.
+
+    The first query in an empty buffer starts a short timer. When the timer
+    fires, or the buffer fills, all buffered queries go out in one call and
+    each caller gets its own vector back.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFn = _embed_queries,
+        max_batch_size: int | None = None,
+        window_ms: float | None = None,
+        cache_size: int = 0,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            embed: Async function embedding a list of texts
+            max_batch_size: Flush once this many queries are buffered
+            window_ms: Max time the first buffered query waits
+            cache_size: Recent query embeddings kept for embed_query (0: none)
+        """
+        self._embed = embed
+        self._max_batch_size = max_batch_size or settings.query_batch_max_size
+        self._window = (window_ms if window_ms is not None else settings.query_batch_window_ms) / 1000
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+
+    async def embed_query(self, text: str) -> list[float]:
+        """Embed one query, sharing the API call with concurrent queries."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts, sharing API calls with concurrent callers."""
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[list[float]]] = []
+
+        for text in texts:
+            future: asyncio.Future[list[float]] = loop.create_future()
+            futures.append(future)
+            self._pending.append((text, future))
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self) -> None:
+        """Send everything buffered so far as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        """Embed a batch and resolve each caller's future."""
+        # Identical queries in the same window share one input
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        logger.debug("query_batch_embedding", requests=len(batch), texts=len(texts))
+
+        try:
+            embeddings = await self._embed(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        if self._cache_size:
+            self._cache.update(by_text)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+
+# Global instances
+batching_embedder = BatchingEmbedder(cache_size=settings.query_embedding_cache_size)
+# Fills Cohere's 96-text batches with chunks from transcripts embedded concurrently
+document_batcher = BatchingEmbedder(
+    embed=_embed_documents,
+    max_batch_size=MAX_BATCH_SIZE,
+    window_ms=settings.document_batch_window_ms,
+)
@@ -0,0 +1,66 @@
+"""Persistent cache of document embeddings in MongoDB."""
+
+from array import array
+import hashlib
+
+from pymongo import UpdateOne
+import structlog
+
+from app.core.config import settings
+from app.db.mongodb import mongodb
+
+logger = structlog.get_logger(__name__)
+
+COLLECTION_NAME = "embedding_cache"
+
+
+class EmbeddingCache:
+    """Content-addressed store of document embeddings.
+
+    Keys hash the model name together with the text, so unchanged chunks are
+    never sent to Cohere twice and switching models never serves stale
+    vectors. Vectors are stored as raw float32 bytes.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is configured and MongoDB is reachable."""
+        return settings.embedding_cache_enabled and mongodb.is_connected
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Cache key for a text under the current embedding model."""
+        return hashlib.sha256(f"{settings.embedding_model}\0{text}".encode()).hexdigest()
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, returning only the keys that were found."""
+        try:
+            cursor = mongodb.db[COLLECTION_NAME].find({"_id": {"$in": keys}})
+            return {doc["_id"]: array("f", doc["vector"]).tolist() async for doc in cursor}
+        except Exception as e:
+            logger.warning("embedding_cache_get_failed", error=str(e))
+            return {}
+
+    async def put_many(self, vectors: dict[str, list[float]]) -> None:
+        """Store vectors by key, leaving existing entries untouched."""
+        if not vectors:
+            return
+
+        try:
+            await mongodb.db[COLLECTION_NAME].bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {"$setOnInsert": {"vector": array("f", vector).tobytes()}},
+                        upsert=True,
+                    )
+                    for key, vector in vectors.items()
+                ],
+                ordered=False,
+            )
+        except Exception as e:
+            logger.warning("embedding_cache_put_failed", error=str(e))
+
+
+# Global instance
+embedding_cache = EmbeddingCache()
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from app.core.config import settings
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """A chunk of text from a sermon transcript."""
 
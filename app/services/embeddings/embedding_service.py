@@ -1,24 +1,51 @@
 """Embedding service using Cohere API."""
 
+import asyncio
+import random
 from typing import Any, Literal
 
 import cohere
 import structlog
 
 from app.core.config import settings
+from app.services.embeddings.rate_limit import TokenBucket, estimate_tokens
 
 logger = structlog.get_logger(__name__)
 
-# Cohere batch limit
+# Cohere batch limit (texts per call). There is no per-call character cap;
+# each text is cut at the model's 512-token limit (truncate="END").
 MAX_BATCH_SIZE = 96
 
 
+# Longest wait between rate-limited retries
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Read the Retry-After header (in seconds) from a Cohere API error."""
+    headers = getattr(error, "headers", None) or {}
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                return None
+    return None
+
+
+def _float_embeddings(response: Any) -> list[list[float]]:
+    """Extract the float vectors from a Cohere embed response."""
+    return getattr(response.embeddings, "float_", None) or []
+
+
 class EmbeddingService:
     """Service for generating text embeddings using Cohere API."""
 
     def __init__(self):
         """Initialize the embedding service."""
         self._client: cohere.AsyncClient | None = None
+        self._sync_client: cohere.Client | None = None
+        self.rate_limiter = TokenBucket(settings.cohere_tokens_per_minute)
 
     @property
     def client(self) -> cohere.AsyncClient:
@@ -48,33 +75,62 @@ class EmbeddingService:
         if not texts:
             return []
 
-        all_embeddings: list[list[float]] = []
+        batches = [
+            texts[i : i + MAX_BATCH_SIZE] for i in range(0, len(texts), MAX_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(settings.cohere_concurrency)
 
-        # Process in batches
-        for i in range(0, len(texts), MAX_BATCH_SIZE):
-            batch = texts[i : i + MAX_BATCH_SIZE]
-            logger.debug(
-                "embedding_batch",
-                batch_num=i // MAX_BATCH_SIZE + 1,
-                batch_size=len(batch),
-            )
+        async def embed_batch(batch_num: int, batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                await self.rate_limiter.acquire(estimate_tokens(batch))
+                logger.debug("embedding_batch", batch_num=batch_num, batch_size=len(batch))
+                response = await self._embed_with_retry(batch, input_type)
 
-            response = await self.client.embed(
-                texts=batch,
-                model=settings.embedding_model,
-                input_type=input_type,
-                embedding_types=["float"],
-            )
+            return _float_embeddings(response)
 
-            # Extract float embeddings
-            embeddings = response.embeddings
-            if embeddings is not None and hasattr(embeddings, "float_"):
-                float_embeddings = embeddings.float_
-                if float_embeddings:
-                    all_embeddings.extend(float_embeddings)
+        # Batches run concurrently (bounded); gather keeps them in order
+        results = await asyncio.gather(
+            *(embed_batch(n, batch) for n, batch in enumerate(batches, 1))
+        )
 
+        all_embeddings: list[list[float]] = []
+        for embeddings in results:
+            all_embeddings.extend(embeddings)
         return all_embeddings
 
+    async def _embed_with_retry(
+        self,
+        batch: list[str],
+        input_type: Literal["search_document", "search_query"],
+    ) -> Any:
+        """Call Cohere embed, backing off on 429s.
+
+        Waits as long as the response's Retry-After header asks, or
+        exponentially (with jitter) when there is none, capped at
+        MAX_BACKOFF_SECONDS.
+        """
+        delay = 1.0
+        for attempt in range(settings.cohere_max_retries + 1):
+            try:
+                return await self.client.embed(
+                    texts=batch,
+                    model=settings.embedding_model,
+                    input_type=input_type,
+                    embedding_types=["float"],
+                    truncate="END",
+                )
+            except cohere.TooManyRequestsError as e:
+                if attempt == settings.cohere_max_retries:
+                    raise
+                retry_after = _retry_after(e)
+                wait = min(
+                    retry_after if retry_after is not None else delay + random.random(),
+                    MAX_BACKOFF_SECONDS,
+                )
+                logger.warning("cohere_rate_limited", attempt=attempt + 1, retry_in=round(wait, 1))
+                await asyncio.sleep(wait)
+                delay *= 2
+
     async def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed documents for indexing.
 
@@ -112,7 +168,7 @@ class EmbeddingService:
     def embed_sync(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings synchronously (for backwards compatibility).
 
-        Note: This creates a new sync client for each call. Prefer async methods.
+        Note: Uses a separate sync client (created once). Prefer async methods.
 
         Args:
             texts: List of texts to embed
@@ -123,10 +179,11 @@ class EmbeddingService:
         if not texts:
             return []
 
-        if not settings.cohere_api_key:
-            raise ValueError("COHERE_API_KEY is not configured")
-
-        sync_client = cohere.Client(api_key=settings.cohere_api_key)
+        if self._sync_client is None:
+            if not settings.cohere_api_key:
+                raise ValueError("COHERE_API_KEY is not configured")
+            self._sync_client = cohere.Client(api_key=settings.cohere_api_key)
+        sync_client = self._sync_client
         all_embeddings: list[list[float]] = []
 
         for i in range(0, len(texts), MAX_BATCH_SIZE):
@@ -137,13 +194,9 @@ class EmbeddingService:
                 model=settings.embedding_model,
                 input_type="search_document",
                 embedding_types=["float"],
+                truncate="END",
             )
-
-            embeddings = response.embeddings
-            if embeddings is not None and hasattr(embeddings, "float_"):
-                float_embeddings = embeddings.float_
-                if float_embeddings:
-                    all_embeddings.extend(float_embeddings)
+            all_embeddings.extend(_float_embeddings(response))
 
         return all_embeddings
 
@@ -1,7 +1,8 @@
 """Embedding pipeline for processing sermon transcripts."""
 
+import asyncio
+import hashlib
 from typing import Any
-from uuid import uuid4
 
 import structlog
 from qdrant_client.http.models import PointStruct
@@ -11,14 +12,30 @@ from app.db.mongodb import mongodb
 from app.db.qdrant import qdrant
 from app.db.repositories.transcript import TranscriptRepository
 from app.services.embeddings.chunker import Chunk, chunk_text
-from app.services.embeddings.cleaner import clean_transcript
-from app.services.embeddings.embedding_service import embedding_service
+from app.services.embeddings.cleaner import SOURCES_NEEDING_CLEANING, clean_transcript
+from app.services.embeddings.batching import document_batcher
+from app.services.embeddings.embedding_service import MAX_BATCH_SIZE
 
 logger = structlog.get_logger(__name__)
 
 # Batch size for Qdrant upserts
 UPSERT_BATCH_SIZE = 100
 
+# Length of the chunk excerpt stored alongside the text for search results
+EXCERPT_CHARS = 300
+
+# Qdrant integer point IDs must fit in an unsigned 64-bit int; keep them positive signed
+POINT_ID_MASK = (1 << 63) - 1
+
+
+def point_id(video_id: str, chunk_index: int) -> int:
+    """Deterministic Qdrant point ID for a transcript chunk.
+
+    Re-embedding a transcript overwrites its points instead of adding copies.
+    """
+    video_hash = int.from_bytes(hashlib.blake2b(video_id.encode(), digest_size=8).digest())
+    return (video_hash ^ chunk_index) & POINT_ID_MASK
+
 
 class EmbeddingPipeline:
     """Pipeline for embedding sermon transcripts and storing in Qdrant."""
@@ -52,8 +69,10 @@ class EmbeddingPipeline:
             logger.warning("transcript_empty", video_id=video_id)
             return {"video_id": video_id, "status": "empty", "chunks": 0}
 
-        # Clean the transcript (removes repetition from YouTube captions)
-        text = clean_transcript(text)
+        # Clean the transcript (removes repetition from YouTube captions);
+        # transcripts with no recorded source are treated as captions
+        if transcript_data.get("source", "youtube_captions") in SOURCES_NEEDING_CLEANING:
+            text = clean_transcript(text)
 
         # Chunk the text
         chunks = chunk_text(text, video_id)
@@ -62,14 +81,29 @@ class EmbeddingPipeline:
         if not chunks:
             return {"video_id": video_id, "status": "no_chunks", "chunks": 0}
 
-        # Embed chunks
-        chunk_texts = [c.text for c in chunks]
-        embeddings = await embedding_service.embed(chunk_texts)
-        logger.info("chunks_embedded", video_id=video_id, embeddings=len(embeddings))
+        # Embed and store one batch at a time; the next batch is embedded
+        # while the previous one is being upserted
+        upsert: asyncio.Task | None = None
+        embedded = 0
+
+        try:
+            for i in range(0, len(chunks), MAX_BATCH_SIZE):
+                batch = chunks[i : i + MAX_BATCH_SIZE]
+                embeddings = await document_batcher.embed_many([c.text for c in batch])
+                points = self._create_points(batch, embeddings, transcript_data)
+                embedded += len(embeddings)
+
+                if upsert is not None:
+                    await upsert
+                upsert = asyncio.create_task(self._upsert_points(points))
+
+            if upsert is not None:
+                await upsert
+        finally:
+            if upsert is not None and not upsert.done():
+                upsert.cancel()
 
-        # Store in Qdrant
-        points = self._create_points(chunks, embeddings, transcript_data)
-        await self._upsert_points(points)
+        logger.info("chunks_embedded", video_id=video_id, embeddings=embedded)
 
         return {
             "video_id": video_id,
@@ -94,14 +128,16 @@ class EmbeddingPipeline:
             List of PointStruct for Qdrant
         """
         points = []
+        # Hash the video ID once; point_id(video_id, i) == video_hash ^ i
+        video_hash = point_id(chunks[0].video_id, 0) if chunks else 0
 
         for chunk, embedding in zip(chunks, embeddings):
-            point_id = str(uuid4())
 
             payload = {
                 "video_id": chunk.video_id,
                 "chunk_index": chunk.chunk_index,
                 "text": chunk.text,
+                "text_preview": chunk.text[:EXCERPT_CHARS],
                 "start_word": chunk.start_word,
                 "end_word": chunk.end_word,
                 "source": transcript_data.get("source", "unknown"),
@@ -109,7 +145,7 @@ class EmbeddingPipeline:
 
             points.append(
                 PointStruct(
-                    id=point_id,
+                    id=video_hash ^ chunk.chunk_index,
                     vector=embedding,
                     payload=payload,
                 )
@@ -128,9 +164,10 @@ class EmbeddingPipeline:
         # Batch upserts
         for i in range(0, len(points), UPSERT_BATCH_SIZE):
             batch = points[i : i + UPSERT_BATCH_SIZE]
-            qdrant.client.upsert(
+            await qdrant.aclient.upsert(
                 collection_name=collection_name,
                 points=batch,
+                wait=False,  # Don't block on indexing; Qdrant applies writes in order
             )
             logger.debug(
                 "points_upserted",
@@ -179,61 +216,56 @@ class EmbeddingPipeline:
                 "total_chunks": 0,
             }
 
-        completed = 0
-        failed = 0
-        total_chunks = 0
-        results = []
-
-        for video_id in video_ids:
-            try:
-                result = await self.process_transcript(video_id)
-                results.append(result)
-
-                if result["status"] == "completed":
-                    completed += 1
-                    total_chunks += result["chunks"]
-                else:
-                    failed += 1
-
-            except Exception as e:
-                logger.error(
-                    "transcript_processing_failed",
-                    video_id=video_id,
-                    error=str(e),
-                )
-                failed += 1
-                results.append({
-                    "video_id": video_id,
-                    "status": "error",
-                    "error": str(e),
-                })
+        semaphore = asyncio.Semaphore(settings.pipeline_concurrency)
+
+        async def process_one(video_id: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.process_transcript(video_id)
+                except Exception as e:
+                    logger.error(
+                        "transcript_processing_failed",
+                        video_id=video_id,
+                        error=str(e),
+                    )
+                    return {
+                        "video_id": video_id,
+                        "status": "error",
+                        "error": str(e),
+                    }
+
+        results = await asyncio.gather(*(process_one(video_id) for video_id in video_ids))
+
+        completed = sum(1 for r in results if r["status"] == "completed")
+        failed = len(results) - completed
+        total_chunks = sum(r["chunks"] for r in results if r["status"] == "completed")
 
         summary = {
             "total": len(video_ids),
             "completed": completed,
             "failed": failed,
             "total_chunks": total_chunks,
-            "results": results,
+            "results": list(results),
         }
 
         logger.info("embedding_pipeline_completed", **{k: v for k, v in summary.items() if k != "results"})
         return summary
 
-    def delete_video_chunks(self, video_id: str) -> int:
+    async def delete_video_chunks(self, video_id: str) -> None:
         """Delete all chunks for a specific video.
 
+        Re-embedding overwrites a video's points in place (deterministic IDs),
+        so this is only needed when a transcript is removed or shrinks.
+
         Args:
             video_id: ID of the video
-
-        Returns:
-            Number of points deleted
         """
         from qdrant_client.http.models import Filter, FieldCondition, MatchValue
 
         collection_name = settings.qdrant_collection_name
 
-        # Delete by filter
-        result = qdrant.client.delete(
+        # Delete by filter (served by the video_id payload index)
+        await qdrant.aclient.delete(
             collection_name=collection_name,
             points_selector=Filter(
                 must=[
@@ -243,10 +275,10 @@ class EmbeddingPipeline:
                     )
                 ]
             ),
+            wait=False,
         )
 
         logger.info("video_chunks_deleted", video_id=video_id)
-        return result
 
 
 # Global instance
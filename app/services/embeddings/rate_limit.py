@@ -0,0 +1,52 @@
+"""Token-based rate limiting for the embedding API."""
+
+import asyncio
+import time
+
+# Cohere cuts every text at 512 tokens (truncate="END")
+MAX_TOKENS_PER_TEXT = 512
+
+
+def estimate_tokens(texts: list[str]) -> int:
+    """Roughly estimate the tokens a batch of texts will be billed for."""
+    return sum(min(len(text) // 4 + 1, MAX_TOKENS_PER_TEXT) for text in texts)
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at a per-minute rate.
+
+    Callers wait in arrival order until enough tokens have refilled, so
+    concurrent requests share the quota instead of bursting past it.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        """Initialize a full bucket.
+
+        Args:
+            tokens_per_minute: Refill rate and capacity (0: unlimited)
+        """
+        self._capacity = float(tokens_per_minute)
+        self._rate = tokens_per_minute / 60
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until the given number of tokens can be spent, then spend them."""
+        if self._rate <= 0:
+            return
+
+        # A request bigger than the whole bucket only has to wait for a full one
+        needed = min(float(tokens), self._capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                if self._tokens >= needed:
+                    self._tokens -= needed
+                    return
+                await asyncio.sleep((needed - self._tokens) / self._rate)
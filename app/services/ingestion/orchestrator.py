@@ -1,6 +1,7 @@
 """Ingestion orchestrator - coordinates the full ingestion pipeline."""
 
 import asyncio
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
@@ -17,18 +18,34 @@ from app.models.transcript import TranscriptCreate, TranscriptSegment
 from app.services.transcription import whisper_service
 from app.services.youtube import captions, downloader, metadata
 from app.services.youtube.exceptions import DownloadError, VideoUnavailableError
+from app.services.youtube.pacing import youtube_pacer
 
 logger = structlog.get_logger(__name__)
 
 
+# Log sync progress once per this many processed videos
+SYNC_PROGRESS_INTERVAL = 50
+
+
+@dataclass
+class SyncCounters:
+    """Per-video outcome counts shared by a channel sync's workers."""
+
+    total: int = 0
+    processed: int = 0
+    downloaded: int = 0
+    transcribed: int = 0
+    failed: int = 0
+
+
 class IngestionOrchestrator:
     """Orchestrates the sermon ingestion pipeline."""
 
     def __init__(self):
         """Initialize the orchestrator with database repositories."""
-        self.channel_repo = ChannelRepository(db.connection)
-        self.video_repo = VideoRepository(db.connection)
-        self.ingestion_repo = IngestionRepository(db.connection)
+        self.channel_repo = ChannelRepository(db.connection, reader=db)
+        self.video_repo = VideoRepository(db.connection, reader=db)
+        self.ingestion_repo = IngestionRepository(db.connection, reader=db)
 
     async def sync_channel(
         self,
@@ -36,6 +53,7 @@ class IngestionOrchestrator:
         max_videos: int | None = None,
         download: bool = True,
         transcribe: bool = True,
+        batched: bool = False,
     ) -> dict[str, Any]:
         """Sync videos from a YouTube channel.
 
@@ -44,6 +62,7 @@ class IngestionOrchestrator:
             max_videos: Maximum number of videos to fetch
             download: Whether to download audio
             transcribe: Whether to transcribe audio
+            batched: Download all audio first, then transcribe it in batches
 
         Returns:
             Summary of the sync operation
@@ -72,38 +91,51 @@ class IngestionOrchestrator:
         logger.info("videos_fetched", count=len(videos))
 
         # Process each video
-        videos_created = 0
-        videos_downloaded = 0
-        videos_transcribed = 0
         videos_failed = 0
 
         min_duration_seconds = settings.min_video_duration_minutes * 60
         videos_skipped = 0
 
+        # Downloads waiting for batched transcription
+        pending_audio: list[dict[str, Any]] = []
+
+        # Register new videos first so they can be written in one batch
+        new_videos: list[dict[str, Any]] = []
+        video_ids: list[str] = []
+
+        # Look up which videos are already stored in one query
+        existing_ids = await self.video_repo.get_ids_in(
+            [video_data["video_id"] for video_data in videos]
+        )
+
+        # Fetch full info for new videos with only flat data in one yt-dlp session
+        missing = [
+            video_data["video_id"]
+            for video_data in videos
+            if video_data["video_id"] not in existing_ids
+            and video_data.get("duration_seconds") is None
+        ]
+        try:
+            full_infos = await metadata.fetch_video_infos(missing)
+        except Exception as e:
+            logger.warning("video_infos_fetch_failed", count=len(missing), error=str(e))
+            full_infos = {}
+
         for video_data in videos:
             video_id = video_data["video_id"]
             video_data["channel_id"] = channel_id
 
             try:
                 # Check if video exists
-                existing = await self.video_repo.get_by_video_id(video_id)
-                if not existing:
-                    # Get full video info if we only have flat data
-                    if video_data.get("duration_seconds") is None:
-                        try:
-                            full_info = await metadata.fetch_video_info(video_id)
-                            video_data.update(full_info)
-                        except Exception as e:
-                            logger.warning(
-                                "video_info_fetch_failed",
-                                video_id=video_id,
-                                error=str(e),
-                            )
+                if video_id not in existing_ids:
+                    # Merge full video info if we only had flat data
+                    if video_id in full_infos:
+                        video_data.update(full_infos[video_id])
 
                     # Skip videos shorter than minimum duration
                     duration = video_data.get("duration_seconds") or 0
                     if duration < min_duration_seconds:
-                        logger.info(
+                        logger.debug(
                             "video_skipped_short_duration",
                             video_id=video_id,
                             duration_seconds=duration,
@@ -112,43 +144,9 @@ class IngestionOrchestrator:
                         videos_skipped += 1
                         continue
 
-                    await self.video_repo.create(video_data)
-                    videos_created += 1
+                    new_videos.append(video_data)
 
-                # Create ingestion status
-                await self.ingestion_repo.create(video_id)
-
-                # Try to get transcript
-                if transcribe:
-                    status = await self.ingestion_repo.get_by_video_id(video_id)
-                    if status and status["status"] in ("pending", "failed"):
-                        try:
-                            # First, try YouTube captions (fast, no download needed)
-                            caption_result = await self._get_captions(video_id)
-                            if caption_result:
-                                videos_transcribed += 1
-                            elif download:
-                                # No captions available, fall back to download + Whisper
-                                download_result = await self._download_video(video_id)
-                                if download_result:
-                                    videos_downloaded += 1
-                                    transcript_result = await self._transcribe_video(
-                                        video_id,
-                                        download_result["audio_path"],
-                                    )
-                                    if transcript_result:
-                                        videos_transcribed += 1
-
-                        except Exception as e:
-                            logger.error(
-                                "video_processing_failed",
-                                video_id=video_id,
-                                error=str(e),
-                            )
-                            videos_failed += 1
-
-                # Add delay between videos
-                await asyncio.sleep(settings.download_delay_seconds)
+                video_ids.append(video_id)
 
             except Exception as e:
                 logger.error(
@@ -158,6 +156,49 @@ class IngestionOrchestrator:
                 )
                 videos_failed += 1
 
+        # Write new videos and their ingestion status rows in bulk, falling
+        # back to one video at a time so a bad row only fails its own video
+        try:
+            await self.video_repo.bulk_upsert(new_videos)
+            await self.ingestion_repo.create_many(video_ids)
+            videos_created = len(new_videos)
+        except Exception as e:
+            logger.warning("video_bulk_write_failed", count=len(video_ids), error=str(e))
+            registered, videos_created = await self._register_videos(new_videos, video_ids)
+            videos_failed += len(video_ids) - len(registered)
+            video_ids = registered
+        status_map = await self.ingestion_repo.get_statuses_in(video_ids)
+
+        # Metadata already told us these have no English captions
+        no_captions = {
+            video_id for video_id, info in full_infos.items()
+            if not info["has_en_captions"]
+        }
+
+        # Process videos concurrently; YouTube requests are still spaced by
+        # the shared pacer, so concurrency doesn't raise the request rate
+        counters = SyncCounters(total=len(video_ids))
+        semaphore = asyncio.Semaphore(settings.ingest_concurrency)
+        audio_backlog = asyncio.Semaphore(settings.transcription_backlog)
+        await asyncio.gather(*(
+            self._process_video(
+                video_id, status_map.get(video_id), counters, pending_audio,
+                semaphore, audio_backlog,
+                try_captions=video_id not in no_captions,
+                download=download, transcribe=transcribe, batched=batched,
+            )
+            for video_id in video_ids
+        ))
+
+        videos_downloaded = counters.downloaded
+        videos_transcribed = counters.transcribed
+        videos_failed += counters.failed
+
+        if pending_audio:
+            transcribed = await self._transcribe_videos(pending_audio)
+            videos_transcribed += transcribed
+            videos_failed += len(pending_audio) - transcribed
+
         # Update channel last sync
         await self.channel_repo.update_last_sync(channel_id)
 
@@ -175,6 +216,132 @@ class IngestionOrchestrator:
         logger.info("channel_sync_completed", **summary)
         return summary
 
+    async def _register_videos(
+        self,
+        new_videos: list[dict[str, Any]],
+        video_ids: list[str],
+    ) -> tuple[list[str], int]:
+        """Write videos and their ingestion status rows one at a time.
+
+        Args:
+            new_videos: Videos not yet stored
+            video_ids: Every video to register for ingestion
+
+        Returns:
+            Tuple of (IDs registered successfully, new videos created)
+        """
+        new_by_id = {video_data["video_id"]: video_data for video_data in new_videos}
+        registered: list[str] = []
+        created = 0
+
+        for video_id in video_ids:
+            try:
+                if video_id in new_by_id:
+                    await self.video_repo.upsert(new_by_id[video_id])
+                    created += 1
+                await self.ingestion_repo.create(video_id)
+            except Exception as e:
+                db.connection.rollback()
+                logger.error("video_sync_failed", video_id=video_id, error=str(e))
+                continue
+            registered.append(video_id)
+
+        return registered, created
+
+    async def _process_video(
+        self,
+        video_id: str,
+        status: str | None,
+        counters: SyncCounters,
+        pending_audio: list[dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+        audio_backlog: asyncio.Semaphore,
+        try_captions: bool,
+        download: bool,
+        transcribe: bool,
+        batched: bool,
+    ) -> None:
+        """Fetch a transcript for one registered video during a channel sync.
+
+        Transcription runs after the worker gives up its slot, so the next
+        download overlaps with Whisper. A downloaded file must first take an
+        audio_backlog slot, which bounds how far downloads run ahead.
+
+        Args:
+            video_id: YouTube video ID
+            status: Current ingestion status of the video
+            counters: Outcome counts shared by the sync's workers
+            pending_audio: Downloads waiting for batched transcription
+            semaphore: Limits how many videos are processed at once
+            audio_backlog: Limits downloaded files waiting for transcription
+            try_captions: Whether the video may have YouTube captions
+            download: Whether to download audio
+            transcribe: Whether to transcribe audio
+            batched: Queue downloads for batched transcription
+        """
+        ready_audio: dict[str, Any] | None = None
+
+        async with semaphore:
+            try:
+                # Try to get transcript
+                if transcribe and status in ("pending", "failed"):
+                    await youtube_pacer.wait()
+                    try:
+                        # First, try YouTube captions (fast, no download needed)
+                        caption_result = (
+                            await self._get_captions(video_id) if try_captions else None
+                        )
+                        if caption_result:
+                            counters.transcribed += 1
+                        elif download:
+                            # No captions available, fall back to download + Whisper
+                            download_result = await self._download_video(video_id)
+                            if download_result:
+                                counters.downloaded += 1
+                                if batched:
+                                    pending_audio.append(download_result)
+                                else:
+                                    await audio_backlog.acquire()
+                                    ready_audio = download_result
+
+                    except Exception as e:
+                        logger.error(
+                            "video_processing_failed",
+                            video_id=video_id,
+                            error=str(e),
+                        )
+                        counters.failed += 1
+
+            except Exception as e:
+                logger.error(
+                    "video_sync_failed",
+                    video_id=video_id,
+                    error=str(e),
+                )
+                counters.failed += 1
+
+            counters.processed += 1
+            if counters.processed % SYNC_PROGRESS_INTERVAL == 0:
+                logger.info(
+                    "sync_progress",
+                    processed=counters.processed,
+                    total=counters.total,
+                    downloaded=counters.downloaded,
+                    transcribed=counters.transcribed,
+                    failed=counters.failed,
+                )
+
+        if ready_audio is not None:
+            try:
+                transcript_result = await self._transcribe_video(
+                    video_id,
+                    ready_audio["audio_path"],
+                )
+                if transcript_result:
+                    counters.transcribed += 1
+            finally:
+                audio_backlog.release()
+
     async def _download_video(self, video_id: str) -> dict[str, Any] | None:
         """Download audio for a video.
 
@@ -224,7 +391,7 @@ class IngestionOrchestrator:
                     video_id,
                     transcript_text=result["text"][:1000],  # Store preview only
                 )
-                logger.info(
+                logger.debug(
                     "captions_obtained",
                     video_id=video_id,
                     source="youtube_captions",
@@ -255,15 +422,7 @@ class IngestionOrchestrator:
             await self.ingestion_repo.set_transcribing(video_id)
 
             result = await whisper_service.transcribe(audio_path, video_id)
-
-            # Save to MongoDB
-            await self._save_transcript_to_mongodb(video_id, result)
-
-            await self.ingestion_repo.set_completed(
-                video_id,
-                transcript_text=result["text"][:1000],  # Store preview only
-            )
-
+            await self._complete_transcription(video_id, result)
             return result
 
         except Exception as e:
@@ -271,6 +430,60 @@ class IngestionOrchestrator:
             logger.error("transcription_failed", video_id=video_id, error=str(e))
             return None
 
+    async def _transcribe_videos(self, downloads: list[dict[str, Any]]) -> int:
+        """Transcribe downloaded audio in batches of similar length.
+
+        Files are sorted by size (a proxy for duration at a fixed bitrate) so
+        each batch holds audio of similar length.
+
+        Args:
+            downloads: Download results or ingestion rows with video_id,
+                audio_path and audio_size_bytes
+
+        Returns:
+            Number of videos transcribed successfully
+        """
+        ordered = sorted(downloads, key=lambda d: d.get("audio_size_bytes") or 0)
+        batch_size = settings.whisper_batch_size
+        transcribed = 0
+
+        for i in range(0, len(ordered), batch_size):
+            batch = ordered[i : i + batch_size]
+            for item in batch:
+                await self.ingestion_repo.set_transcribing(item["video_id"])
+
+            logger.info("transcription_batch_started", batch_size=len(batch))
+            results = await whisper_service.transcribe_batch(
+                [(item["audio_path"], item["video_id"]) for item in batch]
+            )
+
+            for item, result in zip(batch, results):
+                video_id = item["video_id"]
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    await self._complete_transcription(video_id, result)
+                    transcribed += 1
+                except Exception as e:
+                    await self.ingestion_repo.set_failed(video_id, str(e))
+                    logger.error("transcription_failed", video_id=video_id, error=str(e))
+
+        return transcribed
+
+    async def _complete_transcription(
+        self,
+        video_id: str,
+        result: dict[str, Any],
+    ) -> None:
+        """Persist a finished transcription and mark the video completed."""
+        # Save to MongoDB
+        await self._save_transcript_to_mongodb(video_id, result)
+
+        await self.ingestion_repo.set_completed(
+            video_id,
+            transcript_text=result["text"][:1000],  # Store preview only
+        )
+
     async def _save_transcript_to_mongodb(
         self,
         video_id: str,
@@ -292,7 +505,7 @@ class IngestionOrchestrator:
             logger.warning("video_not_found_for_transcript", video_id=video_id)
             return
 
-        channel = await self.channel_repo.get_by_channel_id(video["channel_id"])
+        channel = await self.channel_repo.get_by_channel_id(video.channel_id)
         channel_name = channel["channel_name"] if channel else "Unknown"
 
         # Build transcript segments
@@ -304,7 +517,7 @@ class IngestionOrchestrator:
         # Create transcript document
         transcript = TranscriptCreate(
             video_id=video_id,
-            channel_id=video["channel_id"],
+            channel_id=video.channel_id,
             channel_name=channel_name,
             source=result.get("source", "youtube_captions"),
             text=result.get("text", ""),
@@ -320,12 +533,14 @@ class IngestionOrchestrator:
         self,
         max_error_count: int = 3,
         limit: int = 100,
+        batched: bool = False,
     ) -> dict[str, Any]:
         """Retry failed ingestions.
 
         Args:
             max_error_count: Only retry videos with fewer errors
             limit: Maximum number of videos to retry
+            batched: Download missing audio first, then transcribe in batches
 
         Returns:
             Summary of retry operation
@@ -341,6 +556,9 @@ class IngestionOrchestrator:
 
         logger.info("retry_started", count=len(failed_videos))
 
+        if batched:
+            return await self._retry_failed_batched(failed_videos)
+
         retried = 0
         succeeded = 0
         failed = 0
@@ -363,6 +581,7 @@ class IngestionOrchestrator:
                         failed += 1
                 else:
                     # Need to download first
+                    await youtube_pacer.wait()
                     download_result = await self._download_video(video_id)
                     if download_result:
                         transcript_result = await self._transcribe_video(
@@ -376,8 +595,6 @@ class IngestionOrchestrator:
                     else:
                         failed += 1
 
-                await asyncio.sleep(settings.download_delay_seconds)
-
             except Exception as e:
                 logger.error("retry_failed", video_id=video_id, error=str(e))
                 failed += 1
@@ -386,6 +603,33 @@ class IngestionOrchestrator:
         logger.info("retry_completed", **summary)
         return summary
 
+    async def _retry_failed_batched(
+        self,
+        failed_videos: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Retry failed ingestions, transcribing all audio in batches."""
+        pending_audio: list[dict[str, Any]] = []
+        failed = 0
+
+        for status in failed_videos:
+            if status["audio_path"]:
+                pending_audio.append(status)
+                continue
+
+            await youtube_pacer.wait()
+            download_result = await self._download_video(status["video_id"])
+            if download_result:
+                pending_audio.append(download_result)
+            else:
+                failed += 1
+
+        succeeded = await self._transcribe_videos(pending_audio)
+        failed += len(pending_audio) - succeeded
+
+        summary = {"retried": len(failed_videos), "succeeded": succeeded, "failed": failed}
+        logger.info("retry_completed", **summary)
+        return summary
+
     async def get_stats(self) -> IngestionStats:
         """Get ingestion statistics.
 
@@ -408,10 +652,11 @@ class IngestionOrchestrator:
         Returns:
             Video data with ingestion status or None
         """
-        video = await self.video_repo.get_by_video_id(video_id)
-        if not video:
+        row = await self.video_repo.get_by_video_id(video_id)
+        if not row:
             return None
 
+        video = row.to_dict()
         status = await self.ingestion_repo.get_by_video_id(video_id)
         if status:
             video["ingestion_status"] = status
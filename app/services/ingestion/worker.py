@@ -0,0 +1,101 @@
+"""Worker that runs queued ingestion jobs outside the API process."""
+
+import asyncio
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+from app.db.connection import db
+from app.db.repositories.job import JobRepository
+from app.services.ingestion.orchestrator import IngestionOrchestrator
+
+logger = structlog.get_logger(__name__)
+
+SYNC_CHANNEL = "sync_channel"
+RETRY_FAILED = "retry_failed"
+
+
+class IngestionWorker:
+    """Polls the ingestion job queue and runs each job."""
+
+    def __init__(self):
+        """Initialize the worker with the job repository and orchestrator."""
+        self.job_repo = JobRepository(db.connection)
+        self.orchestrator = IngestionOrchestrator()
+        self._draining = False
+
+    async def run_job(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Run a claimed job.
+
+        Args:
+            job: Job record with job_type and payload
+
+        Returns:
+            The orchestrator's summary for the job
+        """
+        payload = job["payload"]
+
+        if job["job_type"] == SYNC_CHANNEL:
+            return await self.orchestrator.sync_channel(**payload)
+        if job["job_type"] == RETRY_FAILED:
+            return await self.orchestrator.retry_failed(**payload)
+
+        raise ValueError(f"Unknown job type: {job['job_type']}")
+
+    async def run_next(self) -> bool:
+        """Claim and run the next queued job.
+
+        Returns:
+            True if a job was run, False if the queue was empty
+        """
+        job = await self.job_repo.claim_next()
+        if job is None:
+            return False
+
+        logger.info("job_started", job_id=job["id"], job_type=job["job_type"])
+
+        try:
+            result = await self.run_job(job)
+        except Exception as e:
+            logger.error("job_failed", job_id=job["id"], error=str(e))
+            await self.job_repo.fail(job["id"], str(e))
+        else:
+            await self.job_repo.complete(job["id"], result)
+            logger.info("job_completed", job_id=job["id"])
+
+        return True
+
+    async def drain(self) -> None:
+        """Run queued jobs until the queue is empty.
+
+        Returns at once if a drain is already running in this process; that
+        drain picks up newly queued jobs before it stops.
+        """
+        if self._draining:
+            return
+
+        self._draining = True
+        try:
+            while await self.run_next():
+                pass
+        finally:
+            self._draining = False
+
+    async def run(self, once: bool = False) -> None:
+        """Run jobs until stopped.
+
+        Args:
+            once: Drain the queue and return instead of polling forever
+        """
+        logger.info("ingestion_worker_started")
+
+        while True:
+            ran = await self.run_next()
+            if ran:
+                continue
+            if once:
+                break
+            await asyncio.sleep(settings.worker_poll_interval_seconds)
+
+        logger.info("ingestion_worker_stopped")
@@ -0,0 +1,181 @@
+"""Result cache for sermon search."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import NAMESPACE_URL, uuid5
+
+import structlog
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
+    PointStruct,
+    Range,
+)
+
+from app.core.config import settings
+from app.db.qdrant import qdrant
+
+logger = structlog.get_logger(__name__)
+
+CacheKey = tuple[str, int, bool]
+
+
+class SearchCache:
+    """Two-level cache for search responses.
+
+    Exact repeats are served from an in-process LRU keyed on the normalized
+    query. Near-duplicates are looked up in a Qdrant collection of past query
+    embeddings and served when cosine similarity clears the threshold.
+    Expired points are pruned from Qdrant at most once per TTL.
+    """
+
+    def __init__(self):
+        """Initialize the cache."""
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._collection_ready = False
+        self._last_pruned = 0.0
+
+    @property
+    def collection_name(self) -> str:
+        """Qdrant collection holding cached query embeddings."""
+        return f"{settings.qdrant_collection_name}_query_cache"
+
+    @staticmethod
+    def _key(feeling: str, limit: int, expand_query: bool) -> CacheKey:
+        """Build a cache key, ignoring case and whitespace differences."""
+        return (" ".join(feeling.lower().split()), limit, expand_query)
+
+    def get(self, feeling: str, limit: int, expand_query: bool) -> dict[str, Any] | None:
+        """Get an exact-match cached response."""
+        key = self._key(feeling, limit, expand_query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        cached_at, response = entry
+        if time.monotonic() - cached_at > settings.search_cache_ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(
+        self,
+        feeling: str,
+        limit: int,
+        expand_query: bool,
+        response: dict[str, Any],
+    ) -> None:
+        """Store a response in the exact-match cache."""
+        key = self._key(feeling, limit, expand_query)
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.search_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    async def _ensure_collection(self) -> None:
+        """Create the query cache collection on first use."""
+        if not self._collection_ready:
+            await asyncio.to_thread(qdrant.ensure_collection, self.collection_name)
+            self._collection_ready = True
+
+    async def get_similar(
+        self,
+        embedding: list[float],
+        limit: int,
+        expand_query: bool,
+    ) -> dict[str, Any] | None:
+        """Get a cached response for a semantically similar query."""
+        try:
+            await self._ensure_collection()
+            result = await qdrant.aclient.query_points(
+                collection_name=self.collection_name,
+                query=embedding,
+                query_filter=Filter(
+                    must=[
+                        FieldCondition(key="limit", match=MatchValue(value=limit)),
+                        FieldCondition(key="expand_query", match=MatchValue(value=expand_query)),
+                        FieldCondition(
+                            key="cached_at",
+                            range=Range(gte=time.time() - settings.search_cache_ttl_seconds),
+                        ),
+                    ]
+                ),
+                score_threshold=settings.semantic_cache_threshold,
+                limit=1,
+                with_payload=["response"],
+            )
+        except Exception as e:
+            logger.warning("semantic_cache_lookup_failed", error=str(e))
+            return None
+
+        if not result.points or result.points[0].payload is None:
+            return None
+        return result.points[0].payload["response"]
+
+    async def put_similar(
+        self,
+        feeling: str,
+        embedding: list[float],
+        limit: int,
+        expand_query: bool,
+        response: dict[str, Any],
+    ) -> None:
+        """Store a response under its query embedding."""
+        key = self._key(feeling, limit, expand_query)
+        try:
+            await self._ensure_collection()
+            await qdrant.aclient.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    PointStruct(
+                        id=str(uuid5(NAMESPACE_URL, repr(key))),
+                        vector=embedding,
+                        payload={
+                            "limit": limit,
+                            "expand_query": expand_query,
+                            "cached_at": time.time(),
+                            "response": response,
+                        },
+                    )
+                ],
+                wait=False,
+            )
+            await self._prune_expired()
+        except Exception as e:
+            logger.warning("semantic_cache_store_failed", error=str(e))
+
+    async def _prune_expired(self) -> None:
+        """Delete cached query points older than the TTL (at most once per TTL)."""
+        now = time.time()
+        if now - self._last_pruned < settings.search_cache_ttl_seconds:
+            return
+
+        self._last_pruned = now
+        await qdrant.aclient.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(
+                    must=[
+                        FieldCondition(
+                            key="cached_at",
+                            range=Range(lt=now - settings.search_cache_ttl_seconds),
+                        )
+                    ]
+                )
+            ),
+            wait=False,
+        )
+
+    def clear(self) -> None:
+        """Drop all exact-match entries."""
+        self._entries.clear()
+
+
+# Global instance
+search_cache = SearchCache()
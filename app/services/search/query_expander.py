@@ -1,17 +1,15 @@
 """LLM-based query expansion for mood-to-sermon matching."""
 
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 
+from groq import AsyncGroq
+import httpx
 import structlog
-from groq import Groq
 
 from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=2)
-
 SYSTEM_PROMPT = """You are a helpful assistant that transforms how someone is feeling into search terms for finding relevant Christian sermons.
 
 Given a user's emotional state or feeling, generate search terms that describe what KIND of sermon content would HELP them - not content about their problem, but content that provides the SOLUTION.
@@ -35,19 +33,34 @@ class QueryExpander:
 
     def __init__(self):
         """Initialize the query expander."""
-        self._client: Groq | None = None
+        self._client: AsyncGroq | None = None
+        # Normalized feeling -> expansion, least recently used first
+        self._cache: OrderedDict[str, str] = OrderedDict()
 
     @property
-    def client(self) -> Groq:
-        """Get the Groq client, creating if needed."""
+    def client(self) -> AsyncGroq:
+        """Get the Groq client, creating if needed.
+
+        The client keeps a pool of HTTP/2 keep-alive connections, so
+        concurrent searches reuse TLS sessions.
+        """
         if self._client is None:
             if not settings.groq_api_key:
                 raise ValueError("GROQ_API_KEY not configured")
-            self._client = Groq(api_key=settings.groq_api_key)
+            self._client = AsyncGroq(
+                api_key=settings.groq_api_key,
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=settings.groq_max_connections,
+                        max_keepalive_connections=settings.groq_max_keepalive_connections,
+                    ),
+                ),
+            )
         return self._client
 
-    def expand_sync(self, user_feeling: str) -> str:
-        """Expand user feeling into search terms synchronously.
+    async def expand(self, user_feeling: str) -> str:
+        """Expand user feeling into search terms.
 
         Args:
             user_feeling: How the user is feeling
@@ -55,10 +68,16 @@ class QueryExpander:
         Returns:
             Expanded search terms for finding helpful sermons
         """
+        key = " ".join(user_feeling.lower().split())
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
         logger.info("expanding_query", input=user_feeling[:100])
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=settings.groq_model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
@@ -71,6 +90,10 @@ class QueryExpander:
             expanded = response.choices[0].message.content.strip()
             logger.info("query_expanded", input=user_feeling[:50], output=expanded[:100])
 
+            self._cache[key] = expanded
+            while len(self._cache) > settings.query_expansion_cache_size:
+                self._cache.popitem(last=False)
+
             return expanded
 
         except Exception as e:
@@ -83,22 +106,11 @@ class QueryExpander:
             )
             return user_feeling
 
-    async def expand(self, user_feeling: str) -> str:
-        """Expand user feeling into search terms asynchronously.
-
-        Args:
-            user_feeling: How the user is feeling
-
-        Returns:
-            Expanded search terms for finding helpful sermons
-        """
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            _executor,
-            self.expand_sync,
-            user_feeling,
-        )
-        return result
+    async def close(self) -> None:
+        """Close the Groq client and its connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
 
 # Global instance
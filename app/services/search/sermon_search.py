@@ -1,22 +1,128 @@
 """Sermon search service combining query expansion and vector search."""
 
+import asyncio
+import os
+from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
+from qdrant_client.http.models import SearchParams
 
 from app.core.config import settings
 from app.db.connection import db
-from app.db.qdrant import qdrant
+from app.db.qdrant import qdrant, quantization_search_params
 from app.db.repositories.video import VideoRepository
-from app.services.embeddings import embedding_service
+from app.services.embeddings import batching_embedder, embedding_service
+from app.services.embeddings.pipeline import EXCERPT_CHARS
+from app.services.search.cache import search_cache
 from app.services.search.query_expander import query_expander
 
 logger = structlog.get_logger(__name__)
 
+YOUTUBE_WATCH_URL = "https://www.youtube.com/watch?v="
+
+# Predefined mood mappings for common categories
+MOOD_PROMPTS = {
+    "anxious": "I'm feeling anxious and worried about the future",
+    "sad": "I'm feeling sad and going through a difficult time",
+    "grieving": "I'm grieving and dealing with loss",
+    "lost": "I feel lost and confused about my purpose",
+    "angry": "I'm feeling angry and frustrated",
+    "grateful": "I'm feeling grateful and want to praise God",
+    "hopeless": "I'm feeling hopeless and need encouragement",
+    "fearful": "I'm feeling fearful and need courage",
+    "lonely": "I'm feeling lonely and isolated",
+    "overwhelmed": "I'm feeling overwhelmed and stressed",
+}
+
 
 class SermonSearchService:
     """Search service for finding sermons based on user feelings."""
 
+    def __init__(self):
+        """Initialize the search service."""
+        # mood -> (expanded query, query embedding), filled at startup
+        self._mood_queries: dict[str, tuple[str, list[float]]] = {}
+
+    async def warm_mood_queries(self) -> None:
+        """Expand and embed every predefined mood prompt once.
+
+        Mood searches then skip the LLM expansion and embedding calls. The
+        result is saved to disk and reused on restart while the prompts and
+        models are unchanged.
+        """
+        saved = await asyncio.to_thread(self._load_mood_queries)
+        if saved is not None:
+            self._mood_queries = saved
+            logger.info("mood_queries_loaded", count=len(saved))
+            return
+
+        moods = list(MOOD_PROMPTS)
+        expanded = await asyncio.gather(
+            *(query_expander.expand(MOOD_PROMPTS[mood]) for mood in moods)
+        )
+        embeddings = await embedding_service.embed(list(expanded), input_type="search_query")
+        if len(embeddings) != len(moods):
+            logger.warning("mood_queries_warm_failed", embedded=len(embeddings))
+            return
+
+        self._mood_queries = {
+            mood: (query, embedding)
+            for mood, query, embedding in zip(moods, expanded, embeddings)
+        }
+        logger.info("mood_queries_warmed", count=len(self._mood_queries))
+
+        # Don't pin the raw prompts an LLM failure falls back to
+        if all(query != MOOD_PROMPTS[mood] for mood, query in zip(moods, expanded)):
+            await asyncio.to_thread(self._save_mood_queries)
+
+    @staticmethod
+    def _mood_queries_version() -> dict[str, Any]:
+        """Inputs that warmed mood queries depend on."""
+        return {
+            "prompts": MOOD_PROMPTS,
+            "groq_model": settings.groq_model,
+            "embedding_model": settings.embedding_model,
+        }
+
+    def _load_mood_queries(self) -> dict[str, tuple[str, list[float]]] | None:
+        """Load saved mood queries if they were warmed from the same inputs."""
+        if not settings.mood_queries_cache_path:
+            return None
+
+        try:
+            data = orjson.loads(Path(settings.mood_queries_cache_path).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("mood_queries_load_failed", error=str(e))
+            return None
+
+        if data.get("version") != self._mood_queries_version():
+            return None
+        return {mood: (query, embedding) for mood, (query, embedding) in data["moods"].items()}
+
+    def _save_mood_queries(self) -> None:
+        """Save warmed mood queries for the next startup."""
+        if not settings.mood_queries_cache_path:
+            return
+
+        path = Path(settings.mood_queries_cache_path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                orjson.dumps({
+                    "version": self._mood_queries_version(),
+                    "moods": self._mood_queries,
+                })
+            )
+            # Swap in the complete file so a crash never leaves a partial one
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("mood_queries_save_failed", error=str(e))
+
     async def search(
         self,
         user_feeling: str,
@@ -35,69 +141,149 @@ class SermonSearchService:
         """
         logger.info("sermon_search_started", feeling=user_feeling[:100], limit=limit)
 
-        # Step 1: Expand query using LLM (if enabled)
-        if expand_query:
-            search_query = await query_expander.expand(user_feeling)
-        else:
-            search_query = user_feeling
+        # Step 0: Serve repeated and near-duplicate queries from cache
+        cached = search_cache.get(user_feeling, limit, expand_query)
+        if cached is not None:
+            logger.info("sermon_search_cache_hit", feeling=user_feeling[:50])
+            return cached
+
+        # Step 1: Expand query using LLM (if enabled), overlapping with the
+        # semantic cache lookup
+        expansion = (
+            asyncio.create_task(query_expander.expand(user_feeling))
+            if expand_query
+            else None
+        )
+
+        # With expansion on, a semantic-cache miss costs one extra Cohere embed
+        # (the raw feeling), traded for skipping the LLM call on a hit
+        feeling_embedding = None
+        if settings.semantic_cache_enabled:
+            try:
+                feeling_embedding = await batching_embedder.embed_query(user_feeling)
+                cached = await search_cache.get_similar(feeling_embedding, limit, expand_query)
+            except BaseException:
+                if expansion is not None:
+                    expansion.cancel()
+                raise
+
+            if cached is not None:
+                logger.info("sermon_search_semantic_cache_hit", feeling=user_feeling[:50])
+                if expansion is not None:
+                    expansion.cancel()
+                # The cached expansion was written for the other query
+                response = {**cached, "query": user_feeling, "expanded_query": None}
+                search_cache.put(user_feeling, limit, expand_query, response)
+                return response
 
-        # Step 2: Embed the search query
-        query_embedding = await embedding_service.embed_single(search_query)
+        search_query = await expansion if expansion is not None else user_feeling
+
+        # Step 2: Embed the search query (reusing the feeling embedding if unexpanded)
+        if feeling_embedding is not None and not expand_query:
+            query_embedding = feeling_embedding
+        else:
+            query_embedding = await batching_embedder.embed_query(search_query)
         logger.info("query_embedded", dimensions=len(query_embedding))
 
-        # Step 3: Search Qdrant for matching chunks
-        search_results = qdrant.client.query_points(
+        response = await self._search_embedding(
+            user_feeling,
+            search_query if expand_query else None,
+            query_embedding,
+            limit,
+        )
+
+        search_cache.put(user_feeling, limit, expand_query, response)
+        if feeling_embedding is not None:
+            await search_cache.put_similar(user_feeling, feeling_embedding, limit, expand_query, response)
+
+        return response
+
+    async def _search_embedding(
+        self,
+        user_feeling: str,
+        expanded_query: str | None,
+        query_embedding: list[float],
+        limit: int,
+    ) -> dict[str, Any]:
+        """Run the vector search and enrichment for an embedded query.
+
+        Args:
+            user_feeling: Original user input, echoed in the response
+            expanded_query: LLM-expanded query, if expansion was used
+            query_embedding: Embedding of the search query
+            limit: Maximum number of results to return
+
+        Returns:
+            Search results with sermons and metadata
+        """
+        # Step 3: Search Qdrant for the best chunk per video above the
+        # relevance threshold (grouped and filtered server-side)
+        search_results = await qdrant.aclient.query_points_groups(
             collection_name=settings.qdrant_collection_name,
             query=query_embedding,
-            limit=limit * 3,  # Get more chunks, then dedupe by video
+            group_by="video_id",
+            group_size=1,
+            limit=limit,
+            score_threshold=settings.min_relevance_score,
+            with_payload=["text_preview", "chunk_index"],
+            search_params=SearchParams(
+                hnsw_ef=settings.qdrant_hnsw_ef,
+                exact=False,
+                quantization=quantization_search_params(),
+            ),
         )
 
-        # Step 4: Deduplicate by video and get top results (filter by relevance)
+        # Step 4: Take the top chunk of each video group
+        hits = [(group.id, group.hits[0]) for group in search_results.groups if group.hits]
+
+        # Points indexed before text_preview existed need their full text
+        legacy_ids = [hit.id for _, hit in hits if "text_preview" not in hit.payload]
+        legacy_text: dict[Any, str] = {}
+        if legacy_ids:
+            legacy_points = await qdrant.aclient.retrieve(
+                collection_name=settings.qdrant_collection_name,
+                ids=legacy_ids,
+                with_payload=["text"],
+            )
+            legacy_text = {
+                point.id: point.payload["text"][:EXCERPT_CHARS] for point in legacy_points
+            }
+
+        unique_results = [
+            {
+                "video_id": video_id,
+                "score": hit.score,
+                "matching_text": hit.payload.get("text_preview") or legacy_text.get(hit.id, ""),
+                "chunk_index": hit.payload["chunk_index"],
+            }
+            for video_id, hit in hits
+        ]
         logger.info(
             "qdrant_raw_results",
-            count=len(search_results.points),
-            top_scores=[p.score for p in search_results.points[:5]] if search_results.points else [],
+            count=len(unique_results),
+            top_scores=[result["score"] for result in unique_results[:5]],
         )
-        seen_videos = set()
-        unique_results = []
-
-        for point in search_results.points:
-            # Skip results below minimum relevance threshold
-            if point.score < settings.min_relevance_score:
-                continue
-
-            video_id = point.payload["video_id"]
-            if video_id not in seen_videos:
-                seen_videos.add(video_id)
-                unique_results.append({
-                    "video_id": video_id,
-                    "score": point.score,
-                    "matching_text": point.payload["text"],
-                    "chunk_index": point.payload["chunk_index"],
-                })
-
-                if len(unique_results) >= limit:
-                    break
 
         # Step 5: Enrich with video metadata from SQLite
-        video_repo = VideoRepository(db.connection)
-        enriched_results = []
-
-        for result in unique_results:
-            video = await video_repo.get_by_video_id(result["video_id"])
-            if video:
-                description = video.get("description") or ""
-                enriched_results.append({
-                    "video_id": result["video_id"],
-                    "title": video.get("title") or "Untitled",
-                    "description": description[:200] if description else "",
-                    "duration_seconds": video.get("duration_seconds"),
-                    "published_at": video.get("published_at"),
-                    "thumbnail_url": video.get("thumbnail_url"),
-                    "youtube_url": f"https://www.youtube.com/watch?v={result['video_id']}",
-                    "relevance_score": round(result["score"], 3),
-                    "matching_excerpt": result["matching_text"][:300] + "...",
-                })
+        video_repo = VideoRepository(db.connection, reader=db)
+        videos = await video_repo.get_many_by_video_ids(
+            [result["video_id"] for result in unique_results]
+        )
+        enriched_results = [
+            {
+                "video_id": result["video_id"],
+                "title": video.title or "Untitled",
+                "description": (video.description or "")[:200],
+                "duration_seconds": video.duration_seconds,
+                "published_at": video.published_at,
+                "thumbnail_url": video.thumbnail_url,
+                "youtube_url": YOUTUBE_WATCH_URL + result["video_id"],
+                "relevance_score": round(result["score"], 3),
+                "matching_excerpt": result["matching_text"] + "...",
+            }
+            for result in unique_results
+            if (video := videos.get(result["video_id"])) is not None
+        ]
 
         logger.info(
             "sermon_search_completed",
@@ -107,7 +293,7 @@ class SermonSearchService:
 
         return {
             "query": user_feeling,
-            "expanded_query": search_query if expand_query else None,
+            "expanded_query": expanded_query,
             "results": enriched_results,
             "total_results": len(enriched_results),
         }
@@ -126,21 +312,14 @@ class SermonSearchService:
         Returns:
             Search results
         """
-        # Predefined mood mappings for common categories
-        mood_prompts = {
-            "anxious": "I'm feeling anxious and worried about the future",
-            "sad": "I'm feeling sad and going through a difficult time",
-            "grieving": "I'm grieving and dealing with loss",
-            "lost": "I feel lost and confused about my purpose",
-            "angry": "I'm feeling angry and frustrated",
-            "grateful": "I'm feeling grateful and want to praise God",
-            "hopeless": "I'm feeling hopeless and need encouragement",
-            "fearful": "I'm feeling fearful and need courage",
-            "lonely": "I'm feeling lonely and isolated",
-            "overwhelmed": "I'm feeling overwhelmed and stressed",
-        }
+        mood = mood.lower()
+        feeling = MOOD_PROMPTS.get(mood, f"I'm feeling {mood}")
+
+        pinned = self._mood_queries.get(mood)
+        if pinned is not None:
+            expanded_query, query_embedding = pinned
+            return await self._search_embedding(feeling, expanded_query, query_embedding, limit)
 
-        feeling = mood_prompts.get(mood.lower(), f"I'm feeling {mood}")
         return await self.search(feeling, limit=limit)
 
 
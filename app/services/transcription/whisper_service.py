@@ -2,8 +2,8 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
-from typing import Any
+import os
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -11,64 +11,163 @@ from app.core.config import settings
 from app.services.transcription.exceptions import (
     AudioFileNotFoundError,
     ModelLoadError,
+    TranscriptionError,
     TranscriptionFailedError,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = structlog.get_logger(__name__)
 
-# Thread pool for running Whisper (which is synchronous/GPU-bound)
-_executor = ThreadPoolExecutor(max_workers=1)  # Whisper is memory-intensive
+# Thread pool for running Whisper (which is synchronous/GPU-bound). One worker:
+# each call already uses every core, so a second would only oversubscribe them
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
+# Decodes the next file of a batch while the model works on the current one
+_decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-decode")
 
-# Lazy-loaded Whisper model
+# Sample rate Whisper models expect
+SAMPLE_RATE = 16000
+
+# Lazy-loaded faster-whisper pipeline
 _model = None
 
+# Transcription requests waiting to be batched by transcribe()
+_pending: list[tuple[str, str, asyncio.Future[dict[str, Any]]]] = []
+_timer: asyncio.TimerHandle | None = None
+_tasks: set[asyncio.Task] = set()
+
+
+def _resolve_device() -> tuple[str, str]:
+    """Pick the CTranslate2 device and compute type from settings."""
+    device = settings.whisper_device
+    if device == "auto":
+        import ctranslate2
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    compute_type = settings.whisper_compute_type
+    if compute_type is None:
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+
+    return device, compute_type
+
 
 def _get_model():
-    """Load the Whisper model lazily."""
+    """Load the faster-whisper model lazily (once per process)."""
     global _model
     if _model is None:
         try:
-            import whisper
-
-            logger.info("loading_whisper_model", model=settings.whisper_model)
-            _model = whisper.load_model(settings.whisper_model)
+            from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+            device, compute_type = _resolve_device()
+            logger.info(
+                "loading_whisper_model",
+                model=settings.whisper_model,
+                device=device,
+                compute_type=compute_type,
+                flash_attention=device == "cuda" and settings.whisper_flash_attention,
+            )
+            model = WhisperModel(
+                settings.whisper_model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=settings.whisper_cpu_threads or os.cpu_count() or 0,
+                flash_attention=device == "cuda" and settings.whisper_flash_attention,
+            )
+            _model = BatchedInferencePipeline(model=model)
             logger.info("whisper_model_loaded", model=settings.whisper_model)
         except Exception as e:
             raise ModelLoadError(f"Failed to load Whisper model: {e}") from e
     return _model
 
 
-def _transcribe_sync(audio_path: str, video_id: str) -> dict[str, Any]:
-    """Synchronous transcription implementation."""
-    audio_file = Path(audio_path)
-    if not audio_file.exists():
-        raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
+def _load_and_warm_up() -> None:
+    """Load the model and run one second of silence through it.
+
+    The first decode initializes device kernels and buffers; doing it here
+    keeps that cost off the first real transcription.
+    """
+    import numpy as np
+
+    pipeline = _get_model()
+    try:
+        segments, _ = pipeline.model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language="en",
+            beam_size=settings.whisper_beam_size,
+        )
+        for _ in segments:
+            pass
+        logger.info("whisper_model_warmed_up")
+    except Exception as e:
+        logger.warning("whisper_warm_up_failed", error=str(e))
+
+
+async def load_model() -> None:
+    """Load and warm up the model ahead of the first transcription."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_executor, _load_and_warm_up)
+
+
+def _decode_audio(audio_path: str) -> "np.ndarray":
+    """Decode an audio file to 16 kHz mono float32 samples."""
+    from faster_whisper import decode_audio
+
+    try:
+        return decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+    except FileNotFoundError as e:
+        raise AudioFileNotFoundError(f"Audio file not found: {audio_path}") from e
+    except Exception as e:
+        raise TranscriptionFailedError(f"Failed to decode audio: {e}") from e
+
+
+def _transcribe_sync(
+    audio_path: str,
+    video_id: str,
+    audio: "np.ndarray | None" = None,
+) -> dict[str, Any]:
+    """Synchronous transcription implementation.
+
+    Args:
+        audio_path: Path to the audio file
+        video_id: YouTube video ID
+        audio: Samples already decoded from audio_path, if any
+    """
+    if audio is None:
+        audio = _decode_audio(audio_path)
 
     try:
         model = _get_model()
 
         logger.info("transcription_started", video_id=video_id, audio_path=audio_path)
 
-        # Transcribe the audio
-        result = model.transcribe(
-            str(audio_file),
+        # Transcribe the audio (segments are decoded lazily as we iterate).
+        # Silero VAD drops silence before decoding; segment timestamps stay
+        # on the original audio timeline
+        segments, info = model.transcribe(
+            audio,
             language="en",  # Assume English for sermons
-            verbose=False,
+            beam_size=settings.whisper_beam_size,
+            vad_filter=True,
+            vad_parameters={
+                "min_silence_duration_ms": settings.whisper_vad_min_silence_ms,
+                "speech_pad_ms": settings.whisper_vad_speech_pad_ms,
+            },
+            batch_size=settings.whisper_inference_batch_size,
         )
 
-        # Extract text and segments
-        full_text = result.get("text", "").strip()
-        segments = result.get("segments", [])
-
         # Format segments with timestamps
         formatted_segments = [
             {
-                "start": seg.get("start"),
-                "end": seg.get("end"),
-                "text": seg.get("text", "").strip(),
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text.strip(),
             }
             for seg in segments
         ]
+        full_text = " ".join(seg["text"] for seg in formatted_segments)
 
         logger.info(
             "transcription_completed",
@@ -83,7 +182,7 @@ def _transcribe_sync(audio_path: str, video_id: str) -> dict[str, Any]:
             "source": "whisper",
             "text": full_text,
             "segments": formatted_segments,
-            "language": result.get("language", "en"),
+            "language": info.language,
         }
 
     except Exception as e:
@@ -95,6 +194,9 @@ def _transcribe_sync(audio_path: str, video_id: str) -> dict[str, Any]:
 async def transcribe(audio_path: str, video_id: str) -> dict[str, Any]:
     """Transcribe an audio file asynchronously.
 
+    Requests arriving within a short window of each other are sent to the
+    model in one executor hop, so concurrent callers keep it busy.
+
     Args:
         audio_path: Path to the audio file
         video_id: YouTube video ID for naming the output
@@ -102,12 +204,101 @@ async def transcribe(audio_path: str, video_id: str) -> dict[str, Any]:
     Returns:
         Dictionary with transcript_path, transcript_text, segments, language
     """
-    loop = asyncio.get_event_loop()
+    global _timer
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[dict[str, Any]] = loop.create_future()
+    _pending.append((audio_path, video_id, future))
+
+    if len(_pending) >= settings.whisper_batch_size:
+        _flush()
+    elif _timer is None:
+        _timer = loop.call_later(settings.whisper_batch_window_ms / 1000, _flush)
+
+    return await future
+
+
+def _flush() -> None:
+    """Send every buffered transcription request as one batch."""
+    global _timer, _pending
+    if _timer is not None:
+        _timer.cancel()
+        _timer = None
+
+    batch, _pending = _pending, []
+    if batch:
+        task = asyncio.get_running_loop().create_task(_run_batch(batch))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+async def _run_batch(
+    batch: list[tuple[str, str, asyncio.Future[dict[str, Any]]]],
+) -> None:
+    """Transcribe a batch and resolve each caller's future."""
+    try:
+        results = await transcribe_batch(
+            [(audio_path, video_id) for audio_path, video_id, _ in batch]
+        )
+    except Exception as e:
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for (_, _, future), result in zip(batch, results):
+        if future.done():
+            continue
+        if isinstance(result, TranscriptionError):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+def _transcribe_batch_sync(
+    items: list[tuple[str, str]],
+) -> list[dict[str, Any] | TranscriptionError]:
+    """Transcribe several audio files in one executor hop.
+
+    The model is loaded once for the whole batch. Per-file failures are
+    returned in place of the result so one bad file doesn't sink the batch.
+    """
+    results: list[dict[str, Any] | TranscriptionError] = []
+
+    # Decode the next file while the current one is transcribed. Only one
+    # file is decoded ahead: an hour of 16 kHz float32 audio is ~230 MB
+    next_audio = _decode_executor.submit(_decode_audio, items[0][0]) if items else None
+    for i, (audio_path, video_id) in enumerate(items):
+        audio = next_audio
+        assert audio is not None  # Submitted before its turn for every item
+        next_audio = (
+            _decode_executor.submit(_decode_audio, items[i + 1][0])
+            if i + 1 < len(items)
+            else None
+        )
+        try:
+            results.append(_transcribe_sync(audio_path, video_id, audio.result()))
+        except TranscriptionError as e:
+            results.append(e)
+    return results
+
+
+async def transcribe_batch(
+    items: list[tuple[str, str]],
+) -> list[dict[str, Any] | TranscriptionError]:
+    """Transcribe a batch of audio files asynchronously.
+
+    Args:
+        items: List of (audio_path, video_id) tuples
+
+    Returns:
+        One entry per item, in order: the transcript dict, or the
+        TranscriptionError raised for that file
+    """
+    loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(
         _executor,
-        _transcribe_sync,
-        audio_path,
-        video_id,
+        _transcribe_batch_sync,
+        items,
     )
     return result
 
@@ -3,21 +3,34 @@
 import asyncio
 import re
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import structlog
-import yt_dlp
 
 from app.core.config import settings
+from app.services.youtube.ydl import shared_ydl
 
 logger = structlog.get_logger(__name__)
 
-_executor = ThreadPoolExecutor(max_workers=2)
+# One thread per sync worker, so caption fetches don't queue behind each other
+_executor = ThreadPoolExecutor(
+    max_workers=settings.ingest_concurrency, thread_name_prefix="captions"
+)
 
+# Cue timing line: 00:00:00.000 --> 00:00:05.000
+_TIMESTAMP_RE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2}\.\d{3}) --> (\d{2}):(\d{2}):(\d{2}\.\d{3})'
+)
+# Inline tags like <c> </c> and bracketed cues like [Music]
+_TAG_RE = re.compile(r'<[^>]+>|\[.*?\]')
+_HEADER_PREFIXES = ('WEBVTT', 'Kind:', 'Language:')
 
+
+@lru_cache(maxsize=1)
 def _get_transcripts_dir() -> Path:
-    """Get and ensure transcripts directory exists."""
+    """Get the transcripts directory, creating it on first use."""
     transcripts_dir = settings.transcripts_path
     transcripts_dir.mkdir(parents=True, exist_ok=True)
     return transcripts_dir
@@ -29,45 +42,31 @@ def _parse_vtt_to_text(vtt_content: str) -> tuple[str, list[dict[str, Any]]]:
     Returns:
         Tuple of (full_text, segments)
     """
-    lines = vtt_content.split('\n')
     segments = []
     current_segment = None
 
-    # Regex for timestamp line: 00:00:00.000 --> 00:00:05.000
-    timestamp_pattern = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})')
-
-    for line in lines:
+    for line in vtt_content.split('\n'):
         line = line.strip()
 
         # Skip header and empty lines
-        if not line or line == 'WEBVTT' or line.startswith('Kind:') or line.startswith('Language:'):
+        if not line or line.startswith(_HEADER_PREFIXES):
             continue
 
         # Check for timestamp
-        match = timestamp_pattern.match(line)
+        match = _TIMESTAMP_RE.match(line)
         if match:
-            if current_segment and current_segment.get('text'):
+            if current_segment and current_segment['text']:
                 segments.append(current_segment)
 
-            start_time = match.group(1)
-            end_time = match.group(2)
-
-            # Convert to seconds
-            def time_to_seconds(t: str) -> float:
-                parts = t.split(':')
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-
+            h1, m1, s1, h2, m2, s2 = match.groups()
             current_segment = {
-                'start': time_to_seconds(start_time),
-                'end': time_to_seconds(end_time),
+                'start': int(h1) * 3600 + int(m1) * 60 + float(s1),
+                'end': int(h2) * 3600 + int(m2) * 60 + float(s2),
                 'text': ''
             }
         elif current_segment is not None:
-            # This is caption text - clean it
-            # Remove tags like <c> </c> and position info
-            clean_text = re.sub(r'<[^>]+>', '', line)
-            clean_text = re.sub(r'\[.*?\]', '', clean_text)  # Remove [Music] etc
-            clean_text = clean_text.strip()
+            # This is caption text - strip tags and [Music]-style cues
+            clean_text = _TAG_RE.sub('', line).strip()
 
             if clean_text:
                 if current_segment['text']:
@@ -76,22 +75,27 @@ def _parse_vtt_to_text(vtt_content: str) -> tuple[str, list[dict[str, Any]]]:
                     current_segment['text'] = clean_text
 
     # Don't forget the last segment
-    if current_segment and current_segment.get('text'):
+    if current_segment and current_segment['text']:
         segments.append(current_segment)
 
-    # Deduplicate overlapping segments (YouTube often repeats text)
-    deduped_segments = []
-    seen_texts = set()
+    # Merge scrolling cues (YouTube repeats each line as it grows), keeping
+    # only the longest text of each run
+    deduped_segments: list[dict[str, Any]] = []
     for seg in segments:
-        text = seg['text'].strip()
-        if text and text not in seen_texts:
-            seen_texts.add(text)
-            deduped_segments.append(seg)
+        if deduped_segments:
+            last = deduped_segments[-1]
+            if seg['text'].startswith(last['text']):
+                last['text'] = seg['text']
+                last['end'] = max(last['end'], seg['end'])
+                continue
+            if last['text'].endswith(seg['text']):
+                continue
+        deduped_segments.append(seg)
 
     # Build full text
     full_text = ' '.join(seg['text'] for seg in deduped_segments)
     # Clean up multiple spaces
-    full_text = re.sub(r'\s+', ' ', full_text).strip()
+    full_text = ' '.join(full_text.split())
 
     return full_text, deduped_segments
 
@@ -109,7 +113,7 @@ def _extract_captions_sync(video_id: str) -> dict[str, Any] | None:
         "writesubtitles": True,
         "subtitleslangs": ["en", "en-orig"],
         "subtitlesformat": "vtt",
-        "outtmpl": str(transcripts_dir / f"{video_id}"),
+        "outtmpl": str(transcripts_dir / "%(id)s"),
         # Help avoid bot detection
         "extractor_args": {"youtube": {"player_client": ["web", "android"]}},
         "sleep_interval": 1,
@@ -117,17 +121,21 @@ def _extract_captions_sync(video_id: str) -> dict[str, Any] | None:
     }
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl("captions", ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
 
             if info is None:
                 return None
 
-            # Check what subtitle files were created
-            vtt_files = list(transcripts_dir.glob(f"{video_id}*.vtt"))
+            # Subtitle files yt-dlp wrote (no directory scan needed)
+            vtt_files = [
+                Path(sub["filepath"])
+                for sub in (info.get("requested_subtitles") or {}).values()
+                if sub.get("filepath")
+            ]
 
             if not vtt_files:
-                logger.info("no_captions_found", video_id=video_id)
+                logger.debug("no_captions_found", video_id=video_id)
                 return None
 
             # Prefer manual subs over auto-generated
@@ -142,14 +150,14 @@ def _extract_captions_sync(video_id: str) -> dict[str, Any] | None:
             full_text, segments = _parse_vtt_to_text(vtt_content)
 
             if not full_text:
-                logger.info("empty_captions", video_id=video_id)
+                logger.debug("empty_captions", video_id=video_id)
                 return None
 
             # Clean up VTT files
             for f in vtt_files:
                 f.unlink()
 
-            logger.info(
+            logger.debug(
                 "captions_extracted",
                 video_id=video_id,
                 text_length=len(full_text),
@@ -179,7 +187,7 @@ async def extract_captions(video_id: str) -> dict[str, Any] | None:
     Returns:
         Dict with transcript data, or None if no captions available
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(_executor, _extract_captions_sync, video_id)
     return result
 
@@ -191,7 +199,7 @@ def has_captions(video_id: str) -> bool:
     ydl_opts = {"quiet": True, "no_warnings": True}
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl("video_info", ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
 
             if info is None:
@@ -2,6 +2,7 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,7 @@ import structlog
 import yt_dlp
 
 from app.core.config import settings
+from app.services.youtube.ydl import shared_ydl
 from app.services.youtube.exceptions import (
     DownloadError,
     DownloadTimeoutError,
@@ -18,14 +20,17 @@ from app.services.youtube.exceptions import (
 logger = structlog.get_logger(__name__)
 
 # Thread pool for running yt-dlp (which is synchronous)
-_executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_downloads)
+_executor = ThreadPoolExecutor(
+    max_workers=settings.max_concurrent_downloads, thread_name_prefix="download"
+)
 
 # Semaphore to limit concurrent downloads
 _semaphore = asyncio.Semaphore(settings.max_concurrent_downloads)
 
 
+@lru_cache(maxsize=1)
 def _get_output_dir() -> Path:
-    """Get and ensure output directory exists."""
+    """Get the audio output directory, creating it on first use."""
     output_dir = settings.audio_path
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
@@ -34,7 +39,7 @@ def _get_output_dir() -> Path:
 def _download_audio_sync(video_id: str) -> dict[str, Any]:
     """Synchronous audio download implementation."""
     output_dir = _get_output_dir()
-    output_template = str(output_dir / f"{video_id}.%(ext)s")
+    output_template = str(output_dir / "%(id)s.%(ext)s")
 
     ydl_opts = {
         "format": "bestaudio/best",
@@ -57,14 +62,19 @@ def _download_audio_sync(video_id: str) -> dict[str, Any]:
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl("download", ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
 
             if info is None:
                 raise DownloadError(f"Failed to download: {video_id}")
 
-            # Find the output file
-            output_path = output_dir / f"{video_id}.{settings.audio_format}"
+            # yt-dlp reports the final (post-processed) file it wrote
+            downloads = info.get("requested_downloads") or [{}]
+            filepath = downloads[0].get("filepath")
+            output_path = (
+                Path(filepath) if filepath
+                else output_dir / f"{video_id}.{settings.audio_format}"
+            )
 
             if not output_path.exists():
                 # yt-dlp might use a different extension, try to find it
@@ -114,7 +124,7 @@ async def download_audio(
         logger.info("download_started", video_id=video_id)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await asyncio.wait_for(
                 loop.run_in_executor(_executor, _download_audio_sync, video_id),
                 timeout=timeout,
@@ -1,6 +1,7 @@
 """YouTube metadata extraction using yt-dlp."""
 
 import asyncio
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
@@ -13,11 +14,15 @@ from app.services.youtube.exceptions import (
     ChannelNotFoundError,
     MetadataExtractionError,
 )
+from app.services.youtube.pacing import youtube_pacer
+from app.services.youtube.ydl import shared_ydl
 
 logger = structlog.get_logger(__name__)
 
 # Thread pool for running yt-dlp (which is synchronous)
-_executor = ThreadPoolExecutor(max_workers=2)
+_executor = ThreadPoolExecutor(
+    max_workers=settings.metadata_concurrency, thread_name_prefix="metadata"
+)
 
 
 def _extract_channel_info_sync(channel_url: str) -> dict[str, Any]:
@@ -30,7 +35,7 @@ def _extract_channel_info_sync(channel_url: str) -> dict[str, Any]:
     }
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl("channel_info", ydl_opts) as ydl:
             info = ydl.extract_info(channel_url, download=False)
 
             if info is None:
@@ -74,7 +79,7 @@ def _extract_channel_videos_sync(
         ydl_opts["playlist_items"] = f"1:{limit}"
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl(f"channel_videos:{limit}", ydl_opts) as ydl:
             info = ydl.extract_info(videos_url, download=False)
 
             if info is None:
@@ -116,6 +121,35 @@ def _extract_channel_videos_sync(
         raise MetadataExtractionError(f"Failed to extract videos: {e}") from e
 
 
+def _video_info(info: dict[str, Any], video_id: str) -> dict[str, Any]:
+    """Convert a yt-dlp info dict into our video metadata shape."""
+    published_at = None
+    upload_date = info.get("upload_date")
+    if upload_date:
+        try:
+            published_at = datetime.strptime(upload_date, "%Y%m%d").isoformat()
+        except ValueError:
+            pass
+
+    return {
+        "video_id": info.get("id", video_id),
+        "channel_id": info.get("channel_id", ""),
+        "title": info.get("title", "Unknown"),
+        "description": info.get("description"),
+        "duration_seconds": info.get("duration"),
+        "published_at": published_at,
+        "thumbnail_url": info.get("thumbnail"),
+        "view_count": info.get("view_count"),
+        "has_en_captions": _has_en_captions(info),
+    }
+
+
+def _has_en_captions(info: dict[str, Any]) -> bool:
+    """Check whether yt-dlp lists English manual or automatic captions."""
+    languages = [*(info.get("subtitles") or {}), *(info.get("automatic_captions") or {})]
+    return any(lang == "en" or lang.startswith("en-") for lang in languages)
+
+
 def _extract_video_info_sync(video_id: str) -> dict[str, Any]:
     """Synchronous single video info extraction."""
     ydl_opts = {
@@ -126,35 +160,52 @@ def _extract_video_info_sync(video_id: str) -> dict[str, Any]:
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with shared_ydl("video_info", ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
 
             if info is None:
                 raise MetadataExtractionError(f"Failed to extract video info: {video_id}")
 
-            published_at = None
-            upload_date = info.get("upload_date")
-            if upload_date:
-                try:
-                    published_at = datetime.strptime(upload_date, "%Y%m%d").isoformat()
-                except ValueError:
-                    pass
-
-            return {
-                "video_id": info.get("id", video_id),
-                "channel_id": info.get("channel_id", ""),
-                "title": info.get("title", "Unknown"),
-                "description": info.get("description"),
-                "duration_seconds": info.get("duration"),
-                "published_at": published_at,
-                "thumbnail_url": info.get("thumbnail"),
-                "view_count": info.get("view_count"),
-            }
+            return _video_info(info, video_id)
 
     except yt_dlp.utils.DownloadError as e:
         raise MetadataExtractionError(f"Failed to extract video info: {e}") from e
 
 
+def _extract_video_infos_sync(
+    video_ids: list[str],
+    pace: Callable[[], None],
+) -> dict[str, dict[str, Any]]:
+    """Synchronous info extraction for many videos through one YoutubeDL instance.
+
+    Videos that fail to extract are logged and left out of the result.
+
+    Args:
+        video_ids: YouTube video IDs
+        pace: Blocks until the next request may start
+    """
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": True,
+    }
+
+    infos: dict[str, dict[str, Any]] = {}
+    with shared_ydl("video_info", ydl_opts) as ydl:
+        for video_id in video_ids:
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            pace()
+            try:
+                info = ydl.extract_info(url, download=False)
+            except yt_dlp.utils.DownloadError as e:
+                logger.warning("video_info_fetch_failed", video_id=video_id, error=str(e))
+                continue
+
+            if info is not None:
+                infos[video_id] = _video_info(info, video_id)
+
+    return infos
+
+
 async def fetch_channel_info(channel_url: str) -> dict[str, Any]:
     """Fetch channel information asynchronously.
 
@@ -164,7 +215,7 @@ async def fetch_channel_info(channel_url: str) -> dict[str, Any]:
     Returns:
         Dictionary with channel_id, channel_name, channel_url
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(_executor, _extract_channel_info_sync, channel_url)
     logger.info("channel_info_fetched", channel_id=result.get("channel_id"))
     return result
@@ -186,7 +237,7 @@ async def fetch_channel_videos(
     if limit is None:
         limit = settings.default_max_videos
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(
         _executor,
         _extract_channel_videos_sync,
@@ -206,7 +257,44 @@ async def fetch_video_info(video_id: str) -> dict[str, Any]:
     Returns:
         Dictionary with full video metadata
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     result = await loop.run_in_executor(_executor, _extract_video_info_sync, video_id)
     logger.info("video_info_fetched", video_id=video_id)
     return result
+
+
+async def fetch_video_infos(video_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch detailed info for several videos in parallel.
+
+    The IDs are split across up to metadata_concurrency executor threads,
+    each working through its share with its own YoutubeDL instance. Every
+    lookup waits its turn on the shared YouTube pacer, so the threads only
+    overlap slow responses; they don't raise the request rate.
+
+    Args:
+        video_ids: YouTube video IDs
+
+    Returns:
+        Video metadata keyed by video ID, omitting videos that failed
+    """
+    if not video_ids:
+        return {}
+
+    workers = min(settings.metadata_concurrency, len(video_ids))
+    loop = asyncio.get_running_loop()
+
+    def pace() -> None:
+        asyncio.run_coroutine_threadsafe(youtube_pacer.wait(), loop).result()
+
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(
+            _executor, _extract_video_infos_sync, video_ids[i::workers], pace
+        )
+        for i in range(workers)
+    ))
+
+    result: dict[str, dict[str, Any]] = {}
+    for part in parts:
+        result.update(part)
+    logger.info("video_infos_fetched", requested=len(video_ids), count=len(result))
+    return result
@@ -0,0 +1,32 @@
+"""Process-wide pacing of YouTube requests."""
+
+import asyncio
+import time
+
+from app.core.config import settings
+
+
+class RequestPacer:
+    """Spaces request starts at least download_delay_seconds apart.
+
+    Shared by every concurrent worker (and every channel being synced), so
+    raising ingest_concurrency overlaps downloads without raising the rate
+    of new requests YouTube sees.
+    """
+
+    def __init__(self):
+        """Initialize the pacer with no request made yet."""
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Wait for this caller's turn to start a request."""
+        async with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = time.monotonic() + settings.download_delay_seconds
+
+
+# Global instance
+youtube_pacer = RequestPacer()
@@ -0,0 +1,36 @@
+"""Reusable yt-dlp instances."""
+
+from contextlib import contextmanager
+import threading
+from typing import Any, Iterator
+
+import yt_dlp
+
+# Per-thread YoutubeDL instances, keyed by name
+_local = threading.local()
+
+
+@contextmanager
+def shared_ydl(name: str, opts: dict[str, Any]) -> Iterator[yt_dlp.YoutubeDL]:
+    """Use this thread's YoutubeDL for a named set of options.
+
+    Building a YoutubeDL registers every extractor and sets up its HTTP
+    handlers, so instances are kept open and reused instead of closed after
+    each call. They aren't thread-safe, so each executor thread gets its own.
+
+    Args:
+        name: Cache key; every call with a name must pass the same options
+            (use output templates like %(id)s rather than per-video paths)
+        opts: YoutubeDL options, only read when this thread has no instance
+
+    Yields:
+        A YoutubeDL instance owned by the calling thread
+    """
+    instances: dict[str, yt_dlp.YoutubeDL] | None = getattr(_local, "instances", None)
+    if instances is None:
+        instances = _local.instances = {}
+
+    ydl = instances.get(name)
+    if ydl is None:
+        ydl = instances[name] = yt_dlp.YoutubeDL(opts)
+    yield ydl
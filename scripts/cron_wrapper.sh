@@ -8,6 +8,7 @@
 #   ./scripts/cron_wrapper.sh embed   # Embed new transcripts
 #   ./scripts/cron_wrapper.sh retry   # Retry failed ingestions
 #   ./scripts/cron_wrapper.sh full    # Full pipeline (sync + embed)
+#   ./scripts/cron_wrapper.sh worker  # Run jobs queued through the API
 #
 
 set -e
@@ -59,6 +60,12 @@ case "$1" in
         EXIT_CODE=0
         ;;
 
+    worker)
+        log "Running queued ingestion jobs..."
+        $VENV_PYTHON scripts/ingestion_worker.py --once 2>&1 | tee -a "$LOG_FILE"
+        EXIT_CODE=${PIPESTATUS[0]}
+        ;;
+
     full)
         log "Starting full pipeline (sync + embed)..."
 
@@ -86,12 +93,13 @@ case "$1" in
         ;;
 
     *)
-        echo "Usage: $0 {sync|embed|retry|full|bulk}"
+        echo "Usage: $0 {sync|embed|retry|worker|full|bulk}"
         echo ""
         echo "Commands:"
         echo "  sync   - Sync new videos from channel (checks last 50)"
         echo "  embed  - Embed any new transcripts to Qdrant"
         echo "  retry  - Retry failed ingestions"
+        echo "  worker - Run jobs queued through the API"
         echo "  full   - Run sync + embed pipeline"
         echo "  bulk   - Initial bulk load (all videos)"
         exit 1
@@ -16,12 +16,16 @@ import asyncio
 import sys
 from datetime import datetime, UTC
 from pathlib import Path
+from typing import Any
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from qdrant_client.http.models import FieldCondition, Filter, MatchAny
+
 from app.core.config import settings
-from app.core.logging import setup_logging, get_logger
+from app.core.logging import ProgressLog, setup_logging, get_logger
+from app.core.runner import run
 from app.db.mongodb import mongodb
 from app.db.qdrant import qdrant
 from app.db.repositories.transcript import TranscriptRepository
@@ -30,20 +34,46 @@ from app.services.embeddings.pipeline import embedding_pipeline
 setup_logging()
 logger = get_logger(__name__)
 
+# Points per page when scrolling Qdrant
+SCROLL_PAGE_SIZE = 1024
+
+
+async def get_embedded_video_ids(candidates: set[str]) -> set[str]:
+    """Get which of the candidate video_ids already have points in Qdrant.
 
-def get_embedded_video_ids() -> set[str]:
-    """Get all video_ids currently in Qdrant."""
+    Asks Qdrant for the distinct video_id values among the candidates in one
+    facet call (served by the video_id payload index), falling back to
+    scrolling the candidates' points on servers without facet support.
+    """
     collection_name = settings.qdrant_collection_name
+    if not candidates:
+        return set()
+
+    candidate_filter = Filter(
+        must=[FieldCondition(key="video_id", match=MatchAny(any=list(candidates)))]
+    )
 
     try:
-        # Scroll through all points to get video_ids
+        response = await qdrant.aclient.facet(
+            collection_name=collection_name,
+            key="video_id",
+            facet_filter=candidate_filter,
+            limit=len(candidates),
+        )
+        return {hit.value for hit in response.hits}
+    except Exception as e:
+        logger.warning("facet_embedded_ids_failed", error=str(e))
+
+    try:
+        # Scroll the candidates' points in large pages to get their video_ids
         video_ids = set()
         offset = None
 
         while True:
-            results, offset = qdrant.client.scroll(
+            results, offset = await qdrant.aclient.scroll(
                 collection_name=collection_name,
-                limit=100,
+                scroll_filter=candidate_filter,
+                limit=SCROLL_PAGE_SIZE,
                 offset=offset,
                 with_payload=["video_id"],
                 with_vectors=False,
@@ -69,8 +99,7 @@ async def get_transcript_video_ids() -> set[str]:
         return set()
 
     repo = TranscriptRepository(mongodb.db)
-    video_ids = await repo.list_all_video_ids()
-    return set(video_ids)
+    return {video_id async for video_id in repo.iter_all_video_ids()}
 
 
 async def main() -> int:
@@ -88,7 +117,7 @@ async def main() -> int:
 
         # Find what needs embedding
         transcript_ids = await get_transcript_video_ids()
-        embedded_ids = get_embedded_video_ids()
+        embedded_ids = await get_embedded_video_ids(transcript_ids)
         new_ids = transcript_ids - embedded_ids
 
         logger.info(
@@ -106,25 +135,33 @@ async def main() -> int:
         total = len(new_ids)
         print(f"Found {total} new transcripts to embed...\n")
 
-        # Embed each new transcript
+        # Embed new transcripts concurrently so fetch, embed and upsert
+        # stages of different transcripts overlap
         embedded = 0
         failed = 0
-        new_ids_list = list(new_ids)
-
-        for i, video_id in enumerate(new_ids_list, 1):
-            remaining = total - i
-            try:
-                result = await embedding_pipeline.process_transcript(video_id)
-                if result["status"] == "completed":
-                    embedded += 1
-                    print(f"[{i}/{total}] ✓ {video_id} ({result['chunks']} chunks) | {remaining} left")
-                else:
-                    failed += 1
-                    print(f"[{i}/{total}] ✗ {video_id} ({result['status']}) | {remaining} left")
-            except Exception as e:
+        semaphore = asyncio.Semaphore(settings.pipeline_concurrency)
+
+        async def embed_one(video_id: str) -> tuple[str, dict[str, Any] | Exception]:
+            async with semaphore:
+                try:
+                    return video_id, await embedding_pipeline.process_transcript(video_id)
+                except Exception as e:
+                    return video_id, e
+
+        progress = ProgressLog(logger, "embed_new_progress", total)
+        tasks = [embed_one(video_id) for video_id in new_ids]
+        for i, next_done in enumerate(asyncio.as_completed(tasks), 1):
+            video_id, result = await next_done
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error("embed_failed", video_id=video_id, error=str(result))
+                print(f"[{i}/{total}] ✗ {video_id} (error: {result})")
+            elif result["status"] == "completed":
+                embedded += 1
+            else:
                 failed += 1
-                logger.error("embed_failed", video_id=video_id, error=str(e))
-                print(f"[{i}/{total}] ✗ {video_id} (error: {e}) | {remaining} left")
+                print(f"[{i}/{total}] ✗ {video_id} ({result['status']})")
+            progress.advance(embedded=embedded, failed=failed)
 
         end_time = datetime.now(UTC)
         duration = (end_time - start_time).total_seconds()
@@ -157,10 +194,10 @@ async def main() -> int:
         print(f"\nERROR: {e}")
         return 2
     finally:
-        qdrant.close()
+        await qdrant.close()
         await mongodb.disconnect()
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run(main())
     sys.exit(exit_code)
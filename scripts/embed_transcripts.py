@@ -5,32 +5,44 @@ import argparse
 import asyncio
 import sys
 from pathlib import Path
+from typing import Any
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.core.logging import setup_logging, get_logger
+from app.core.config import settings
+from app.core.logging import ProgressLog, setup_logging, get_logger
+from app.core.runner import run
 from app.db.mongodb import mongodb
 from app.db.qdrant import qdrant
+from app.services.embeddings import embedding_service
 from app.services.embeddings.pipeline import embedding_pipeline
+from app.services.embeddings.rate_limit import TokenBucket
 
 setup_logging()
 logger = get_logger(__name__)
 
-# Rate limit delay (seconds) - Cohere trial has 100k tokens/min limit
-RATE_LIMIT_DELAY = 1.0
 
-
-async def main(video_id: str | None = None, recreate: bool = False, delay: float = RATE_LIMIT_DELAY) -> None:
+async def main(
+    video_id: str | None = None,
+    recreate: bool = False,
+    concurrency: int = settings.pipeline_concurrency,
+    tokens_per_minute: int = settings.cohere_tokens_per_minute,
+    quantization: str | None = None,
+) -> None:
     """Run the embedding pipeline.
 
     Args:
         video_id: Optional specific video to process
         recreate: Whether to recreate the collection (delete all existing data)
-        delay: Delay between transcripts (for rate limiting)
+        concurrency: Transcripts embedded at once
+        tokens_per_minute: Cohere token budget shared by all requests (0: unlimited)
+        quantization: Vector quantization for a recreated collection
     """
     logger.info("embedding_pipeline_started", video_id=video_id or "all", recreate=recreate)
 
+    embedding_service.rate_limiter = TokenBucket(tokens_per_minute)
+
     try:
         # Connect to MongoDB
         await mongodb.connect()
@@ -40,7 +52,7 @@ async def main(video_id: str | None = None, recreate: bool = False, delay: float
 
         if recreate:
             print("Recreating Qdrant collection (deleting all existing embeddings)...")
-            qdrant.recreate_collection()
+            qdrant.recreate_collection(quantization=quantization)
 
         if video_id:
             # Process single video
@@ -49,47 +61,71 @@ async def main(video_id: str | None = None, recreate: bool = False, delay: float
             print(f"Status: {result['status']}")
             print(f"Chunks created: {result['chunks']}")
         else:
-            # Process all transcripts with rate limiting
+            # Process all transcripts concurrently; the embedding service
+            # keeps requests within the token budget and retries 429s
             from app.db.repositories.transcript import TranscriptRepository
 
             qdrant.ensure_collection()
             repo = TranscriptRepository(mongodb.db)
-            video_ids = await repo.list_all_video_ids()
+            # IDs are streamed to the workers; the count is only for progress
+            total = await repo.count()
 
-            print(f"Found {len(video_ids)} transcripts to process")
-            print(f"Rate limit delay: {delay}s between transcripts\n")
+            print(f"Found {total} transcripts to process")
+            print(f"Concurrency: {concurrency}, token budget: {tokens_per_minute or 'unlimited'}/min\n")
 
+            progress = ProgressLog(logger, "embedding_progress", total)
+            processed = 0
             completed = 0
             failed = 0
             total_chunks = 0
+            queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=concurrency * 2)
 
-            for i, vid in enumerate(video_ids, 1):
+            async def produce() -> None:
                 try:
-                    result = await embedding_pipeline.process_transcript(vid)
-                    if result["status"] == "completed":
+                    async for vid in repo.iter_all_video_ids():
+                        await queue.put(vid)
+                finally:
+                    # One stop marker per worker
+                    for _ in range(concurrency):
+                        await queue.put(None)
+
+            async def work() -> None:
+                nonlocal processed, completed, failed, total_chunks
+                while (vid := await queue.get()) is not None:
+                    try:
+                        result: dict[str, Any] | Exception = (
+                            await embedding_pipeline.process_transcript(vid)
+                        )
+                    except Exception as e:
+                        result = e
+
+                    processed += 1
+                    if isinstance(result, Exception):
+                        failed += 1
+                        print(f"[{processed}/{total}] {vid}: ERROR - {result}")
+                    elif result["status"] == "completed":
                         completed += 1
                         total_chunks += result["chunks"]
-                        print(f"[{i}/{len(video_ids)}] {vid}: {result['chunks']} chunks")
                     else:
                         failed += 1
-                        print(f"[{i}/{len(video_ids)}] {vid}: {result['status']}")
+                        print(f"[{processed}/{total}] {vid}: {result['status']}")
+                    progress.advance(completed=completed, failed=failed, chunks=total_chunks)
 
-                    # Rate limit delay
-                    if delay > 0 and i < len(video_ids):
-                        await asyncio.sleep(delay)
+            # Into a fresh collection, load everything first and build the
+            # HNSW graph once at the end instead of while points stream in
+            if recreate:
+                qdrant.pause_indexing()
 
-                except Exception as e:
-                    failed += 1
-                    print(f"[{i}/{len(video_ids)}] {vid}: ERROR - {e}")
-                    # On rate limit, wait longer
-                    if "rate limit" in str(e).lower():
-                        print("Rate limit hit, waiting 60s...")
-                        await asyncio.sleep(60)
+            try:
+                await asyncio.gather(produce(), *(work() for _ in range(concurrency)))
+            finally:
+                if recreate:
+                    qdrant.resume_indexing()
 
             print("\n" + "=" * 50)
             print("EMBEDDING PIPELINE COMPLETE")
             print("=" * 50)
-            print(f"Total transcripts: {len(video_ids)}")
+            print(f"Total transcripts: {processed}")
             print(f"Completed: {completed}")
             print(f"Failed: {failed}")
             print(f"Total chunks created: {total_chunks}")
@@ -108,7 +144,7 @@ async def main(video_id: str | None = None, recreate: bool = False, delay: float
         raise
     finally:
         await mongodb.disconnect()
-        qdrant.close()
+        await qdrant.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -127,14 +163,34 @@ def parse_args() -> argparse.Namespace:
         help="Recreate the collection (delete all existing embeddings first)",
     )
     parser.add_argument(
-        "--delay",
-        type=float,
-        default=RATE_LIMIT_DELAY,
-        help="Delay in seconds between transcripts (for rate limiting)",
+        "--quantization",
+        choices=["none", "scalar", "binary"],
+        default=settings.qdrant_quantization,
+        help="Vector quantization for the recreated collection (with --recreate)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.pipeline_concurrency,
+        help="Number of transcripts embedded at once",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=settings.cohere_tokens_per_minute,
+        help="Cohere tokens per minute to stay under (0: unlimited)",
     )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(main(video_id=args.video_id, recreate=args.recreate, delay=args.delay))
+    run(
+        main(
+            video_id=args.video_id,
+            recreate=args.recreate,
+            concurrency=args.concurrency,
+            tokens_per_minute=args.tpm,
+            quantization=args.quantization,
+        )
+    )
@@ -2,7 +2,6 @@
 """CLI script for channel ingestion."""
 
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
@@ -11,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
+from app.core.runner import run
 from app.db.connection import db
 from app.services.ingestion.orchestrator import IngestionOrchestrator
 
@@ -107,7 +107,7 @@ def parse_args() -> argparse.Namespace:
 
 if __name__ == "__main__":
     args = parse_args()
-    asyncio.run(
+    run(
         main(
             channel_url=args.channel_url,
             max_videos=args.max_videos,
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Run queued ingestion jobs.
+
+The API only enqueues channel syncs and retries; this worker runs them in
+its own process so long ingestions never hold up API requests. Run as many
+workers as needed.
+
+Usage:
+    python scripts/ingestion_worker.py          # Poll for jobs forever
+    python scripts/ingestion_worker.py --once   # Drain the queue and exit
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.core.runner import run
+from app.db.connection import db
+from app.db.mongodb import mongodb
+from app.db.repositories.transcript import TranscriptRepository
+from app.services.ingestion.worker import IngestionWorker
+from app.services.transcription import whisper_service
+from app.services.transcription.exceptions import ModelLoadError
+
+setup_logging()
+logger = get_logger(__name__)
+
+
+async def main(once: bool) -> int:
+    """Run the ingestion worker and return exit code."""
+    await db.connect()
+    await db.init_schema()
+
+    if settings.use_mongodb:
+        await mongodb.connect()
+        await mongodb.ensure_indexes()
+        await TranscriptRepository(mongodb.db).ensure_counters()
+
+    # Load Whisper once up front; caption-only jobs still run without it
+    try:
+        await whisper_service.load_model()
+    except ModelLoadError as e:
+        logger.warning("whisper_preload_failed", error=str(e))
+
+    try:
+        await IngestionWorker().run(once=once)
+    finally:
+        if mongodb.is_connected:
+            await mongodb.disconnect()
+        await db.disconnect()
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued ingestion jobs")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Drain the queue and exit instead of polling",
+    )
+    args = parser.parse_args()
+
+    exit_code = run(main(args.once))
+    sys.exit(exit_code)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Initialize the database schema."""
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.logging import setup_logging, get_logger
+from app.core.runner import run
 from app.db.connection import db
 
 setup_logging()
@@ -31,4 +31,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
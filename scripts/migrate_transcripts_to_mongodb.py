@@ -8,14 +8,19 @@ Usage:
 """
 
 import asyncio
-import json
+import os
 import sys
+from itertools import islice
 from pathlib import Path
+from typing import Iterator
+
+import orjson
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
-from app.core.logging import setup_logging, get_logger
+from app.core.logging import ProgressLog, setup_logging, get_logger
+from app.core.runner import run
 from app.db.connection import db
 from app.db.mongodb import mongodb
 from app.db.repositories.transcript import TranscriptRepository
@@ -26,6 +31,43 @@ from app.models.transcript import TranscriptCreate, TranscriptSegment
 setup_logging()
 logger = get_logger(__name__)
 
+# Transcript files loaded and written to MongoDB together
+CHUNK_SIZE = 500
+
+# Transcript files read at once
+READ_CONCURRENCY = 32
+
+
+def iter_json_files(directory: Path) -> Iterator[Path]:
+    """Yield the transcript JSON files in a directory as it is read."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                yield Path(entry.path)
+
+
+def count_json_files(directory: Path) -> int:
+    """Count the transcript JSON files in a directory."""
+    return sum(1 for _ in iter_json_files(directory))
+
+
+async def load_transcript_files(json_files: list[Path]) -> list[dict | Exception]:
+    """Read and parse transcript files concurrently, off the event loop.
+
+    Returns:
+        The parsed JSON of each file, or the error it raised, in input order
+    """
+    semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+
+    async def load(json_file: Path) -> dict | Exception:
+        async with semaphore:
+            try:
+                return orjson.loads(await asyncio.to_thread(json_file.read_bytes))
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(load(json_file) for json_file in json_files))
+
 
 async def migrate_transcripts(dry_run: bool = False) -> dict:
     """Migrate all JSON transcripts to MongoDB."""
@@ -40,8 +82,8 @@ async def migrate_transcripts(dry_run: bool = False) -> dict:
     video_repo = VideoRepository(db.connection)
     channel_repo = ChannelRepository(db.connection)
 
-    # Build channel lookup cache
-    channels: dict[str, str] = {}  # channel_id -> channel_name
+    # Load every channel name up front (channel_id -> channel_name)
+    channels = await channel_repo.get_names()
 
     # Find all JSON files
     transcripts_dir = settings.transcripts_path
@@ -49,75 +91,99 @@ async def migrate_transcripts(dry_run: bool = False) -> dict:
         print(f"Transcripts directory not found: {transcripts_dir}")
         return {"error": "transcripts directory not found"}
 
-    json_files = list(transcripts_dir.glob("*.json"))
+    # Files are streamed from the directory in chunks; the total (for
+    # progress only) is counted in a thread while migration starts
+    count_task = asyncio.create_task(asyncio.to_thread(count_json_files, transcripts_dir))
+    json_files = iter_json_files(transcripts_dir)
 
-    print(f"Found {len(json_files)} transcript files to migrate")
+    print(f"Migrating transcript files from {transcripts_dir}")
     print(f"Dry run: {dry_run}")
     print("-" * 50)
 
     migrated = 0
     skipped = 0
     failed = 0
-
-    for i, json_file in enumerate(json_files, 1):
-        video_id = json_file.stem
-
-        try:
-            # Load JSON
-            with open(json_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Get video metadata for channel info
-            video = await video_repo.get_by_video_id(video_id)
-            if not video:
-                print(f"[{i}/{len(json_files)}] SKIP {video_id} - no video metadata")
-                skipped += 1
+    processed = 0
+
+    progress = ProgressLog(logger, "migration_progress", 0)
+    while chunk := list(islice(json_files, CHUNK_SIZE)):
+        if count_task.done() and not progress.total:
+            progress.total = count_task.result()
+            print(f"Found {progress.total} transcript files to migrate")
+        total = progress.total or "?"
+        chunk_start = processed
+        processed += len(chunk)
+
+        loaded = await load_transcript_files(chunk)
+        # Video metadata for the whole chunk in one query
+        videos = await video_repo.get_many_by_video_ids([f.stem for f in chunk])
+        transcripts: list[TranscriptCreate] = []
+
+        for i, (json_file, data) in enumerate(zip(chunk, loaded), chunk_start + 1):
+            video_id = json_file.stem
+
+            try:
+                if isinstance(data, Exception):
+                    raise data
+
+                video = videos.get(video_id)
+                if not video:
+                    print(f"[{i}/{total}] SKIP {video_id} - no video metadata")
+                    skipped += 1
+                    continue
+
+                channel_id = video.channel_id
+                channel_name = channels.get(channel_id, "Unknown")
+
+                # Prepare transcript document
+                segments = [
+                    TranscriptSegment(start=s["start"], end=s["end"], text=s["text"])
+                    for s in data.get("segments", [])
+                ]
+
+                transcripts.append(
+                    TranscriptCreate(
+                        video_id=video_id,
+                        channel_id=channel_id,
+                        channel_name=channel_name,
+                        source=data.get("source", "youtube_captions"),
+                        text=data.get("text", ""),
+                        segments=segments,
+                        language=data.get("language", "en"),
+                    )
+                )
+
+            except Exception as e:
+                print(f"[{i}/{total}] FAIL {video_id}: {e}")
+                logger.error("migration_failed", video_id=video_id, error=str(e))
+                failed += 1
+
+        if not dry_run:
+            try:
+                # One unordered bulk write per chunk
+                await transcript_repo.bulk_upsert(transcripts)
+            except Exception as e:
+                print(f"[{chunk_start + 1}-{chunk_start + len(chunk)}/{total}] FAIL chunk: {e}")
+                logger.error("migration_chunk_failed", chunk_start=chunk_start, error=str(e))
+                failed += len(transcripts)
+                progress.advance(len(chunk), migrated=migrated, skipped=skipped, failed=failed)
                 continue
 
-            channel_id = video["channel_id"]
-
-            # Get channel name (cached)
-            if channel_id not in channels:
-                channel = await channel_repo.get_by_channel_id(channel_id)
-                channels[channel_id] = channel["channel_name"] if channel else "Unknown"
-
-            channel_name = channels[channel_id]
-
-            # Prepare transcript document
-            segments = [
-                TranscriptSegment(start=s["start"], end=s["end"], text=s["text"])
-                for s in data.get("segments", [])
-            ]
-
-            transcript = TranscriptCreate(
-                video_id=video_id,
-                channel_id=channel_id,
-                channel_name=channel_name,
-                source=data.get("source", "youtube_captions"),
-                text=data.get("text", ""),
-                segments=segments,
-                language=data.get("language", "en"),
-            )
-
-            if dry_run:
-                print(f"[{i}/{len(json_files)}] DRY-RUN {video_id} -> {channel_name}")
-            else:
-                await transcript_repo.upsert(transcript)
-                print(f"[{i}/{len(json_files)}] OK {video_id} -> {channel_name}")
+        migrated += len(transcripts)
+        progress.advance(len(chunk), migrated=migrated, skipped=skipped, failed=failed)
 
-            migrated += 1
+    count_task.cancel()
 
-        except Exception as e:
-            print(f"[{i}/{len(json_files)}] FAIL {video_id}: {e}")
-            logger.error("migration_failed", video_id=video_id, error=str(e))
-            failed += 1
+    # Bulk writes skip the per-channel counters; recompute them once
+    if migrated and not dry_run:
+        await transcript_repo.rebuild_counters()
 
     # Cleanup
     await mongodb.disconnect()
     await db.disconnect()
 
     summary = {
-        "total": len(json_files),
+        "total": processed,
         "migrated": migrated,
         "skipped": skipped,
         "failed": failed,
@@ -137,4 +203,4 @@ async def migrate_transcripts(dry_run: bool = False) -> dict:
 
 if __name__ == "__main__":
     dry_run = "--dry-run" in sys.argv
-    asyncio.run(migrate_transcripts(dry_run=dry_run))
+    run(migrate_transcripts(dry_run=dry_run))
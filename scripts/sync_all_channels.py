@@ -4,7 +4,8 @@ Sync all active channels from channels.json.
 
 This script:
 1. Reads channels.json for list of pastors
-2. Syncs each active channel (fetches videos, extracts captions)
+2. Syncs each active channel (fetches videos, extracts captions),
+   highest "priority" first so a cut-short run covers those channels
 3. Saves transcripts to MongoDB
 
 Usage:
@@ -12,20 +13,26 @@ Usage:
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
+import orjson
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.logging import setup_logging, get_logger
+from app.core.runner import run
 from app.db.connection import db
 from app.db.mongodb import mongodb
+from app.db.repositories.transcript import TranscriptRepository
 from app.services.ingestion.orchestrator import IngestionOrchestrator
 
 setup_logging()
 logger = get_logger(__name__)
 
+# Channels synced at once (each already fetches several videos in parallel)
+CHANNEL_CONCURRENCY = 4
+
 
 async def main() -> int:
     """Sync all active channels and return exit code."""
@@ -36,62 +43,70 @@ async def main() -> int:
         print(f"ERROR: {config_path} not found")
         return 1
 
-    with open(config_path) as f:
-        config = json.load(f)
+    config = orjson.loads(config_path.read_bytes())
 
     channels = config.get("channels", [])
     if not channels:
         print("No channels configured in channels.json")
         return 0
 
+    for channel in channels:
+        if not channel.get("active", True):
+            print(f"Skipping (inactive): {channel['name']}")
+
+    # Highest priority first: the semaphore admits channels in this order
+    active = sorted(
+        (channel for channel in channels if channel.get("active", True)),
+        key=lambda channel: (-channel.get("priority", 0), channel["name"]),
+    )
+
     # Connect to databases
     await db.connect()
     await mongodb.connect()
     await mongodb.ensure_indexes()
+    if mongodb.is_connected:
+        await TranscriptRepository(mongodb.db).ensure_counters()
 
     orchestrator = IngestionOrchestrator()
 
-    results = []
-    total_transcribed = 0
-    total_failed = 0
-
-    for channel in channels:
-        # Skip inactive channels
-        if not channel.get("active", True):
-            print(f"\nSkipping (inactive): {channel['name']}")
-            continue
-
-        print(f"\n{'='*50}")
-        print(f"Syncing: {channel['name']}")
-        print(f"URL: {channel['url']}")
-        print(f"{'='*50}")
-
-        try:
-            result = await orchestrator.sync_channel(
-                channel_url=channel["url"],
-                max_videos=channel.get("max_videos", 50),
-                download=False,  # Captions only, no audio download
-                transcribe=True,
-            )
-
-            results.append({
-                "channel": channel["name"],
-                "status": "success",
-                **result
-            })
-
-            total_transcribed += result.get("videos_transcribed", 0)
-            print(f"OK: {result.get('videos_transcribed', 0)} transcribed, {result.get('videos_failed', 0)} failed")
-
-        except Exception as e:
-            logger.error("channel_sync_failed", channel=channel["name"], error=str(e))
-            print(f"FAILED: {e}")
-            results.append({
-                "channel": channel["name"],
-                "status": "error",
-                "error": str(e)
-            })
-            total_failed += 1
+    semaphore = asyncio.Semaphore(CHANNEL_CONCURRENCY)
+
+    async def sync_one(channel: dict) -> dict:
+        async with semaphore:
+            print(f"Syncing: {channel['name']} ({channel['url']})")
+            try:
+                result = await orchestrator.sync_channel(
+                    channel_url=channel["url"],
+                    max_videos=channel.get("max_videos", 50),
+                    download=False,  # Captions only, no audio download
+                    transcribe=True,
+                )
+            except Exception as e:
+                logger.error("channel_sync_failed", channel=channel["name"], error=str(e))
+                print(f"FAILED: {channel['name']}: {e}")
+                return {
+                    "channel": channel["name"],
+                    "status": "error",
+                    "error": str(e)
+                }
+
+        print(
+            f"OK: {channel['name']}: {result.get('videos_transcribed', 0)} transcribed, "
+            f"{result.get('videos_failed', 0)} failed"
+        )
+        return {
+            "channel": channel["name"],
+            "status": "success",
+            **result
+        }
+
+    # Channels are independent, so sync them concurrently
+    results = await asyncio.gather(*(sync_one(channel) for channel in active))
+
+    total_transcribed = sum(
+        r.get("videos_transcribed", 0) for r in results if r["status"] == "success"
+    )
+    total_failed = sum(1 for r in results if r["status"] == "error")
 
     # Cleanup
     await mongodb.disconnect()
@@ -115,5 +130,5 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run(main())
     sys.exit(exit_code)
@@ -20,16 +20,19 @@ Usage:
 """
 
 import argparse
-import asyncio
+from contextlib import contextmanager
 import sys
+import tempfile
 from datetime import datetime, UTC
 from pathlib import Path
+from typing import Iterator
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
+from app.core.runner import run
 from app.db.connection import db
 from app.services.ingestion.orchestrator import IngestionOrchestrator
 
@@ -39,6 +42,36 @@ logger = get_logger(__name__)
 # Default channel to sync
 DEFAULT_CHANNEL = "https://www.youtube.com/@PastorPoju"
 
+# Held for the length of a run so cron can't start an overlapping one
+LOCK_PATH = Path(tempfile.gettempdir()) / "sync_channel.lock"
+
+
+@contextmanager
+def run_lock() -> Iterator[bool]:
+    """Hold the sync lock file for the duration of the context.
+
+    Yields:
+        False if another sync already holds the lock, True otherwise
+        (always True where fcntl is unavailable)
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield True
+        return
+
+    with open(LOCK_PATH, "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 
 async def main(
     channel_url: str,
@@ -146,12 +179,17 @@ def parse_args() -> argparse.Namespace:
 
 if __name__ == "__main__":
     args = parse_args()
-    exit_code = asyncio.run(
-        main(
-            channel_url=args.channel,
-            max_videos=args.max_videos,
-            download=args.download_audio,  # Default: False (captions preferred)
-            transcribe=not args.no_transcribe,
+    with run_lock() as acquired:
+        if not acquired:
+            logger.info("sync_already_running", lock_path=str(LOCK_PATH))
+            sys.exit(0)
+
+        exit_code = run(
+            main(
+                channel_url=args.channel,
+                max_videos=args.max_videos,
+                download=args.download_audio,  # Default: False (captions preferred)
+                transcribe=not args.no_transcribe,
+            )
         )
-    )
     sys.exit(exit_code)
@@ -1,28 +1,27 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from pathlib import Path
-from typing import AsyncIterator
+from types import MappingProxyType
+from typing import AsyncIterator, Final, Mapping
 from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 
 from app.db.connection import Database
+from app.db.repositories.channel import ChannelRepository
 
+# Channel inserted by the seeded_db fixture
+TEST_CHANNEL: Final[Mapping[str, str]] = MappingProxyType({
+    "channel_id": "UC123456789012345678901",
+    "channel_name": "Test Channel",
+    "channel_url": "https://www.youtube.com/@TestChannel",
+})
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
-
-@pytest_asyncio.fixture
-async def test_db(tmp_path: Path) -> AsyncIterator[Database]:
-    """Create a test database with temporary path."""
-    db_path = tmp_path / "test.db"
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_db(tmp_path_factory: pytest.TempPathFactory) -> AsyncIterator[Database]:
+    """Create the test database and its schema once per session."""
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
 
     # Mock settings to use the temp database
     with patch("app.db.connection.settings") as mock_settings:
@@ -31,8 +30,37 @@ async def test_db(tmp_path: Path) -> AsyncIterator[Database]:
 
         db = Database()
         await db.connect()
+        # Throwaway database: don't wait on the disk for writes. WAL (from
+        # LOCAL_PRAGMAS) stays, since pool readers need it alongside the writer
+        db.connection.execute("PRAGMA synchronous = OFF")
         await db.init_schema()
 
         yield db
 
         await db.disconnect()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_db(session_db: Database) -> AsyncIterator[Database]:
+    """Provide the session's test database with every table emptied."""
+    connection = session_db.connection
+    tables = [
+        row[0]
+        for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid DESC"
+        ).fetchall()
+    ]
+    # Newest first, so rows are deleted before the rows they reference
+    for table in tables:
+        connection.execute(f"DELETE FROM {table}")
+    connection.commit()
+
+    yield session_db
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def seeded_db(test_db: Database) -> AsyncIterator[Database]:
+    """Provide the emptied test database with the shared test channel inserted."""
+    await ChannelRepository(test_db.connection).create({**TEST_CHANNEL})
+
+    yield test_db
@@ -0,0 +1,110 @@
+"""Tests for query embedding batching."""
+
+import asyncio
+
+import pytest
+
+from app.services.embeddings import batching
+from app.services.embeddings.batching import BatchingEmbedder
+from app.services.embeddings.cache import EmbeddingCache, embedding_cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_call() -> None:
+    """Test that queries arriving together are embedded in one batch."""
+    calls: list[list[str]] = []
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    embedder = BatchingEmbedder(embed, max_batch_size=32, window_ms=5)
+    results = await asyncio.gather(
+        embedder.embed_query("peace"),
+        embedder.embed_query("hope"),
+        embedder.embed_query("peace"),
+    )
+
+    assert results == [[5.0], [4.0], [5.0]]
+    assert calls == [["peace", "hope"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller() -> None:
+    """Test that a failed batch call fails each waiting query."""
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        raise RuntimeError("embedding API down")
+
+    embedder = BatchingEmbedder(embed, max_batch_size=2, window_ms=5)
+    results = await asyncio.gather(
+        embedder.embed_query("peace"),
+        embedder.embed_query("hope"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_embed_many_fills_batches_across_callers() -> None:
+    """Test that text lists from concurrent callers share full batches."""
+    calls: list[list[str]] = []
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(text[1:])] for text in texts]
+
+    embedder = BatchingEmbedder(embed, max_batch_size=4, window_ms=5)
+    first, second = await asyncio.gather(
+        embedder.embed_many(["a1", "a2", "a3"]),
+        embedder.embed_many(["b4", "b5", "b6"]),
+    )
+
+    assert first == [[1.0], [2.0], [3.0]]
+    assert second == [[4.0], [5.0], [6.0]]
+    assert calls == [["a1", "a2", "a3", "b4"], ["b5", "b6"]]
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_served_from_cache() -> None:
+    """Test that a cached query embedding skips the embed call."""
+    calls: list[list[str]] = []
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    embedder = BatchingEmbedder(embed, max_batch_size=32, window_ms=1, cache_size=1)
+    assert await embedder.embed_query("peace") == [5.0]
+    assert await embedder.embed_query("peace") == [5.0]
+    assert await embedder.embed_query("hope") == [4.0]
+    assert await embedder.embed_query("peace") == [5.0]
+
+    assert calls == [["peace"], ["hope"], ["peace"]]
+
+
+@pytest.mark.asyncio
+async def test_documents_only_embed_cache_misses(monkeypatch) -> None:
+    """Test that cached document vectors skip Cohere and new ones are stored."""
+    store = {EmbeddingCache.key("cached"): [1.0]}
+    calls: list[list[str]] = []
+
+    async def get_many(keys: list[str]) -> dict[str, list[float]]:
+        return {key: store[key] for key in keys if key in store}
+
+    async def put_many(vectors: dict[str, list[float]]) -> None:
+        store.update(vectors)
+
+    async def embed(texts: list[str], input_type: str) -> list[list[float]]:
+        calls.append(texts)
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(EmbeddingCache, "enabled", property(lambda self: True))
+    monkeypatch.setattr(embedding_cache, "get_many", get_many)
+    monkeypatch.setattr(embedding_cache, "put_many", put_many)
+    monkeypatch.setattr(batching.embedding_service, "embed", embed)
+
+    assert await batching._embed_documents(["new", "cached", "fresh!"]) == [[3.0], [1.0], [6.0]]
+    assert await batching._embed_documents(["fresh!"]) == [[6.0]]
+    assert calls == [["new", "fresh!"]]
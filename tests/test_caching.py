@@ -0,0 +1,28 @@
+"""Tests for HTTP caching helpers."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.caching import cached_response
+
+app = FastAPI()
+
+
+@app.get("/items")
+async def items(request: Request):
+    return cached_response(request, {"items": [1, 2, 3]})
+
+
+def test_cached_response_etag_roundtrip() -> None:
+    """Test that a matching If-None-Match returns 304."""
+    client = TestClient(app)
+
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2, 3]}
+    assert response.headers["cache-control"] == "public, max-age=60, s-maxage=300"
+    etag = response.headers["etag"]
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
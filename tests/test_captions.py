@@ -0,0 +1,57 @@
+"""Tests for YouTube caption parsing."""
+
+from app.services.youtube.captions import _parse_vtt_to_text
+
+
+def test_parse_vtt_strips_tags_and_repeats() -> None:
+    """Test that cues are timed, cleaned, and deduplicated."""
+    vtt = "\n".join([
+        "WEBVTT",
+        "Kind: captions",
+        "Language: en",
+        "",
+        "00:00:01.500 --> 01:02:03.250 align:start position:0%",
+        "[Music] God<00:00:02.000><c> is</c>",
+        "good",
+        "",
+        "00:00:04.000 --> 00:00:05.000",
+        "God is good",
+        "",
+        "00:00:05.000 --> 00:00:06.000",
+        "[Applause]",
+    ])
+
+    full_text, segments = _parse_vtt_to_text(vtt)
+
+    assert full_text == "God is good"
+    assert segments == [{"start": 1.5, "end": 3723.25, "text": "God is good"}]
+
+
+def test_parse_vtt_merges_scrolling_cues() -> None:
+    """Test that growing auto-caption cues collapse into the longest one."""
+    vtt = "\n".join([
+        "WEBVTT",
+        "",
+        "00:00:00.000 --> 00:00:01.000",
+        "hello there",
+        "",
+        "00:00:01.000 --> 00:00:02.000",
+        "hello there my",
+        "",
+        "00:00:02.000 --> 00:00:03.000",
+        "hello there my friend",
+        "",
+        "00:00:03.000 --> 00:00:04.000",
+        "my friend",
+        "",
+        "00:00:04.000 --> 00:00:05.000",
+        "welcome",
+    ])
+
+    full_text, segments = _parse_vtt_to_text(vtt)
+
+    assert full_text == "hello there my friend welcome"
+    assert segments == [
+        {"start": 0.0, "end": 3.0, "text": "hello there my friend"},
+        {"start": 4.0, "end": 5.0, "text": "welcome"},
+    ]
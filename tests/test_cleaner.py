@@ -0,0 +1,45 @@
+"""Tests for transcript cleaning."""
+
+from app.services.embeddings.cleaner import clean_transcript
+
+
+def test_removes_repeated_phrases() -> None:
+    """Test overlapping caption phrases collapse to one copy."""
+    text = "I want to share I want to share I want to share something with you today"
+    assert clean_transcript(text) == "I want to share something with you today"
+
+
+def test_removes_stutters_and_fillers() -> None:
+    """Test stuttered words and filler runs are reduced."""
+    text = "he he he said that um um um we should go. Uh, then we went"
+    assert clean_transcript(text) == "he said that um we should go. then we went"
+
+
+def test_normalizes_whitespace_and_punctuation() -> None:
+    """Test spacing around punctuation is fixed."""
+    text = "Um, this is   a test ,and more.Then  the end !"
+    assert clean_transcript(text) == "this is a test, and more. Then the end!"
+
+
+def test_collapses_repeats_after_unique_words() -> None:
+    """Test repeats are found anywhere in the text, not just at the start."""
+    text = "Amen amen. God is good all the time all the time all the time and all the time God is good"
+    assert clean_transcript(text) == "Amen. God is good all the time and all the time God is good"
+
+
+def test_empty_text() -> None:
+    """Test empty input is returned unchanged."""
+    assert clean_transcript("") == ""
+
+
+def test_clean_text_only_normalizes_whitespace() -> None:
+    """Test transcripts without caption noise skip the full cleaner."""
+    text = "God is  good ,all the time ."
+    assert clean_transcript(text) == "God is good, all the time."
+
+
+def test_noise_after_clean_opening_is_cleaned() -> None:
+    """Test repetition late in a long transcript is still removed."""
+    opening = " ".join(f"word{i}" for i in range(1000))
+    text = f"{opening} and then then then it ends."
+    assert clean_transcript(text) == f"{opening} and then it ends."
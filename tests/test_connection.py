@@ -0,0 +1,116 @@
+"""Tests for the database connection manager."""
+
+import asyncio
+
+import pytest
+
+from app.db.connection import Database
+from app.db.pool import ConnectionPool, PoolConfig
+
+
+@pytest.mark.asyncio
+async def test_pooled_execute_and_fetch(test_db: Database) -> None:
+    """Test the pool-backed execute/fetch helpers."""
+    await test_db.execute(
+        "INSERT INTO channels (channel_id, channel_name, channel_url) VALUES (?, ?, ?)",
+        ("UC123456789012345678901", "Test Channel", "https://www.youtube.com/@TestChannel"),
+    )
+
+    row = await test_db.fetchone(
+        "SELECT channel_name FROM channels WHERE channel_id = ?",
+        ("UC123456789012345678901",),
+    )
+    assert row == {"channel_name": "Test Channel"}
+
+    rows = await test_db.fetchall("SELECT channel_id FROM channels")
+    assert rows == [{"channel_id": "UC123456789012345678901"}]
+
+
+@pytest.mark.asyncio
+async def test_local_pragmas_applied(test_db: Database) -> None:
+    """Test local SQLite connections run in WAL mode."""
+    row = await test_db.fetchone("PRAGMA journal_mode")
+    assert row == {"journal_mode": "wal"}
+
+
+@pytest.mark.asyncio
+async def test_ingestion_listings_use_index_order(test_db: Database) -> None:
+    """Test ingestion listings are served in index order without a sort."""
+    queries = [
+        (
+            "SELECT * FROM ingestion_status INDEXED BY idx_ingestion_failed_retry "
+            "WHERE status = 'failed' AND error_count < ? ORDER BY updated_at LIMIT ?",
+            (3, 10),
+        ),
+        (
+            "SELECT * FROM ingestion_status WHERE status = ? ORDER BY created_at LIMIT ?",
+            ("pending", 10),
+        ),
+    ]
+    for sql, parameters in queries:
+        plan = await test_db.fetchall(f"EXPLAIN QUERY PLAN {sql}", parameters)
+        details = " ".join(step["detail"] for step in plan)
+        assert "USING INDEX" in details
+        assert "TEMP B-TREE" not in details
+
+
+class _FakeConnection:
+    """Stand-in connection that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_failed_and_closes_checked_out_connections() -> None:
+    """Test a connection whose borrower failed is never handed out again."""
+    pool = ConnectionPool(_FakeConnection, PoolConfig(min_size=1, max_size=2))
+    await pool.open()
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire() as failed:
+            raise RuntimeError("boom")
+    assert failed.closed
+
+    async with pool.acquire() as connection:
+        assert connection is not failed
+        # Still checked out when the pool shuts down
+        await pool.close()
+        assert connection.closed
+    assert pool.size == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_wakes_waiters_when_reconnect_fails() -> None:
+    """Test a waiter retries the connect rather than hanging on a failed replace."""
+    connections = iter([_FakeConnection()])
+
+    def connect() -> _FakeConnection:
+        try:
+            return next(connections)
+        except StopIteration:
+            raise ConnectionError("database unreachable") from None
+
+    pool = ConnectionPool(connect, PoolConfig(min_size=1, max_size=1))
+    await pool.open()
+
+    async def wait_for_connection() -> None:
+        async with pool.acquire():
+            pass
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            waiter = asyncio.create_task(wait_for_connection())
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(waiter, timeout=1)
+
+    # The freed slot is usable once the database is back
+    connections = iter([_FakeConnection()])
+    async with pool.acquire() as connection:
+        assert not connection.closed
@@ -0,0 +1,118 @@
+"""Tests for the Cohere embedding service."""
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import cohere
+import pytest
+
+from app.services.embeddings import rate_limit
+from app.services.embeddings.embedding_service import MAX_BATCH_SIZE, EmbeddingService
+
+# The package re-exports the global instance under the module's name
+embedding_service_module = importlib.import_module("app.services.embeddings.embedding_service")
+
+
+@pytest.mark.asyncio
+async def test_embed_runs_batches_concurrently_in_order() -> None:
+    """Test batches overlap but embeddings come back in input order."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_embed(texts: list[str], **kwargs) -> SimpleNamespace:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(
+            embeddings=SimpleNamespace(float_=[[float(t)] for t in texts])
+        )
+
+    service = EmbeddingService()
+    service._client = MagicMock()
+    service._client.embed = fake_embed
+
+    texts = [str(i) for i in range(MAX_BATCH_SIZE * 3 + 5)]
+    embeddings = await service.embed(texts)
+
+    assert embeddings == [[float(t)] for t in texts]
+    assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_embed_retries_rate_limited_batches(monkeypatch) -> None:
+    """Test that a 429 from Cohere is retried after a backoff."""
+    attempts = 0
+
+    async def fake_embed(texts: list[str], **kwargs) -> SimpleNamespace:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise cohere.TooManyRequestsError(body=None)
+        return SimpleNamespace(embeddings=SimpleNamespace(float_=[[1.0] for _ in texts]))
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(embedding_service_module.asyncio, "sleep", fake_sleep)
+
+    service = EmbeddingService()
+    service._client = MagicMock()
+    service._client.embed = fake_embed
+
+    assert await service.embed(["peace"]) == [[1.0]]
+    assert attempts == 2
+    assert len(sleeps) == 1 and 1.0 <= sleeps[0] < 2.0
+
+
+@pytest.mark.asyncio
+async def test_embed_retry_honors_retry_after(monkeypatch) -> None:
+    """Test that Cohere's Retry-After header sets the backoff."""
+    attempts = 0
+
+    async def fake_embed(texts: list[str], **kwargs) -> SimpleNamespace:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise cohere.TooManyRequestsError(body=None, headers={"Retry-After": "3"})
+        return SimpleNamespace(embeddings=SimpleNamespace(float_=[[1.0] for _ in texts]))
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(embedding_service_module.asyncio, "sleep", fake_sleep)
+
+    service = EmbeddingService()
+    service._client = MagicMock()
+    service._client.embed = fake_embed
+
+    assert await service.embed(["peace"]) == [[1.0]]
+    assert sleeps == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill(monkeypatch) -> None:
+    """Test that spending past the budget waits for tokens to refill."""
+    now = 100.0
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        nonlocal now
+        sleeps.append(seconds)
+        now += seconds
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now)
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+
+    bucket = rate_limit.TokenBucket(tokens_per_minute=600)
+    await bucket.acquire(600)
+    await bucket.acquire(30)
+
+    assert sleeps == [pytest.approx(3.0)]
@@ -0,0 +1,22 @@
+"""Tests for YouTube request pacing."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.youtube.pacing import RequestPacer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_the_delay(monkeypatch) -> None:
+    """Test concurrent workers are spaced apart instead of each pausing alone."""
+    monkeypatch.setattr(settings, "download_delay_seconds", 0.05)
+    pacer = RequestPacer()
+
+    started = time.monotonic()
+    await asyncio.gather(*(pacer.wait() for _ in range(3)))
+
+    # First request starts at once; the next two wait one delay each
+    assert time.monotonic() - started >= 0.1
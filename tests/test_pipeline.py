@@ -0,0 +1,81 @@
+"""Tests for the transcript embedding pipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.embeddings.pipeline import EmbeddingPipeline, point_id
+
+
+@pytest.mark.asyncio
+async def test_process_transcript_embeds_and_upserts_in_batches() -> None:
+    """Test every chunk is embedded and stored, batch by batch."""
+    text = " ".join(f"word{i}" for i in range(60_000))
+    transcript = {"video_id": "abcdefghijk", "text": text, "source": "whisper"}
+
+    async def fake_embed(texts: list[str], **kwargs) -> list[list[float]]:
+        return [[0.0, 1.0] for _ in texts]
+
+    repo = MagicMock()
+    repo.get_by_video_id = AsyncMock(return_value=transcript)
+
+    with (
+        patch("app.services.embeddings.pipeline.mongodb") as mongodb,
+        patch("app.services.embeddings.pipeline.TranscriptRepository", return_value=repo),
+        patch("app.services.embeddings.batching.embedding_service") as embedding_service,
+        patch.object(EmbeddingPipeline, "_upsert_points", new_callable=AsyncMock) as upsert,
+    ):
+        mongodb.is_connected = True
+        embedding_service.embed = AsyncMock(side_effect=fake_embed)
+
+        result = await EmbeddingPipeline().process_transcript("abcdefghijk")
+
+    assert result["status"] == "completed"
+    assert embedding_service.embed.await_count > 1
+    stored = sum(len(call.args[0]) for call in upsert.await_args_list)
+    assert stored == result["chunks"]
+
+
+@pytest.mark.asyncio
+async def test_process_all_transcripts_runs_concurrently() -> None:
+    """Test transcripts overlap and failures are counted, not raised."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_process(self: EmbeddingPipeline, video_id: str) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if video_id == "bad":
+            raise RuntimeError("boom")
+        return {"video_id": video_id, "status": "completed", "chunks": 2}
+
+    repo = MagicMock()
+    repo.list_all_video_ids = AsyncMock(return_value=["a", "b", "c", "bad"])
+
+    with (
+        patch("app.services.embeddings.pipeline.mongodb") as mongodb,
+        patch("app.services.embeddings.pipeline.qdrant"),
+        patch("app.services.embeddings.pipeline.TranscriptRepository", return_value=repo),
+        patch.object(EmbeddingPipeline, "process_transcript", fake_process),
+    ):
+        mongodb.is_connected = True
+        summary = await EmbeddingPipeline().process_all_transcripts()
+
+    assert summary["completed"] == 3
+    assert summary["failed"] == 1
+    assert summary["total_chunks"] == 6
+    assert peak > 1
+
+
+def test_point_ids_are_deterministic() -> None:
+    """Test chunk point IDs are stable, distinct and valid Qdrant IDs."""
+    ids = [point_id("abcdefghijk", i) for i in range(100)]
+
+    assert ids == [point_id("abcdefghijk", i) for i in range(100)]
+    assert len(set(ids)) == 100
+    assert point_id("bcdefghijkl", 0) != ids[0]
+    assert all(0 <= i < 2**63 for i in ids)
@@ -0,0 +1,35 @@
+"""Tests for LLM query expansion."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.search.query_expander import QueryExpander
+
+
+class FakeCompletions:
+    """Records chat completion requests and echoes the user message."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, messages: list[dict[str, str]], **kwargs) -> SimpleNamespace:
+        self.calls += 1
+        content = f"peace for {messages[-1]['content']}"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+@pytest.mark.asyncio
+async def test_expansions_are_cached_by_normalized_feeling() -> None:
+    """Test that repeated feelings skip the LLM call."""
+    completions = FakeCompletions()
+    expander = QueryExpander()
+    expander._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    first = await expander.expand("I'm anxious")
+    second = await expander.expand("  i'm   ANXIOUS ")
+
+    assert first == second == "peace for I'm anxious"
+    assert completions.calls == 1
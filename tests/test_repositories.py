@@ -1,48 +1,90 @@
 """Tests for database repositories."""
 
+from types import MappingProxyType
+from typing import Any, Final, Mapping
+
 import pytest
 
 from app.db.connection import Database
 from app.db.repositories.channel import ChannelRepository
 from app.db.repositories.ingestion import IngestionRepository
+from app.db.repositories.job import JobRepository
 from app.db.repositories.video import VideoRepository
+from tests.conftest import TEST_CHANNEL
+
+# Run on the session loop that owns the shared test database
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+CHANNEL_ID = TEST_CHANNEL["channel_id"]
+
+# Minimal video in the test channel, with every optional field empty
+VIDEO_STUB: Final[Mapping[str, Any]] = MappingProxyType({
+    "video_id": "abcdefghijk",
+    "channel_id": CHANNEL_ID,
+    "title": "Test Video",
+    "description": None,
+    "duration_seconds": None,
+    "published_at": None,
+    "thumbnail_url": None,
+    "view_count": None,
+})
 
 
-@pytest.mark.asyncio
 async def test_channel_create_and_get(test_db: Database) -> None:
     """Test creating and retrieving a channel."""
     repo = ChannelRepository(test_db.connection)
 
     # Create channel
-    channel_data = {
-        "channel_id": "UC123456789012345678901",
-        "channel_name": "Test Channel",
-        "channel_url": "https://www.youtube.com/@TestChannel",
-    }
-    await repo.create(channel_data)
+    await repo.create({**TEST_CHANNEL})
 
     # Retrieve channel
-    channel = await repo.get_by_channel_id("UC123456789012345678901")
+    channel = await repo.get_by_channel_id(CHANNEL_ID)
     assert channel is not None
     assert channel["channel_name"] == "Test Channel"
 
 
-@pytest.mark.asyncio
-async def test_video_create_and_get(test_db: Database) -> None:
+async def test_channel_update_last_sync(seeded_db: Database) -> None:
+    """Test that the last sync time is stamped by SQLite."""
+    repo = ChannelRepository(seeded_db.connection)
+
+    await repo.update_last_sync(CHANNEL_ID)
+
+    channel = await repo.get_by_channel_id(CHANNEL_ID)
+    assert channel is not None
+    assert channel["last_sync_at"].endswith("Z")
+
+
+async def test_channel_create_many(test_db: Database) -> None:
+    """Test batch-creating channels."""
+    repo = ChannelRepository(test_db.connection)
+
+    await repo.create_many([
+        {
+            "channel_id": CHANNEL_ID,
+            "channel_name": "First Channel",
+            "channel_url": "https://www.youtube.com/@FirstChannel",
+        },
+        {
+            "channel_id": "UC123456789012345678902",
+            "channel_name": "Second Channel",
+            "channel_url": "https://www.youtube.com/@SecondChannel",
+        },
+    ])
+
+    channels = await repo.list_active()
+    assert [c["channel_name"] for c in channels] == ["First Channel", "Second Channel"]
+    assert await repo.get_names() == {
+        CHANNEL_ID: "First Channel",
+        "UC123456789012345678902": "Second Channel",
+    }
+
+
+async def test_video_create_and_get(seeded_db: Database) -> None:
     """Test creating and retrieving a video."""
-    # First create a channel
-    channel_repo = ChannelRepository(test_db.connection)
-    await channel_repo.create({
-        "channel_id": "UC123456789012345678901",
-        "channel_name": "Test Channel",
-        "channel_url": "https://www.youtube.com/@TestChannel",
-    })
-
-    # Create video
-    video_repo = VideoRepository(test_db.connection)
+    video_repo = VideoRepository(seeded_db.connection)
     video_data = {
         "video_id": "abcdefghijk",
-        "channel_id": "UC123456789012345678901",
+        "channel_id": CHANNEL_ID,
         "title": "Test Video",
         "description": "A test video",
         "duration_seconds": 3600,
@@ -55,34 +97,17 @@ async def test_video_create_and_get(test_db: Database) -> None:
     # Retrieve video
     video = await video_repo.get_by_video_id("abcdefghijk")
     assert video is not None
-    assert video["title"] == "Test Video"
+    assert video.title == "Test Video"
 
 
-@pytest.mark.asyncio
-async def test_ingestion_status_workflow(test_db: Database) -> None:
+async def test_ingestion_status_workflow(seeded_db: Database) -> None:
     """Test the ingestion status workflow."""
-    # Create channel and video first
-    channel_repo = ChannelRepository(test_db.connection)
-    await channel_repo.create({
-        "channel_id": "UC123456789012345678901",
-        "channel_name": "Test Channel",
-        "channel_url": "https://www.youtube.com/@TestChannel",
-    })
-
-    video_repo = VideoRepository(test_db.connection)
-    await video_repo.create({
-        "video_id": "abcdefghijk",
-        "channel_id": "UC123456789012345678901",
-        "title": "Test Video",
-        "description": None,
-        "duration_seconds": None,
-        "published_at": None,
-        "thumbnail_url": None,
-        "view_count": None,
-    })
+    # Create the video first
+    video_repo = VideoRepository(seeded_db.connection)
+    await video_repo.create({**VIDEO_STUB})
 
     # Test ingestion workflow
-    ingestion_repo = IngestionRepository(test_db.connection)
+    ingestion_repo = IngestionRepository(seeded_db.connection)
 
     # Create status
     await ingestion_repo.create("abcdefghijk")
@@ -90,64 +115,176 @@ async def test_ingestion_status_workflow(test_db: Database) -> None:
     assert status is not None
     assert status["status"] == "pending"
 
-    # Update to downloading
-    await ingestion_repo.set_downloading("abcdefghijk")
-    status = await ingestion_repo.get_by_video_id("abcdefghijk")
+    # Updates return the updated record
+    status = await ingestion_repo.set_downloading("abcdefghijk")
+    assert status is not None
     assert status["status"] == "downloading"
 
     # Update to downloaded
-    await ingestion_repo.set_downloaded(
+    status = await ingestion_repo.set_downloaded(
         "abcdefghijk",
         audio_path="/data/audio/abcdefghijk.mp3",
         audio_format="mp3",
         audio_size_bytes=1024000,
     )
-    status = await ingestion_repo.get_by_video_id("abcdefghijk")
+    assert status is not None
     assert status["status"] == "downloaded"
     assert status["audio_path"] == "/data/audio/abcdefghijk.mp3"
 
     # Update to completed
-    await ingestion_repo.set_completed(
+    status = await ingestion_repo.set_completed(
         "abcdefghijk",
         transcript_path="/data/transcripts/abcdefghijk.json",
         transcript_text="This is a test transcript.",
     )
-    status = await ingestion_repo.get_by_video_id("abcdefghijk")
+    assert status is not None
     assert status["status"] == "completed"
     assert "test transcript" in status["transcript_text"]
 
 
-@pytest.mark.asyncio
-async def test_ingestion_stats(test_db: Database) -> None:
+async def test_ingestion_stats(seeded_db: Database) -> None:
     """Test getting ingestion statistics."""
-    ingestion_repo = IngestionRepository(test_db.connection)
+    ingestion_repo = IngestionRepository(seeded_db.connection)
 
     # Initially empty
     stats = await ingestion_repo.get_stats()
     assert stats == {}
 
-    # Create channel and video
-    channel_repo = ChannelRepository(test_db.connection)
-    await channel_repo.create({
-        "channel_id": "UC123456789012345678901",
-        "channel_name": "Test Channel",
-        "channel_url": "https://www.youtube.com/@TestChannel",
-    })
-
-    video_repo = VideoRepository(test_db.connection)
-    for i in range(3):
-        await video_repo.create({
-            "video_id": f"video{i}",
-            "channel_id": "UC123456789012345678901",
-            "title": f"Video {i}",
-            "description": None,
-            "duration_seconds": None,
-            "published_at": None,
-            "thumbnail_url": None,
-            "view_count": None,
-        })
-        await ingestion_repo.create(f"video{i}")
+    video_repo = VideoRepository(seeded_db.connection)
+    await video_repo.bulk_upsert([
+        {"video_id": f"video{i}", "channel_id": CHANNEL_ID, "title": f"Video {i}"}
+        for i in range(3)
+    ])
+    await ingestion_repo.create_many([f"video{i}" for i in range(3)])
 
     # Check stats
     stats = await ingestion_repo.get_stats()
     assert stats.get("pending", 0) == 3
+
+
+async def test_job_enqueue_claim_and_complete(test_db: Database) -> None:
+    """Test the ingestion job queue lifecycle."""
+    repo = JobRepository(test_db.connection)
+
+    job_id = await repo.enqueue("sync_channel", {"channel_url": "https://www.youtube.com/@TestChannel"})
+
+    job = await repo.claim_next()
+    assert job is not None
+    assert job["id"] == job_id
+    assert job["status"] == "running"
+    assert job["payload"] == {"channel_url": "https://www.youtube.com/@TestChannel"}
+
+    # Nothing left to claim
+    assert await repo.claim_next() is None
+
+    await repo.complete(job_id, {"videos_transcribed": 2})
+    job = await repo.get(job_id)
+    assert job is not None
+    assert job["status"] == "completed"
+    assert job["result"] == {"videos_transcribed": 2}
+    assert job["completed_at"].endswith("Z")
+
+
+async def test_job_claim_reclaims_stale_running_job(test_db: Database) -> None:
+    """Test that a job left running past the claim timeout is claimed again."""
+    repo = JobRepository(test_db.connection)
+
+    job_id = await repo.enqueue("retry_failed", {"max_retries": 3})
+    assert await repo.claim_next() is not None
+
+    # Simulate a worker that crashed long ago
+    test_db.connection.execute(
+        "UPDATE ingestion_jobs SET started_at = '2000-01-01T00:00:00.000Z' WHERE id = ?",
+        (job_id,),
+    )
+    test_db.connection.commit()
+
+    job = await repo.claim_next()
+    assert job is not None
+    assert job["id"] == job_id
+    assert job["started_at"] > "2000-01-01T00:00:00.000Z"
+    assert await repo.claim_next() is None
+
+
+async def test_video_bulk_upsert(seeded_db: Database) -> None:
+    """Test bulk-upserting videos and seeding their ingestion rows."""
+    video_repo = VideoRepository(seeded_db.connection)
+    rows = [
+        {"video_id": "abcdefghijk", "channel_id": CHANNEL_ID, "title": "First"},
+        {"video_id": "bcdefghijkl", "channel_id": CHANNEL_ID, "title": "Second"},
+    ]
+    await video_repo.bulk_upsert(rows)
+    await video_repo.bulk_upsert([{**rows[0], "title": "First (updated)"}])
+
+    assert await video_repo.count_by_channel(CHANNEL_ID) == 2
+    video = await video_repo.get_by_video_id("abcdefghijk")
+    assert video is not None
+    assert video.title == "First (updated)"
+
+    videos = await video_repo.get_many_by_video_ids(["abcdefghijk", "bcdefghijkl", "missing0000"])
+    assert set(videos) == {"abcdefghijk", "bcdefghijkl"}
+    assert await video_repo.get_ids_in(["abcdefghijk", "missing0000"]) == {"abcdefghijk"}
+
+    ingestion_repo = IngestionRepository(seeded_db.connection)
+    await ingestion_repo.create_many(["abcdefghijk", "bcdefghijkl"])
+    assert await ingestion_repo.count_by_status("pending") == 2
+    assert await ingestion_repo.get_statuses_in(["abcdefghijk", "missing0000"]) == {
+        "abcdefghijk": "pending"
+    }
+
+
+async def test_ingestion_status_transitions(seeded_db: Database) -> None:
+    """Test that status transitions stamp their timestamp columns."""
+    video_repo = VideoRepository(seeded_db.connection)
+    await video_repo.create({**VIDEO_STUB})
+
+    repo = IngestionRepository(seeded_db.connection)
+    await repo.create("abcdefghijk")
+    status = await repo.set_downloaded("abcdefghijk", "data/audio/abcdefghijk.mp3", "mp3", 1024)
+    assert status is not None
+    assert status["status"] == "downloaded"
+    assert status["audio_size_bytes"] == 1024
+    assert status["download_completed_at"] == status["updated_at"]
+
+    # Counts follow status transitions
+    assert await repo.get_stats() == {"downloaded": 1}
+    await repo.set_failed("abcdefghijk", "boom")
+    assert await repo.count_by_status("downloaded") == 0
+    assert await repo.count_by_status("failed") == 1
+
+
+async def test_reads_through_pool(seeded_db: Database) -> None:
+    """Test repository reads served by the pool see committed writes."""
+    channel_repo = ChannelRepository(seeded_db.connection, reader=seeded_db)
+    channel = await channel_repo.get_by_channel_id(CHANNEL_ID)
+    assert channel is not None
+    assert channel["channel_name"] == "Test Channel"
+
+    video_repo = VideoRepository(seeded_db.connection, reader=seeded_db)
+    await video_repo.bulk_upsert([
+        {"video_id": "abcdefghijk", "channel_id": CHANNEL_ID, "title": "First"},
+    ])
+    assert await video_repo.exists("abcdefghijk")
+    video = await video_repo.get_by_video_id("abcdefghijk")
+    assert video is not None
+    assert video.to_dict()["title"] == "First"
+    assert await video_repo.count_by_channel(CHANNEL_ID) == 1
+
+    ingestion_repo = IngestionRepository(seeded_db.connection, reader=seeded_db)
+    await ingestion_repo.create_many(["abcdefghijk"])
+    assert await ingestion_repo.get_stats() == {"pending": 1}
+
+
+async def test_video_bulk_upsert_rolls_back_on_bad_row(seeded_db: Database) -> None:
+    """Test a failing batch leaves none of its rows behind."""
+    video_repo = VideoRepository(seeded_db.connection)
+
+    with pytest.raises(Exception):
+        await video_repo.bulk_upsert([
+            {"video_id": "abcdefghijk", "channel_id": CHANNEL_ID, "title": "Good"},
+            {"video_id": "bcdefghijkl", "channel_id": "UCmissing", "title": "Bad"},
+        ])
+
+    # Later commits on the connection don't pick up the earlier row
+    await video_repo.upsert({**VIDEO_STUB, "video_id": "cdefghijklm"})
+    assert not await video_repo.exists("abcdefghijk")
@@ -0,0 +1,43 @@
+"""Tests for the sermon search service."""
+
+import importlib
+
+import pytest
+
+from app.core.config import settings
+from app.services.search.sermon_search import MOOD_PROMPTS, SermonSearchService
+
+# The package re-exports the service instance under the module's name
+search_module = importlib.import_module("app.services.search.sermon_search")
+
+
+@pytest.mark.asyncio
+async def test_warmed_mood_queries_survive_restart(monkeypatch, tmp_path) -> None:
+    """Test that saved mood queries are reused instead of re-expanded."""
+    expansions: list[str] = []
+
+    async def expand(feeling: str) -> str:
+        expansions.append(feeling)
+        return f"hope for {feeling}"
+
+    async def embed(texts: list[str], input_type: str) -> list[list[float]]:
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(settings, "mood_queries_cache_path", str(tmp_path / "moods.json"))
+    monkeypatch.setattr(search_module.query_expander, "expand", expand)
+    monkeypatch.setattr(search_module.embedding_service, "embed", embed)
+
+    first = SermonSearchService()
+    await first.warm_mood_queries()
+    assert len(expansions) == len(MOOD_PROMPTS)
+
+    second = SermonSearchService()
+    await second.warm_mood_queries()
+    assert len(expansions) == len(MOOD_PROMPTS)
+    assert second._mood_queries == first._mood_queries
+
+    # A different embedding model invalidates the saved queries
+    monkeypatch.setattr(settings, "embedding_model", "other-model")
+    third = SermonSearchService()
+    await third.warm_mood_queries()
+    assert len(expansions) == 2 * len(MOOD_PROMPTS)
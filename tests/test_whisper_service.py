@@ -0,0 +1,37 @@
+"""Tests for Whisper transcription batching."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.services.transcription import whisper_service
+from app.services.transcription.exceptions import AudioFileNotFoundError
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transcriptions_share_one_batch(monkeypatch) -> None:
+    """Test that requests arriving together go to the model as one batch."""
+    calls: list[list[tuple[str, str]]] = []
+
+    def transcribe_batch_sync(items: list[tuple[str, str]]) -> list[Any]:
+        calls.append(items)
+        return [
+            AudioFileNotFoundError(audio_path) if video_id == "missing"
+            else {"video_id": video_id, "text": audio_path}
+            for audio_path, video_id in items
+        ]
+
+    monkeypatch.setattr(whisper_service, "_transcribe_batch_sync", transcribe_batch_sync)
+
+    results = await asyncio.gather(
+        whisper_service.transcribe("a.mp3", "first"),
+        whisper_service.transcribe("b.mp3", "second"),
+        whisper_service.transcribe("c.mp3", "missing"),
+        return_exceptions=True,
+    )
+
+    assert calls == [[("a.mp3", "first"), ("b.mp3", "second"), ("c.mp3", "missing")]]
+    assert results[0] == {"video_id": "first", "text": "a.mp3"}
+    assert results[1] == {"video_id": "second", "text": "b.mp3"}
+    assert isinstance(results[2], AudioFileNotFoundError)